@@ -0,0 +1,33 @@
+"""add_books_fts_index
+
+Revision ID: a3c9e1f47b20
+Revises: 5550fa064b86
+Create Date: 2026-10-16 09:12:31.402117
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from libapp.persistence.fts import drop_book_fts, ensure_book_fts
+
+# revision identifiers, used by Alembic.
+revision: str = "a3c9e1f47b20"
+down_revision: str | None = "5550fa064b86"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """
+    Crée la table virtuelle FTS5 books_fts et ses triggers de synchronisation,
+    puis indexe les livres existants.
+    """
+    ensure_book_fts(op.get_bind())
+
+
+def downgrade() -> None:
+    """
+    Supprime l'index plein texte et ses triggers.
+    """
+    drop_book_fts(op.get_bind())
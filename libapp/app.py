@@ -24,10 +24,12 @@ from PySide6.QtWidgets import (
 )
 
 from ._version import __version__
-from .persistence.database import ensure_tables, get_session
+from .persistence.database import configure_sqlite_profile, ensure_tables, get_session
 from .persistence.models_sa import Book, Member
+from .services.audit_service import shutdown_audit_writer
 from .services.enhanced_logging_config import setup_app_logging
 from .services.preferences import load_preferences, save_preferences
+from .services.stall_watchdog import get_stall_watchdog
 from .services.translation_service import set_language, translate
 from .utils.icon_helper import app_icon, toolbar_icon
 from .views.about_dialog import AboutDialog
@@ -44,6 +46,7 @@ from .views.member_details_panel import MemberDetailsPanel
 from .views.member_editor import MemberEditor
 from .views.member_list import MemberListView
 from .views.preferences_dialog import PreferencesDialog
+from .views.stall_report_dialog import StallReportDialog
 
 setup_app_logging(console_output=True)
 
@@ -77,6 +80,9 @@ class MainWindow(QMainWindow):
         self._restore_state()
         self._check_overdue_on_startup()
 
+        # Surveillance des blocages de la boucle d'événements (rapports : menu Aide)
+        get_stall_watchdog().attach(self)
+
     def _check_overdue_on_startup(self):
         """
         Vérifie les prêts en retard au démarrage et affiche une alerte si activé.
@@ -242,6 +248,10 @@ class MainWindow(QMainWindow):
         )
         self.act_docs.triggered.connect(self.online_help)
 
+        # Blocages de l'interface
+        self.act_stall_report = QAction(translate("menu.help_stalls"), self)
+        self.act_stall_report.triggered.connect(self.show_stall_report)
+
         # Vues (Dashboard, Books, Members, Loans, Split)
         self.act_show_dashboard = QAction(
             toolbar_icon("chart-pie"),  # 🎯 ICÔNE
@@ -350,6 +360,7 @@ class MainWindow(QMainWindow):
         menu_view.addAction(self.act_show_split)
         menu_help = menu_bar.addMenu(translate("menu.help"))
         menu_help.addAction(self.act_docs)
+        menu_help.addAction(self.act_stall_report)
         menu_help.addAction(self.act_about)
 
     def _create_toolbars(self):
@@ -594,6 +605,7 @@ class MainWindow(QMainWindow):
             if dlg.result:  # ← Check result exists
                 self.prefs = dlg.result  # ← Fix attribute name
                 save_preferences(self.prefs)
+                _apply_db_profile(self.prefs)
 
                 # Appliquer le thème immédiatement
                 self.apply_theme(self.prefs.theme)
@@ -666,6 +678,10 @@ class MainWindow(QMainWindow):
             logger.error(f"[closeEvent] Erreur sauvegarde: {e}")
             # Continuer même si erreur
 
+        # 4. Écrire les entrées d'audit encore en file
+        shutdown_audit_writer()
+        get_stall_watchdog().stop()
+
         # Fermer l'application
         super().closeEvent(event)
 
@@ -675,6 +691,12 @@ class MainWindow(QMainWindow):
         dlg = AboutDialog(self)
         dlg.exec()
 
+    @Slot()
+    def show_stall_report(self):
+        """Affiche les blocages de l'interface détectés depuis le démarrage."""
+        dlg = StallReportDialog(parent=self)
+        dlg.exec()
+
     def _reload_icons(self):
         """Recharge toutes les icônes avec la couleur du thème actuel."""
         from .utils.icon_helper import app_icon
@@ -857,8 +879,9 @@ class MainWindow(QMainWindow):
         proxy_index = selected_rows[0]
         source_index = self.book_list_view.proxy_model.mapToSource(proxy_index)
 
-        # Récupérer le livre
-        book = self.book_list_view.table_model.get_book_by_row(source_index.row())
+        # Récupérer le livre complet (résumé non tronqué)
+        row = self.book_list_view.table_model.get_book_by_row(source_index.row())
+        book = self.book_list_view.table_model.load_book(row.id) if row else None
 
         if book:
             self.book_details_panel.update_from_book(book)
@@ -877,8 +900,9 @@ class MainWindow(QMainWindow):
         proxy_index = selected_rows[0]
         source_index = self.member_list_view.proxy_model.mapToSource(proxy_index)
 
-        # Récupérer le membre
-        member = self.member_list_view.table_model.get_member_by_row(source_index.row())
+        # Récupérer le membre complet
+        row = self.member_list_view.table_model.get_member_by_row(source_index.row())
+        member = self.member_list_view.table_model.load_member(row.id) if row else None
 
         if member:
             self.member_details_panel.update_from_member(member)
@@ -899,8 +923,9 @@ class MainWindow(QMainWindow):
         proxy_index = selected_rows[0]
         source_index = self.book_list_split.proxy_model.mapToSource(proxy_index)
 
-        # Récupérer le livre
-        book = self.book_list_split.table_model.get_book_by_row(source_index.row())
+        # Récupérer le livre complet (résumé non tronqué)
+        row = self.book_list_split.table_model.get_book_by_row(source_index.row())
+        book = self.book_list_split.table_model.load_book(row.id) if row else None
 
         if book:
             self.book_details_panel.update_from_book(book)
@@ -921,17 +946,31 @@ class MainWindow(QMainWindow):
         proxy_index = selected_rows[0]
         source_index = self.member_list_split.proxy_model.mapToSource(proxy_index)
 
-        # Récupérer le membre
-        member = self.member_list_split.table_model.get_member_by_row(source_index.row())
+        # Récupérer le membre complet
+        row = self.member_list_split.table_model.get_member_by_row(source_index.row())
+        member = self.member_list_split.table_model.load_member(row.id) if row else None
 
         if member:
             self.member_details_panel.update_from_member(member)
 
 
+def _apply_db_profile(prefs) -> None:
+    """Applique le profil de performance SQLite choisi dans les préférences."""
+    try:
+        configure_sqlite_profile(
+            prefs.db_performance_profile,
+            cache_size_mb=prefs.db_cache_size_mb,
+            mmap_size_mb=prefs.db_mmap_size_mb,
+        )
+    except Exception as e:
+        logger.error(f"❌ Erreur application du profil SQLite : {e}")
+
+
 def main():
     """Point d'entrée de l'application."""
     QCoreApplication.setOrganizationName("6f4")
     QCoreApplication.setApplicationName("Aurora")
+    _apply_db_profile(load_preferences())
     ensure_tables()
 
     app = QApplication(sys.argv)
@@ -7,23 +7,159 @@ des tables et peupler la base avec des données de démonstration.
 
 Fonctions principales :
 - get_session(): Retourne une session SQLAlchemy pour les opérations.
-- ensure_tables(): Crée toutes les tables à partir des modèles si elles n'existent pas.
+- ensure_tables(): Crée toutes les tables à partir des modèles si elles n'existent pas
+  (ainsi que l'index plein texte FTS5 des livres).
+- configure_sqlite_profile(): Sélectionne le profil de performance SQLite
+  (PRAGMA appliqués à chaque nouvelle connexion).
+
+Chaque instruction est chronométrée par le profileur SQL partagé
+(voir `sql_profiler`).
 """
 
 from __future__ import annotations
 
-from sqlalchemy import create_engine, text
+import logging
+import os
+from dataclasses import dataclass, replace
+
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 
 from libapp.utils.paths import db_path
 
 from .base import Base
+from .sql_profiler import install_sql_profiler
+
+logger = logging.getLogger(__name__)
+
+
+# --- Profils de performance SQLite ---
+@dataclass(frozen=True, slots=True)
+class SqliteProfile:
+    """Ensemble de PRAGMA appliqués à chaque connexion SQLite.
+
+    Attributes:
+        name: Nom du profil (clé de `SQLITE_PROFILES`).
+        journal_mode: Mode de journalisation (`WAL`, `DELETE`, ...).
+        synchronous: Niveau de synchronisation disque (`NORMAL`, `FULL`, ...).
+        cache_size_mb: Taille du cache de pages en Mo (0 = défaut SQLite).
+        mmap_size_mb: Taille de la projection mémoire en Mo (0 = désactivée).
+        temp_store: Emplacement des tables temporaires (`MEMORY`, `DEFAULT`).
+        busy_timeout_ms: Attente maximale sur un verrou avant `database is locked`.
+    """
+
+    name: str
+    journal_mode: str = "DELETE"
+    synchronous: str = "FULL"
+    cache_size_mb: int = 0
+    mmap_size_mb: int = 0
+    temp_store: str = "DEFAULT"
+    busy_timeout_ms: int = 5000
+
+    def pragmas(self) -> list[str]:
+        """Retourne les instructions PRAGMA correspondant au profil."""
+        statements = [
+            f"PRAGMA journal_mode={self.journal_mode}",
+            f"PRAGMA synchronous={self.synchronous}",
+            f"PRAGMA temp_store={self.temp_store}",
+            f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}",
+        ]
+        if self.cache_size_mb > 0:
+            # Valeur négative = taille en KiB (indépendante de la taille de page)
+            statements.append(f"PRAGMA cache_size=-{int(self.cache_size_mb) * 1024}")
+        statements.append(f"PRAGMA mmap_size={int(self.mmap_size_mb) * 1024 * 1024}")
+        return statements
+
+
+# 🎯 "standard" = comportement SQLite d'origine (sûr sur partage réseau, où WAL
+# n'est pas supporté). "performance" = WAL : les lectures (rafraîchissement des
+# listes) ne sont plus bloquées par les écritures (prêts, audit).
+SQLITE_PROFILES: dict[str, SqliteProfile] = {
+    "standard": SqliteProfile(name="standard"),
+    "performance": SqliteProfile(
+        name="performance",
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        cache_size_mb=64,
+        mmap_size_mb=256,
+        temp_store="MEMORY",
+        busy_timeout_ms=5000,
+    ),
+}
+DEFAULT_SQLITE_PROFILE = "performance"
+
+_active_profile: SqliteProfile = SQLITE_PROFILES[DEFAULT_SQLITE_PROFILE]
+
 
 # --- Configuration du moteur et de la session SQLAlchemy ---
-# La base de données est stockée dans le dossier de données de l'application.
-DATABASE_URL = f"sqlite:///{db_path().as_posix()}"
+# La base de données est stockée dans le dossier de données de l'application,
+# sauf si la variable d'environnement DATABASE_URL est définie (tests, alembic).
+DATABASE_URL = os.environ.get("DATABASE_URL") or f"sqlite:///{db_path().as_posix()}"
 engine = create_engine(DATABASE_URL, echo=False, future=True)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+# Chronométrage de chaque instruction (agrégats + journal des requêtes lentes)
+install_sql_profiler(engine)
+
+
+@event.listens_for(engine, "connect")
+def _apply_sqlite_profile(dbapi_connection, _connection_record):
+    """Applique les PRAGMA du profil actif à chaque nouvelle connexion DBAPI."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for statement in _active_profile.pragmas():
+            cursor.execute(statement)
+    finally:
+        cursor.close()
+
+
+def configure_sqlite_profile(
+    name: str,
+    *,
+    cache_size_mb: int | None = None,
+    mmap_size_mb: int | None = None,
+) -> SqliteProfile:
+    """
+    Sélectionne le profil de performance SQLite utilisé par le moteur.
+
+    Les connexions déjà ouvertes dans le pool sont fermées afin que les
+    nouvelles connexions reçoivent immédiatement les nouveaux PRAGMA.
+
+    Args:
+        name: Nom du profil (`standard` ou `performance`). Un nom inconnu
+            retombe sur le profil par défaut.
+        cache_size_mb: Surcharge optionnelle de la taille du cache de pages.
+        mmap_size_mb: Surcharge optionnelle de la taille mmap.
+
+    Returns:
+        SqliteProfile: Le profil effectivement appliqué.
+    """
+    global _active_profile
+
+    profile = SQLITE_PROFILES.get(name)
+    if profile is None:
+        logger.warning(
+            f"⚠️ Profil SQLite inconnu '{name}', utilisation de '{DEFAULT_SQLITE_PROFILE}'"
+        )
+        profile = SQLITE_PROFILES[DEFAULT_SQLITE_PROFILE]
+
+    overrides = {}
+    if cache_size_mb is not None:
+        overrides["cache_size_mb"] = max(0, int(cache_size_mb))
+    if mmap_size_mb is not None:
+        overrides["mmap_size_mb"] = max(0, int(mmap_size_mb))
+    if overrides:
+        profile = replace(profile, **overrides)
+
+    if profile != _active_profile:
+        _active_profile = profile
+        engine.dispose()
+        logger.info(f"🗄️ Profil SQLite '{profile.name}' appliqué")
+    return profile
+
+
+def current_sqlite_profile() -> SqliteProfile:
+    """Retourne le profil SQLite actuellement appliqué aux nouvelles connexions."""
+    return _active_profile
 
 
 def get_session():
@@ -53,6 +189,11 @@ def ensure_tables():
     # 2. Créer les tables manquantes
     Base.metadata.create_all(bind=engine)
 
+    # 3. Index plein texte FTS5 (table virtuelle + triggers de synchronisation)
+    from .fts import ensure_book_fts
+
+    ensure_book_fts(engine)
+
 
 def _init_db():
     """
@@ -0,0 +1,179 @@
+"""
+Index plein texte FTS5 du catalogue.
+
+Ce module définit la table virtuelle `books_fts` (contenu externe adossé à
+`books`) ainsi que les triggers qui la maintiennent synchronisée à chaque
+INSERT / UPDATE / DELETE, y compris pour les insertions en masse faites
+hors ORM.
+
+Fonctions principales :
+- ensure_book_fts(): Crée la table et les triggers s'ils n'existent pas,
+  puis indexe les livres déjà présents.
+- rebuild_book_fts(): Reconstruit entièrement l'index.
+- fts_available(): Indique si la build SQLite embarque FTS5.
+- fts_rowids(): Sous-requête des identifiants de livres correspondant à une
+  requête MATCH (à combiner avec `Book.id.in_(...)`).
+- fts_ranked(): Sous-requête (rowid, score) classée par bm25 pondéré (`FTS_WEIGHTS`).
+"""
+
+from __future__ import annotations
+
+import logging
+
+from sqlalchemy import Select, literal_column, select, table, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "books_fts"
+
+# Colonnes indexées (même ordre que les poids de classement bm25)
+FTS_COLUMNS: tuple[str, ...] = (
+    "title",
+    "subtitle",
+    "authors_text",
+    "mots_cles",
+    "summary",
+    "collection",
+    "isbn",
+)
+
+# Poids bm25 : un mot trouvé dans le titre ou l'auteur pèse plus que dans le résumé
+FTS_WEIGHTS: tuple[float, ...] = (10.0, 4.0, 8.0, 3.0, 1.0, 2.0, 6.0)
+
+_COLS = ", ".join(FTS_COLUMNS)
+_NEW_COLS = ", ".join(f"new.{c}" for c in FTS_COLUMNS)
+_OLD_COLS = ", ".join(f"old.{c}" for c in FTS_COLUMNS)
+
+CREATE_FTS_TABLE = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    f"{_COLS}, content='books', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+)
+
+CREATE_FTS_TRIGGERS: tuple[str, ...] = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON books BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, {_COLS}) VALUES (new.id, {_NEW_COLS});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON books BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_COLS})
+        VALUES ('delete', old.id, {_OLD_COLS});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON books BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {_COLS})
+        VALUES ('delete', old.id, {_OLD_COLS});
+        INSERT INTO {FTS_TABLE}(rowid, {_COLS}) VALUES (new.id, {_NEW_COLS});
+    END
+    """,
+)
+
+DROP_FTS_STATEMENTS: tuple[str, ...] = (
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+)
+
+REBUILD_FTS = f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"
+
+
+def _fts_table_exists(conn: Connection) -> bool:
+    row = conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": FTS_TABLE},
+    ).first()
+    return row is not None
+
+
+def fts_available(conn: Connection) -> bool:
+    """Indique si le moteur SQLite courant supporte FTS5."""
+    try:
+        options = conn.execute(text("PRAGMA compile_options")).scalars().all()
+    except OperationalError:
+        return False
+    return any(opt == "ENABLE_FTS5" for opt in options) or _fts_table_exists(conn)
+
+
+def ensure_book_fts(bind: Engine | Connection) -> bool:
+    """
+    Crée l'index FTS5 et ses triggers s'ils n'existent pas encore.
+
+    Lors de la première création, les livres existants sont indexés
+    (`rebuild`). Sans support FTS5, l'application continue de fonctionner
+    avec le filtrage en mémoire.
+
+    Args:
+        bind: Moteur ou connexion SQLAlchemy.
+
+    Returns:
+        bool: True si l'index est disponible.
+    """
+    if isinstance(bind, Engine):
+        with bind.begin() as conn:
+            return ensure_book_fts(conn)
+
+    conn = bind
+    if not fts_available(conn):
+        logger.warning("⚠️ SQLite sans FTS5 : recherche plein texte désactivée")
+        return False
+
+    try:
+        created = not _fts_table_exists(conn)
+        conn.execute(text(CREATE_FTS_TABLE))
+        for statement in CREATE_FTS_TRIGGERS:
+            conn.execute(text(statement))
+        if created:
+            conn.execute(text(REBUILD_FTS))
+            logger.info("🔎 Index plein texte des livres créé")
+        return True
+    except OperationalError as e:
+        logger.error(f"❌ Création de l'index plein texte impossible : {e}")
+        return False
+
+
+def rebuild_book_fts(bind: Engine | Connection) -> None:
+    """Reconstruit entièrement l'index plein texte à partir de la table `books`."""
+    if isinstance(bind, Engine):
+        with bind.begin() as conn:
+            rebuild_book_fts(conn)
+        return
+    bind.execute(text(REBUILD_FTS))
+
+
+def fts_rowids(match: str) -> Select:
+    """Retourne `SELECT rowid FROM books_fts WHERE books_fts MATCH :match`."""
+    return (
+        select(literal_column("rowid"))
+        .select_from(table(FTS_TABLE))
+        .where(text(f"{FTS_TABLE} MATCH :fts_match").bindparams(fts_match=match))
+    )
+
+
+def fts_ranked(match: str):
+    """Sous-requête `(rowid, score)` des livres correspondant à `match`.
+
+    `score` est le bm25 pondéré par `FTS_WEIGHTS` : plus il est bas,
+    plus le livre est pertinent (tri croissant = les plus pertinents d'abord).
+    """
+    weights = ", ".join(str(w) for w in FTS_WEIGHTS)
+    return (
+        select(
+            literal_column("rowid").label("rowid"),
+            literal_column(f"bm25({FTS_TABLE}, {weights})").label("score"),
+        )
+        .select_from(table(FTS_TABLE))
+        .where(text(f"{FTS_TABLE} MATCH :fts_match").bindparams(fts_match=match))
+        .subquery("fts_ranked")
+    )
+
+
+def drop_book_fts(bind: Connection) -> None:
+    """Supprime la table virtuelle et ses triggers (utilisé par alembic downgrade)."""
+    for statement in DROP_FTS_STATEMENTS:
+        bind.execute(text(statement))
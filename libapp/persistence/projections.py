@@ -0,0 +1,103 @@
+"""
+Projections légères utilisées par les vues en liste.
+
+Les tables Qt n'affichent qu'une poignée de colonnes : plutôt que de
+matérialiser des objets ORM complets (suivi d'identité, relations, colonne
+`summary` en Text...) puis de les détacher un par un, les repositories
+sélectionnent uniquement les colonnes affichées et les rangent dans ces
+dataclasses à slots. Les objets ORM complets sont relus à la demande
+(éditeur, panneau de détails).
+
+Classes :
+    - BookListRow: Ligne de la table des livres (résumé tronqué).
+    - MemberListRow: Ligne de la table des membres.
+    - LoanListRow: Ligne de la table des prêts (titre du livre et nom du membre joints).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+
+from .models_sa import LoanStatus
+
+# Longueur du résumé lu pour l'affichage en liste (un caractère de plus que
+# l'aperçu affiché, pour savoir s'il faut ajouter "...")
+SUMMARY_PREVIEW_CHARS = 51
+
+
+@dataclass(frozen=True, slots=True)
+class BookListRow:
+    """Ligne de la table des livres.
+
+    Les noms des champs sont ceux des colonnes de `books`, ce qui permet de
+    réutiliser `BOOK_SORT_COLUMNS` pour calculer les curseurs de pagination.
+    """
+
+    id: int
+    title: str
+    code_interne: str | None
+    volume: int | None
+    authors_text: str | None
+    year: str | None
+    isbn: str | None
+    publisher: str | None
+    collection: str | None
+    copies_available: int | None
+    copies_total: int | None
+    cover_image: str | None
+    summary: str | None  # Tronqué à SUMMARY_PREVIEW_CHARS sauf demande contraire
+    score: float | None = None  # Score bm25 (tri par pertinence uniquement)
+
+    # --- Alias identiques à ceux du modèle Book ---
+
+    @property
+    def code(self) -> str | None:
+        """Alias pour `code_interne`."""
+        return self.code_interne
+
+    @property
+    def author(self) -> str | None:
+        """Alias pour `authors_text`."""
+        return self.authors_text
+
+    @property
+    def fund(self) -> str | None:
+        """Alias pour `collection`."""
+        return self.collection
+
+
+@dataclass(frozen=True, slots=True)
+class MemberListRow:
+    """Ligne de la table des membres."""
+
+    id: int
+    member_no: str | None
+    last_name: str | None
+    first_name: str | None
+    email: str | None
+    phone: str | None
+    is_active: bool
+
+
+@dataclass(frozen=True, slots=True)
+class LoanListRow:
+    """Ligne de la table des prêts, avec le titre du livre et le nom du membre."""
+
+    id: int
+    book_id: int
+    member_id: int
+    loan_date: date | None
+    due_date: date | None
+    return_date: date | None
+    status: LoanStatus | None
+    book_title: str | None
+    member_first_name: str | None
+    member_last_name: str | None
+
+    @property
+    def member_name(self) -> str:
+        """Prénom et nom du membre ("N/A" si le membre n'existe plus)."""
+        if self.member_first_name is None and self.member_last_name is None:
+            return "N/A"
+        return f"{self.member_first_name or ''} {self.member_last_name or ''}".strip()
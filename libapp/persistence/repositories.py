@@ -11,10 +11,50 @@ Chaque Repository est responsable des opérations CRUD pour son modèle.
 
 from __future__ import annotations
 
-from sqlalchemy import select
+from typing import Any
+
+from sqlalchemy import func, or_, select, tuple_
 from sqlalchemy.orm import Session
 
+from .fts import fts_ranked, fts_rowids
 from .models_sa import Book, Loan, LoanStatus, Member
+from .projections import SUMMARY_PREVIEW_CHARS, BookListRow, LoanListRow, MemberListRow
+
+# Colonnes triables côté SQL pour la pagination par clé (keyset).
+# Clé d'interface -> (colonne, valeur de remplacement des NULL). `None` signifie
+# que la colonne est NOT NULL et peut être utilisée telle quelle (index direct).
+BOOK_SORT_COLUMNS: dict[str, tuple[Any, Any]] = {
+    "id": (Book.id, None),
+    "title": (Book.title, None),
+    "code": (Book.code_interne, ""),
+    "volume": (Book.volume, 0),
+    "author": (Book.authors_text, ""),
+    "year": (Book.year, ""),
+    "isbn": (Book.isbn, ""),
+    "publisher": (Book.publisher, ""),
+    "fund": (Book.collection, ""),
+    "available": (Book.copies_available, 0),
+}
+
+# Tri par pertinence (score bm25 de l'index plein texte), seulement avec un filtre FTS5
+RELEVANCE_SORT_KEY = "relevance"
+
+# Colonnes lues pour une ligne de la liste des livres (ordre des champs de BookListRow,
+# le résumé est ajouté à part pour pouvoir être tronqué en SQL)
+BOOK_ROW_COLUMNS = (
+    Book.id,
+    Book.title,
+    Book.code_interne,
+    Book.volume,
+    Book.authors_text,
+    Book.year,
+    Book.isbn,
+    Book.publisher,
+    Book.collection,
+    Book.copies_available,
+    Book.copies_total,
+    Book.cover_image,
+)
 
 
 class BookRepository:
@@ -51,6 +91,96 @@ class BookRepository:
         """Supprime un livre de la session."""
         self.session.delete(book)
 
+    # --- Pagination par clé (keyset) ---
+
+    @staticmethod
+    def _sort_expr(sort_key: str):
+        column, default = BOOK_SORT_COLUMNS.get(sort_key, BOOK_SORT_COLUMNS["title"])
+        return column if default is None else func.coalesce(column, default)
+
+    @staticmethod
+    def sort_value(book: Book | BookListRow, sort_key: str):
+        """Valeur de tri d'un livre, telle que comparée par `page()`."""
+        score = getattr(book, "score", None)
+        if sort_key == RELEVANCE_SORT_KEY and score is not None:
+            return score
+        # Sans filtre FTS5, le tri par pertinence retombe sur le titre (voir `page()`)
+        column, default = BOOK_SORT_COLUMNS.get(sort_key, BOOK_SORT_COLUMNS["title"])
+        value = getattr(book, column.key)
+        return value if default is None or value is not None else default
+
+    @staticmethod
+    def _apply_search(stmt, fts_match: str | None, like: str | None):
+        if fts_match:
+            stmt = stmt.where(Book.id.in_(fts_rowids(fts_match)))
+        if like:
+            pattern = f"%{like}%"
+            stmt = stmt.where(
+                or_(
+                    Book.title.ilike(pattern),
+                    Book.authors_text.ilike(pattern),
+                    Book.isbn.ilike(pattern),
+                )
+            )
+        return stmt
+
+    def page(
+        self,
+        *,
+        sort_key: str = "title",
+        descending: bool = False,
+        after: tuple[Any, int] | None = None,
+        limit: int = 200,
+        fts_match: str | None = None,
+        like: str | None = None,
+        summary_chars: int | None = SUMMARY_PREVIEW_CHARS,
+    ) -> list[BookListRow]:
+        """
+        Retourne une page de lignes de livres triée, en pagination par clé (keyset).
+
+        Le curseur `after` est la paire (valeur de tri, id) du dernier livre de
+        la page précédente : le coût d'une page ne dépend pas de sa position
+        dans le catalogue (contrairement à OFFSET). Seules les colonnes
+        affichées sont lues (`BookListRow`), sans passer par l'ORM.
+
+        Args:
+            sort_key: Clé de `BOOK_SORT_COLUMNS` (titre par défaut), ou
+                `RELEVANCE_SORT_KEY` pour classer par score bm25 pondéré
+                (avec `fts_match` uniquement, les plus pertinents d'abord).
+            descending: Tri décroissant.
+            after: Curseur de fin de page précédente, None pour la première page.
+            limit: Taille de page.
+            fts_match: Requête MATCH FTS5 optionnelle (voir `search_index`).
+            like: Filtre sous-chaîne optionnel (repli sans FTS5).
+            summary_chars: Longueur du résumé lu, None pour le résumé complet (export).
+        """
+        summary = Book.summary
+        if summary_chars is not None:
+            summary = func.substr(Book.summary, 1, summary_chars)
+        if sort_key == RELEVANCE_SORT_KEY and fts_match:
+            ranked = fts_ranked(fts_match)
+            sort_expr = ranked.c.score
+            stmt = select(*BOOK_ROW_COLUMNS, summary, sort_expr).join(
+                ranked, ranked.c.rowid == Book.id
+            )
+            stmt = self._apply_search(stmt, None, like)
+        else:
+            sort_expr = self._sort_expr(sort_key)
+            stmt = self._apply_search(select(*BOOK_ROW_COLUMNS, summary), fts_match, like)
+        if after is not None:
+            cursor = tuple_(sort_expr, Book.id)
+            stmt = stmt.where(cursor < tuple_(*after) if descending else cursor > tuple_(*after))
+        if descending:
+            stmt = stmt.order_by(sort_expr.desc(), Book.id.desc())
+        else:
+            stmt = stmt.order_by(sort_expr, Book.id)
+        return [BookListRow(*row) for row in self.session.execute(stmt.limit(limit))]
+
+    def count(self, *, fts_match: str | None = None, like: str | None = None) -> int:
+        """Nombre de livres correspondant au filtre."""
+        stmt = self._apply_search(select(func.count(Book.id)), fts_match, like)
+        return self.session.execute(stmt).scalar_one()
+
 
 class MemberRepository:
     """Gestionnaire d'accès aux objets Member dans la base de données."""
@@ -81,6 +211,19 @@ class MemberRepository:
         """Supprime un membre de la session."""
         self.session.delete(member)
 
+    def list_rows(self) -> list[MemberListRow]:
+        """Retourne les lignes de la liste des membres, triées par nom."""
+        stmt = select(
+            Member.id,
+            Member.member_no,
+            Member.last_name,
+            Member.first_name,
+            Member.email,
+            Member.phone,
+            Member.is_active,
+        ).order_by(Member.last_name, Member.first_name)
+        return [MemberListRow(*row) for row in self.session.execute(stmt)]
+
 
 class LoanRepository:
     """Gestionnaire d'accès aux objets Loan dans la base de données."""
@@ -115,3 +258,35 @@ class LoanRepository:
 
     def list_open_by_book(self, book_id: int) -> list[Loan]:
         """Retourne la liste des prêts en cours pour un livre donné."""
+        return (
+            self.session.execute(
+                select(Loan).where(Loan.book_id == book_id, Loan.status == LoanStatus.open)
+            )
+            .scalars()
+            .all()
+        )
+
+    def list_rows(self) -> list[LoanListRow]:
+        """Retourne les lignes de la liste des prêts (plus récents d'abord).
+
+        Le titre du livre et le nom du membre sont joints dans la même requête
+        (jointures externes : un prêt orphelin reste affiché).
+        """
+        stmt = (
+            select(
+                Loan.id,
+                Loan.book_id,
+                Loan.member_id,
+                Loan.loan_date,
+                Loan.due_date,
+                Loan.return_date,
+                Loan.status,
+                Book.title,
+                Member.first_name,
+                Member.last_name,
+            )
+            .outerjoin(Book, Loan.book_id == Book.id)
+            .outerjoin(Member, Loan.member_id == Member.id)
+            .order_by(Loan.loan_date.desc())
+        )
+        return [LoanListRow(*row) for row in self.session.execute(stmt)]
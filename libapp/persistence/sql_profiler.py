@@ -0,0 +1,328 @@
+"""
+Instrumentation des requêtes SQL émises par l'application.
+
+Les hooks `before/after_cursor_execute` du moteur chronomètrent chaque
+instruction. Les durées sont agrégées par SQL normalisé (littéraux et listes
+`IN (...)` remplacés par `?`) et par site d'appel (première frame `libapp.*`
+hors persistance SQLAlchemy) : une même requête exécutée des centaines de
+fois depuis une même ligne trahit un motif N+1. Au-delà d'un seuil, la
+requête est écrite dans un journal des requêtes lentes (JSONL, avec rotation)
+avec son `EXPLAIN QUERY PLAN`. Les valeurs liées (noms, e-mails des membres)
+n'y figurent que sur demande (`log_parameters`). Les durées alimentent aussi `metrics_service`
+(opérations `sql.SELECT`, `sql.INSERT`, ..., et `sql.slow`).
+
+Ce module définit :
+- normalize_sql: Forme canonique d'une instruction SQL.
+- StatementStats: Compteurs agrégés d'une instruction.
+- SqlProfiler: Hooks du moteur, agrégats et journal des requêtes lentes.
+- get_sql_profiler / install_sql_profiler: Instance partagée, branchement sur un moteur.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Durée au-delà de laquelle une requête est journalisée comme lente
+SLOW_QUERY_MS = 100.0
+# Nombre maximal d'instructions distinctes suivies (au-delà : regroupées)
+MAX_STATEMENTS = 2000
+# Clé de regroupement au-delà de MAX_STATEMENTS
+OTHER_STATEMENTS = "<autres>"
+# Rotation du journal des requêtes lentes
+SLOW_LOG_MAX_BYTES = 1024 * 1024
+SLOW_LOG_BACKUPS = 3
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACE_RE = re.compile(r"\s+")
+_EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE")
+
+
+@functools.lru_cache(maxsize=1024)
+def normalize_sql(statement: str) -> str:
+    """Instruction sans littéraux ni blancs superflus (`IN (?, ?, ?)` -> `IN (?...)`)."""
+    sql = _STRING_RE.sub("?", statement)
+    sql = _NUMBER_RE.sub("?", sql)
+    sql = _SPACE_RE.sub(" ", sql).strip()
+    return _IN_LIST_RE.sub("(?...)", sql)
+
+
+@dataclass(slots=True)
+class StatementStats:
+    """Compteurs d'une instruction (ou d'un couple site d'appel / instruction)."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def add(self, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 2),
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 2),
+        }
+
+
+def _call_site() -> str:
+    """Première frame applicative (`libapp.*`) à l'origine de la requête."""
+    fallback = None
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module != __name__ and not module.startswith(("sqlalchemy", "contextlib")):
+            site = f"{module}.{frame.f_code.co_name}:{frame.f_lineno}"
+            if module.startswith("libapp."):
+                return site
+            fallback = fallback or site
+        frame = frame.f_back
+    return fallback or "?"
+
+
+class SqlProfiler:
+    """Agrégats de durée par instruction et par site d'appel, journal des requêtes lentes."""
+
+    def __init__(
+        self,
+        *,
+        slow_ms: float = SLOW_QUERY_MS,
+        slow_log_path: Path | None = None,
+        explain: bool = True,
+        track_call_sites: bool = True,
+        feed_metrics: bool = True,
+        max_statements: int = MAX_STATEMENTS,
+        log_parameters: bool = False,
+    ):
+        """
+        Args:
+            slow_ms: Seuil (ms) du journal des requêtes lentes.
+            slow_log_path: Journal JSONL (défaut : `logs/slow_queries.jsonl`).
+            explain: Capturer `EXPLAIN QUERY PLAN` des requêtes lentes.
+            track_call_sites: Agréger aussi par site d'appel (parcours de pile).
+            feed_metrics: Transmettre les durées à `metrics_service`.
+            max_statements: Instructions distinctes suivies au maximum.
+            log_parameters: Journaliser l'instruction brute et ses valeurs liées
+                (données personnelles : désactivé par défaut).
+        """
+        self.enabled = True
+        self.slow_ms = slow_ms
+        self.explain = explain
+        self.track_call_sites = track_call_sites
+        self.feed_metrics = feed_metrics
+        self.max_statements = max_statements
+        self.log_parameters = log_parameters
+        self._slow_log_path = slow_log_path
+        self._slow_log = None
+        self._slow_log_lock = threading.Lock()
+        self._statements: dict[str, StatementStats] = {}
+        self._sites: dict[tuple[str, str], StatementStats] = {}
+        self._slow_count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def slow_log_path(self) -> Path:
+        if self._slow_log_path is None:
+            from ..utils.paths import logs_path
+
+            self._slow_log_path = logs_path() / "slow_queries.jsonl"
+        return self._slow_log_path
+
+    @property
+    def slow_log(self):
+        """Journal des requêtes lentes (`MetricsLog` : ajout seul, rotation par taille)."""
+        if self._slow_log is None:
+            from ..services.metrics_service import MetricsLog
+
+            self._slow_log = MetricsLog(
+                self.slow_log_path,
+                max_bytes=SLOW_LOG_MAX_BYTES,
+                backups=SLOW_LOG_BACKUPS,
+                flush_every=1,
+            )
+        return self._slow_log
+
+    # ---------- Hooks du moteur ----------
+
+    def install(self, engine: Engine) -> None:
+        """Branche les hooks de chronométrage sur `engine`."""
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+        event.listen(engine, "handle_error", self._on_error)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        if self.enabled:
+            conn.info.setdefault("sql_profiler_start", []).append(time.perf_counter())
+
+    @staticmethod
+    def _on_error(exception_context) -> None:
+        """Instruction en échec : `after_cursor_execute` ne viendra pas, on retire son départ."""
+        conn = exception_context.connection
+        starts = conn.info.get("sql_profiler_start") if conn is not None else None
+        if starts:
+            starts.pop()
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("sql_profiler_start")
+        if not starts:
+            return
+        elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+        site = _call_site() if self.track_call_sites else None
+        sql = self.record(statement, elapsed_ms, site)
+        if elapsed_ms >= self.slow_ms:
+            plan = None
+            if self.explain and not executemany:
+                plan = self._explain(cursor, statement, parameters)
+            self._log_slow(sql, statement, parameters, elapsed_ms, site, plan)
+
+    # ---------- Agrégats ----------
+
+    def record(self, statement: str, elapsed_ms: float, call_site: str | None = None) -> str:
+        """Ajoute une exécution aux agrégats ; retourne le SQL normalisé."""
+        sql = normalize_sql(statement)
+        with self._lock:
+            key = sql
+            if key not in self._statements and len(self._statements) >= self.max_statements:
+                key = OTHER_STATEMENTS
+            stats = self._statements.get(key)
+            if stats is None:
+                stats = self._statements[key] = StatementStats()
+            stats.add(elapsed_ms)
+            if call_site is not None:
+                site_key = (call_site, key)
+                site_stats = self._sites.get(site_key)
+                if site_stats is None:
+                    if len(self._sites) >= self.max_statements:
+                        site_key = (OTHER_STATEMENTS, key)
+                    site_stats = self._sites.setdefault(site_key, StatementStats())
+                site_stats.add(elapsed_ms)
+        if self.feed_metrics:
+            from ..services.metrics_service import record_metric
+
+            kind = sql.split(" ", 1)[0].upper() or "?"
+            record_metric(f"sql.{kind}", elapsed_ms / 1000, quiet=True)
+        return sql
+
+    def top_statements(self, n: int = 10, by: str = "total_ms") -> list[dict[str, Any]]:
+        """Les `n` instructions les plus coûteuses (`by` : count, total_ms ou max_ms)."""
+        with self._lock:
+            items = [(sql, stats.as_dict()) for sql, stats in self._statements.items()]
+        items.sort(key=lambda item: item[1][by], reverse=True)
+        return [{"sql": sql, **stats} for sql, stats in items[:n]]
+
+    def top_call_sites(self, n: int = 10) -> list[dict[str, Any]]:
+        """Les `n` sites d'appel cumulant le plus de temps SQL."""
+        per_site: dict[str, StatementStats] = {}
+        with self._lock:
+            for (site, _sql), stats in self._sites.items():
+                total = per_site.setdefault(site, StatementStats())
+                total.count += stats.count
+                total.total_ms += stats.total_ms
+                total.max_ms = max(total.max_ms, stats.max_ms)
+        ranked = sorted(per_site.items(), key=lambda item: item[1].total_ms, reverse=True)
+        return [{"call_site": site, **stats.as_dict()} for site, stats in ranked[:n]]
+
+    def suspected_n_plus_one(self, min_count: int = 50) -> list[dict[str, Any]]:
+        """Couples site d'appel / SELECT exécutés au moins `min_count` fois (cumul)."""
+        with self._lock:
+            hits = [
+                {"call_site": site, "sql": sql, **stats.as_dict()}
+                for (site, sql), stats in self._sites.items()
+                if stats.count >= min_count and sql.upper().startswith("SELECT")
+            ]
+        return sorted(hits, key=lambda hit: hit["count"], reverse=True)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            executed = sum(stats.count for stats in self._statements.values())
+            total_ms = sum(stats.total_ms for stats in self._statements.values())
+            return {
+                "statements": len(self._statements),
+                "executed": executed,
+                "total_ms": round(total_ms, 2),
+                "slow": self._slow_count,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._statements.clear()
+            self._sites.clear()
+            self._slow_count = 0
+
+    # ---------- Requêtes lentes ----------
+
+    @staticmethod
+    def _explain(cursor, statement: str, parameters) -> list[str] | None:
+        """`EXPLAIN QUERY PLAN` sur un curseur distinct (le résultat en cours est préservé)."""
+        if not statement.lstrip().upper().startswith(_EXPLAINABLE):
+            return None
+        try:
+            explain_cursor = cursor.connection.cursor()
+            try:
+                explain_cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ())
+                return [str(row[-1]) for row in explain_cursor.fetchall()]
+            finally:
+                explain_cursor.close()
+        except Exception as e:
+            logger.debug(f"EXPLAIN QUERY PLAN impossible : {e}")
+            return None
+
+    def _log_slow(self, sql, statement, parameters, elapsed_ms, site, plan) -> None:
+        with self._lock:
+            self._slow_count += 1
+        logger.warning(f"🐢 Requête lente ({elapsed_ms:.0f} ms) depuis {site or '?'} : {sql}")
+        if self.feed_metrics:
+            from ..services.metrics_service import record_metric
+
+            record_metric("sql.slow", elapsed_ms / 1000, metadata={"sql": sql, "call_site": site})
+        entry = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "duration_ms": round(elapsed_ms, 2),
+            "call_site": site,
+            "sql": sql,
+            "plan": plan,
+        }
+        if self.log_parameters:
+            entry["statement"] = statement
+            entry["parameters"] = parameters
+        with self._slow_log_lock:
+            self.slow_log.append(entry)
+
+
+_shared_profiler: SqlProfiler | None = None
+_shared_lock = threading.Lock()
+
+
+def get_sql_profiler() -> SqlProfiler:
+    """Profileur partagé par tous les moteurs de l'application."""
+    global _shared_profiler
+    with _shared_lock:
+        if _shared_profiler is None:
+            _shared_profiler = SqlProfiler()
+        return _shared_profiler
+
+
+def install_sql_profiler(engine: Engine) -> SqlProfiler:
+    """Branche le profileur partagé sur `engine`."""
+    profiler = get_sql_profiler()
+    profiler.install(engine)
+    return profiler
@@ -2,18 +2,247 @@
 
 Ce module fournit des fonctions pour enregistrer les actions critiques
 effectuées dans l'application (CRUD, imports, exports, emprunts).
+
+Les entrées ne sont pas écrites par l'appelant : `log_audit` les dépose dans
+la file d'un AuditWriter, dont le thread les insère par lots (toutes les
+`flush_interval_ms` ou tous les `batch_size` enregistrements). Un prêt ou un
+retour n'attend donc plus le commit de son audit. La file est bornée : quand
+elle est pleine, l'appelant écrit lui-même son entrée (contre-pression), rien
+n'est perdu. `MainWindow.closeEvent` vide la file avant de quitter.
+
+La fabrique de sessions est capturée à la soumission : une entrée est écrite
+dans la base qui était courante quand l'action a eu lieu, même si la
+persistance a été rechargée entre-temps (tests).
 """
 
+from __future__ import annotations
+
+import atexit
 import json
 import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 from typing import Any
 
-from ..persistence.database import get_session
-from ..persistence.models_sa import AuditLog
-
 logger = logging.getLogger(__name__)
 
+# Nombre maximal d'entrées insérées par transaction
+AUDIT_BATCH_SIZE = 200
+# Délai maximal avant l'écriture d'une entrée en attente
+AUDIT_FLUSH_INTERVAL_MS = 250
+# Entrées en attente au-delà desquelles l'appelant écrit lui-même
+AUDIT_QUEUE_SIZE = 10_000
+# Attente maximale d'une place dans la file avant l'écriture synchrone
+AUDIT_PUT_TIMEOUT_S = 0.05
+
+
+class _FlushRequest:
+    """Marqueur déposé dans la file : signale l'écriture de tout ce qui le précède."""
+
+    __slots__ = ("done",)
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+def _current_session_factory() -> Callable:
+    """`get_session` du module de persistance courant (les tests le rechargent)."""
+    from ..persistence.database import get_session
+
+    return get_session
+
+
+def _write_rows(rows: list[dict[str, Any]], session_factory: Callable) -> None:
+    """Insère `rows` dans `audit_logs` en une seule transaction (executemany)."""
+    from sqlalchemy import insert
+
+    from ..persistence.models_sa import AuditLog
+
+    with session_factory() as session:
+        session.execute(insert(AuditLog), rows)
+        session.commit()
+
+
+class AuditWriter:
+    """Écrit les entrées d'audit par lots depuis un thread dédié.
+
+    Le thread démarre au premier `submit`. `flush()` attend que tout ce qui a
+    été soumis soit en base ; `close()` vide la file puis arrête le thread, les
+    soumissions suivantes étant écrites directement.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = AUDIT_BATCH_SIZE,
+        flush_interval_ms: int = AUDIT_FLUSH_INTERVAL_MS,
+        max_queue: int = AUDIT_QUEUE_SIZE,
+        put_timeout: float = AUDIT_PUT_TIMEOUT_S,
+        write: Callable[[list[dict[str, Any]], Any], None] = _write_rows,
+        session_factory: Callable[[], Any] = _current_session_factory,
+    ):
+        """
+        Args:
+            batch_size: Entrées maximales par transaction.
+            flush_interval_ms: Délai maximal avant l'écriture d'une entrée.
+            max_queue: Taille de la file (contre-pression au-delà).
+            put_timeout: Attente d'une place dans la file avant écriture synchrone.
+            write: Écriture d'un lot `write(rows, fabrique)` (remplaçable dans les tests).
+            session_factory: Retourne la fabrique de sessions courante, appelée à la soumission.
+        """
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_interval_ms / 1000)
+        self.put_timeout = put_timeout
+        self._write = write
+        self._session_factory = session_factory
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, max_queue))
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._stats = {"submitted": 0, "written": 0, "batches": 0, "sync_writes": 0, "failed": 0}
+
+    # ---------- Soumission ----------
+
+    def submit(self, row: dict[str, Any]) -> None:
+        """Dépose une entrée ; l'écrit directement si la file reste pleine."""
+        item = (self._session_factory(), row)
+        with self._lock:
+            self._stats["submitted"] += 1
+            closed = self._closed
+            if not closed:
+                self._ensure_thread()
+        if not closed:
+            try:
+                self._queue.put(item, timeout=self.put_timeout)
+                return
+            except queue.Full:
+                logger.warning("⏳ Audit • file pleine, écriture synchrone")
+        with self._lock:
+            self._stats["sync_writes"] += 1
+        self._write_batch([item])
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+            self._thread.start()
+
+    # ---------- Thread d'écriture ----------
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch: list[tuple[Any, dict[str, Any]]] = []
+            markers: list[_FlushRequest] = []
+            stop = False
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, _FlushRequest):
+                    markers.append(item)
+                else:
+                    batch.append(item)
+                if stop or markers or len(batch) >= self.batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else None
+                except queue.Empty:
+                    item = None
+                if item is None:
+                    break
+            if batch:
+                self._write_batch(batch)
+            for marker in markers:
+                marker.done.set()
+            if stop:
+                return
+
+    def _write_batch(self, batch: list[tuple[Any, dict[str, Any]]]) -> None:
+        """Écrit un lot, une transaction par fabrique de sessions (dans l'ordre de soumission)."""
+        for session_factory, items in groupby(batch, key=itemgetter(0)):
+            rows = [row for _, row in items]
+            try:
+                self._write(rows, session_factory)
+            except Exception as e:
+                # Ne jamais faire crasher l'app à cause du logging !
+                with self._lock:
+                    self._stats["failed"] += len(rows)
+                logger.error(f"Failed to write audit log ({len(rows)} entrée(s)) : {e}")
+                continue
+            with self._lock:
+                self._stats["written"] += len(rows)
+                self._stats["batches"] += 1
+
+    # ---------- Vidage / arrêt ----------
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Attend l'écriture de tout ce qui a été soumis. False si le délai expire."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                return self._queue.empty()
+        marker = _FlushRequest()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.done.wait(timeout)
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Vide la file et arrête le thread ; les entrées suivantes sont écrites directement."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.error("Audit • file pleine à la fermeture, entrées non écrites")
+            return
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.error(f"Audit • {self._queue.qsize()} entrée(s) non écrites à la fermeture")
+        else:
+            logger.info(f"📝 Audit • file vidée ({self._stats['written']} entrée(s) écrites)")
+
+    def stats(self) -> dict[str, int]:
+        """Compteurs de soumission/écriture et taille courante de la file."""
+        with self._lock:
+            return {**self._stats, "pending": self._queue.qsize()}
+
+
+_shared_writer: AuditWriter | None = None
+_shared_lock = threading.Lock()
+
+
+def get_audit_writer() -> AuditWriter:
+    """Écrivain d'audit partagé, vidé aussi à la sortie de l'interpréteur."""
+    global _shared_writer
+    with _shared_lock:
+        if _shared_writer is None:
+            _shared_writer = AuditWriter()
+            atexit.register(_shared_writer.close)
+        return _shared_writer
+
+
+def shutdown_audit_writer(timeout: float | None = 5.0) -> None:
+    """Écrit les entrées en attente et arrête l'écrivain partagé (fermeture de l'app)."""
+    with _shared_lock:
+        writer = _shared_writer
+    if writer is not None:
+        writer.close(timeout)
+
 
 class AuditAction:
     """Constantes pour les types d'actions auditées."""
@@ -46,6 +275,8 @@ def log_audit(
 ) -> None:
     """Enregistre une action dans le journal d'audit.
 
+    L'écriture en base est différée (voir AuditWriter) ; le log applicatif est immédiat.
+
     Args:
         action: Type d'action (CREATE, UPDATE, DELETE, etc.)
         entity_type: Type d'entité (book, member, loan)
@@ -58,22 +289,19 @@ def log_audit(
         # Convertir details en JSON si présent
         details_json = json.dumps(details) if details else None
 
-        # Créer l'entrée d'audit
-        audit_entry = AuditLog(
-            timestamp=datetime.utcnow(),
-            action=action,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            user=user,
-            details=details_json,
-            level=level,
+        # Déposer l'entrée (horodatée maintenant) ; l'écrivain la sauvegarde en base
+        get_audit_writer().submit(
+            {
+                "timestamp": datetime.utcnow(),
+                "action": action,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "user": user,
+                "details": details_json,
+                "level": level,
+            }
         )
 
-        # Sauvegarder en base
-        with get_session() as session:
-            session.add(audit_entry)
-            session.commit()
-
         # Logger aussi dans les logs applicatifs
         log_msg = f"AUDIT: {action} {entity_type}"
         if entity_id:
@@ -3,7 +3,9 @@ from __future__ import annotations
 import re
 import xml.etree.ElementTree as ET
 
-import requests
+from .bnf_service import ISBN_BATCH_SIZE, MAX_RECORDS_PER_ISBN, isbn_batch_query, iter_sru_pages
+from .http_transport import HttpTransport, get_transport
+from .utils import to_isbn13
 
 SRU = "https://catalogue.bnf.fr/api/SRU"
 SCHEMA = "dublincore"
@@ -41,6 +43,18 @@ def _extract_dc_text(elem: ET.Element, tag: str) -> list[str]:
     return vals
 
 
+def _identifier_isbns(identifiers: list[str]) -> list[str]:
+    """ISBN plausibles parmi les 'identifier' Dublin Core ("ISBN 978-2-...")."""
+    isbns = []
+    for ident in identifiers:
+        t = ident.replace("-", "").replace(" ", "")
+        if t.lower().startswith("isbn"):
+            t = t[4:].lstrip(":").strip()
+        if (10 <= len(t) <= 13) and t.isalnum():
+            isbns.append(t)
+    return isbns
+
+
 def _notice_to_dict(record: ET.Element) -> dict[str, str]:
     md = record.find(".//{http://www.loc.gov/zing/srw/}recordData")
     if md is None:
@@ -55,14 +69,8 @@ def _notice_to_dict(record: ET.Element) -> dict[str, str]:
     descriptions = _extract_dc_text(md, "description")
 
     # repérer un ISBN plausible dans 'identifier'
-    isbn = ""
-    for ident in identifiers:
-        t = ident.replace("-", "").replace(" ", "")
-        if t.lower().startswith("isbn"):
-            t = t[4:].lstrip(":").strip()
-        if (10 <= len(t) <= 13) and t.isalnum():
-            isbn = t
-            break
+    isbns = _identifier_isbns(identifiers)
+    isbn = isbns[0] if isbns else ""
 
     return {
         "title": titles[0] if titles else "",
@@ -75,7 +83,10 @@ def _notice_to_dict(record: ET.Element) -> dict[str, str]:
 
 
 class BnfAdapter:
-    timeout = 10
+    timeout = None  # None : timeout de la source "bnf" défini par le transport
+
+    def __init__(self, transport: HttpTransport | None = None):
+        self.transport = transport or get_transport()
 
     def by_isbn(self, isbn: str) -> dict[str, str] | None:
         if not isbn:
@@ -88,7 +99,7 @@ class BnfAdapter:
             "recordSchema": SCHEMA,
             "maximumRecords": "5",
         }
-        r = requests.get(SRU, params=params, timeout=self.timeout)
+        r = self.transport.get(SRU, source="bnf", params=params, timeout=self.timeout)
         r.raise_for_status()
         root = ET.fromstring(r.content)
         recs = root.findall(".//{http://www.loc.gov/zing/srw/}record")
@@ -96,6 +107,33 @@ class BnfAdapter:
             return None
         return _notice_to_dict(recs[0])
 
+    def by_isbns(
+        self, isbns: list[str], *, batch_size: int = ISBN_BATCH_SIZE
+    ) -> dict[str, dict[str, str] | None]:
+        """Notices d'un lot d'ISBN, en une requête CQL par paquet (voir BnfService)."""
+        found: dict[str, dict[str, str] | None] = dict.fromkeys(isbns)
+        valid = [isbn for isbn in found if to_isbn13(isbn)]
+        for start in range(0, len(valid), batch_size):
+            wanted: dict[str, list[str]] = {}
+            for isbn in valid[start : start + batch_size]:
+                wanted.setdefault(to_isbn13(isbn), []).append(isbn)
+            pages = iter_sru_pages(
+                self.transport,
+                isbn_batch_query(wanted),
+                schema=SCHEMA,
+                max_records=MAX_RECORDS_PER_ISBN * len(wanted),
+                timeout=self.timeout,
+            )
+            for root in pages:
+                for rec in root.iter("{http://www.loc.gov/zing/srw/}record"):
+                    identifiers = _extract_dc_text(rec, "identifier")
+                    for isbn in _identifier_isbns(identifiers):
+                        for requested in wanted.pop(to_isbn13(isbn), ()):
+                            found[requested] = _notice_to_dict(rec)
+                if not wanted:
+                    break
+        return found
+
     def search_title_author(self, title: str, author: str = "") -> list[dict[str, str]]:
         if not title:
             return []
@@ -111,7 +149,7 @@ class BnfAdapter:
             "recordSchema": SCHEMA,
             "maximumRecords": "20",
         }
-        r = requests.get(SRU, params=params, timeout=self.timeout)
+        r = self.transport.get(SRU, source="bnf", params=params, timeout=self.timeout)
         r.raise_for_status()
         root = ET.fromstring(r.content)
         recs = root.findall(".//{http://www.loc.gov/zing/srw/}record")
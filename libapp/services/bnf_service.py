@@ -1,18 +1,36 @@
 """
 Service pour interroger le catalogue de la BNF via son API SRU.
 
-Ce service recherche des notices de livres par ISBN et utilise un adaptateur
-pour convertir les données XML complexes en un `BookDTO` standard.
+Ce service recherche des notices de livres par ISBN ou titre/auteur. La
+réponse SRU est parsée une seule fois : chaque notice INTERMARC est indexée
+en un parcours ({(zone, sous-zone): [valeurs]}) dont se servent tous les
+extracteurs de champs, et toutes les notices de la réponse sont retournées.
 """
 
 from __future__ import annotations
 
-import urllib.parse
-import urllib.request
+import logging
+import re
 import xml.etree.ElementTree as ET
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 
-from .utils import clean_author, normalize_isbn
+from .http_transport import HttpTransport, get_transport
+from .utils import clean_author, normalize_isbn, to_isbn13
+
+logger = logging.getLogger(__name__)
+
+SRU_URL = "https://catalogue.bnf.fr/api/SRU"
+SRW_NS = "http://www.loc.gov/zing/srw/"
+SRW_DIAGNOSTIC_NS = "http://www.loc.gov/zing/srw/diagnostic/"
+_YEAR_RE = re.compile(r"(\d{4})")
+
+# Plafond de maximumRecords accepté par le SRU de la BnF
+MAX_RECORDS_PER_PAGE = 50
+# ISBN combinés par requête CQL (borne la longueur de l'URL)
+ISBN_BATCH_SIZE = 25
+# Notices lues au plus par ISBN demandé (rééditions, homonymes de isbn_any)
+MAX_RECORDS_PER_ISBN = 4
 
 
 @dataclass
@@ -36,10 +54,21 @@ class BnfService:
     Sortie normalisée -> BnfBook
     """
 
-    BASE = "https://catalogue.bnf.fr/api/SRU"
-
-    def __init__(self, *, timeout: float = 10.0, maximum_records: int = 3):
+    BASE = SRU_URL
+
+    def __init__(
+        self,
+        *,
+        timeout: float | None = None,
+        maximum_records: int = 3,
+        transport: HttpTransport | None = None,
+        base_url: str | None = None,
+    ):
+        # timeout=None : timeout de la source "bnf" défini par le transport
         self.timeout = timeout
+        self.transport = transport or get_transport()
+        # URL SRU substituable (serveur de rejeu, voir http_replay)
+        self.BASE = base_url or self.BASE
         self.maximum_records = str(max(1, min(10, maximum_records)))
 
     def search_by_isbn(self, isbn: str) -> BnfBook | None:
@@ -56,7 +85,66 @@ class BnfService:
                 pass
 
         query = f'(bib.isbn_any all "{normalized_isbn}")'
-        return self._search_sru(query)
+        books = self._search_sru(query)
+        # Plusieurs notices possibles (rééditions) : celle de l'ISBN demandé d'abord
+        for book in books:
+            if book.isbn and normalize_isbn(book.isbn) == normalized_isbn:
+                return book
+        return books[0] if books else None
+
+    def search_many_isbns(
+        self, isbns: Iterable[str], *, batch_size: int = ISBN_BATCH_SIZE
+    ) -> dict[str, BnfBook | None]:
+        """Recherche BnF d'un lot d'ISBN, en une requête CQL par paquet de `batch_size`.
+
+        Les notices reçues (paginées par `startRecord`) sont rattachées aux
+        ISBN demandés via leurs zones 020/021, ISBN-10 et ISBN-13 confondus.
+        La pagination s'arrête dès que tous les ISBN du paquet sont trouvés.
+
+        Returns:
+            {isbn demandé: BnfBook ou None}, dans l'ordre de la demande ; None
+            signifie que la BnF n'a pas de notice pour l'ISBN.
+
+        Raises:
+            requests.RequestException: Un paquet en échec (transport ou réponse
+                HTTP d'erreur) : ses ISBN ne sont pas « introuvables ».
+        """
+        found: dict[str, BnfBook | None] = {}
+        batch: list[str] = []
+        for isbn in isbns:
+            if isbn in found:
+                continue
+            found[isbn] = None
+            if to_isbn13(isbn):
+                batch.append(isbn)
+            if len(batch) >= batch_size:
+                self._search_isbn_batch(batch, found)
+                batch = []
+        if batch:
+            self._search_isbn_batch(batch, found)
+        return found
+
+    def _search_isbn_batch(self, isbns: list[str], found: dict[str, BnfBook | None]) -> None:
+        """Une requête CQL pour `isbns` ; complète `found` avec les notices rattachées."""
+        wanted: dict[str, list[str]] = {}
+        for isbn in isbns:
+            wanted.setdefault(to_isbn13(isbn), []).append(isbn)
+        query = isbn_batch_query(wanted)
+        max_records = MAX_RECORDS_PER_ISBN * len(wanted)
+        for root in iter_sru_pages(
+            self.transport,
+            query,
+            schema="intermarcXchange",
+            max_records=max_records,
+            timeout=self.timeout,
+            url=self.BASE,
+        ):
+            for index, book in _records_from_root(root):
+                for value in _record_isbns(index):
+                    for requested in wanted.pop(to_isbn13(value), ()):
+                        found[requested] = book
+            if not wanted:
+                break
 
     def search_by_title_author(self, title: str, author: str | None = None) -> list[BnfBook]:
         """Recherche BnF par titre et auteur (optionnel)."""
@@ -68,11 +156,15 @@ class BnfService:
             parts.append(f'(bib.author all "{author}")')
 
         query = " and ".join(parts)
-        result = self._search_sru(query)
-        return [result] if result else []
+        return self._search_sru(query)
 
-    def _search_sru(self, query: str) -> BnfBook | None:
-        """Exécute une recherche SRU et parse le premier résultat."""
+    def _search_sru(self, query: str) -> list[BnfBook]:
+        """Exécute une recherche SRU et parse toutes les notices de la réponse.
+
+        Raises:
+            requests.RequestException: Échec de transport ou réponse HTTP d'erreur
+                (une recherche sans notice rend une liste vide).
+        """
         params = {
             "version": "1.2",
             "operation": "searchRetrieve",
@@ -81,137 +173,182 @@ class BnfService:
             "query": query,
         }
 
-        url = f"{self.BASE}?{urllib.parse.urlencode(params)}"
+        response = self.transport.get(self.BASE, source="bnf", params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return parse_sru_response(response.content)
 
-        try:
-            req = urllib.request.Request(url)
-            req.add_header("User-Agent", "Mozilla/5.0 (compatible; BibApp/1.0)")
 
-            with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                content = response.read()
+def isbn_batch_query(isbns: Iterable[str]) -> str:
+    """Requête CQL combinant plusieurs ISBN : (bib.isbn_any all "a") or (...)."""
+    return " or ".join(f'(bib.isbn_any all "{isbn}")' for isbn in isbns)
 
-            # Parser la réponse SRU
-            root = ET.fromstring(content)
-            ns = {"srw": "http://www.loc.gov/zing/srw/"}
 
-            # Vérifier les erreurs
-            diagnostics = root.findall(".//{http://www.loc.gov/zing/srw/diagnostic/}diagnostic")
-            if diagnostics:
-                return None
+def iter_sru_pages(
+    transport: HttpTransport,
+    query: str,
+    *,
+    schema: str,
+    max_records: int,
+    page_size: int = MAX_RECORDS_PER_PAGE,
+    timeout: float | None = None,
+    url: str = SRU_URL,
+) -> Iterator[ET.Element]:
+    """Pages d'une recherche SRU (racine XML de chaque réponse), via `startRecord`.
 
-            # Extraire les records
-            records = root.findall(".//srw:record", ns)
-            if not records:
-                return None
+    S'arrête sur un diagnostic SRU, à la dernière page, ou après `max_records`
+    notices. L'appelant peut interrompre l'itération dès qu'il a ce qu'il lui faut.
+    """
+    page_size = max(1, min(MAX_RECORDS_PER_PAGE, page_size, max_records))
+    start = 1
+    while start <= max_records:
+        params = {
+            "version": "1.2",
+            "operation": "searchRetrieve",
+            "recordSchema": schema,
+            "maximumRecords": str(page_size),
+            "startRecord": str(start),
+            "query": query,
+        }
+        response = transport.get(url, source="bnf", params=params, timeout=timeout)
+        response.raise_for_status()
+        root = ET.fromstring(response.content)
+        if root.find(f".//{{{SRW_DIAGNOSTIC_NS}}}diagnostic") is not None:
+            return
+        yield root
 
-            # Parser le premier record
-            first_record = records[0]
-            record_raw = ET.tostring(first_record, encoding="unicode")
+        next_position = (root.findtext(f"{{{SRW_NS}}}nextRecordPosition") or "").strip()
+        if not next_position.isdigit():
+            return
+        start = int(next_position)
 
-            return self._parse_intermarc(record_raw)
 
-        except Exception:
-            return None
+def _local_name(tag: str) -> str:
+    """Nom d'élément sans namespace ("{ns}datafield" -> "datafield")."""
+    return tag.rpartition("}")[2]
 
-    def _parse_intermarc(self, record_raw: str) -> BnfBook | None:
-        """Parse une notice INTERMARC en BnfBook.
 
-        Utilise les namespaces XML correctement pour extraire les champs MARC.
-        """
-        try:
-            container = ET.fromstring(f"<container>{record_raw}</container>")
-
-            # 🎯 Namespace MARC XML
-            ns = {"ns1": "info:lc/xmlns/marcxchange-v2"}
-
-            def first_text(codes: list[str]) -> str | None:
-                """Trouve le premier texte non vide parmi les codes MARC."""
-                for code in codes:
-                    if "$" not in code:
-                        continue
-
-                    tag, sub = code.split("$", 1)
-                    xpath = f".//ns1:datafield[@tag='{tag}']/ns1:subfield[@code='{sub}']"
-                    el = container.find(xpath, ns)
-
-                    if el is not None:
-                        val = (el.text or "").strip()
-                        if val:
-                            return val
-                return None
-
-            def all_texts(codes: list[str]) -> list[str]:
-                """Trouve tous les textes pour les codes donnés."""
-                results = []
-                for code in codes:
-                    if "$" not in code:
-                        continue
-
-                    tag, sub = code.split("$", 1)
-                    xpath = f".//ns1:datafield[@tag='{tag}']/ns1:subfield[@code='{sub}']"
-                    elements = container.findall(xpath, ns)
-
-                    for el in elements:
-                        val = (el.text or "").strip()
-                        if val:
-                            results.append(clean_author(val))
-                return results
-
-            # 🎯 Extraction des champs principaux
-            titre = first_text(["245$a"])
-            if not titre:
-                return None
-
-            sous_titre = first_text(["245$e", "245$b"])
-
-            # Auteurs depuis différents champs possibles
-            auteurs = []
-            auteurs.extend(all_texts(["245$f"]))  # Auteur dans le titre
-            auteurs.extend(all_texts(["100$a", "100$m"]))  # Auteur principal
-            auteurs.extend(all_texts(["700$a", "700$m"]))  # Auteurs secondaires
-
-            # Dédoublonnage des auteurs
-            auteurs_uniques = []
-            for auteur in auteurs:
-                if auteur and auteur not in auteurs_uniques:
-                    auteurs_uniques.append(auteur)
-
-            # ISBN - gestion multiple formats
-            isbn = first_text(["020$a", "021$a"])
-            if isbn:
-                # Nettoyer l'ISBN (enlever les mentions comme "rel.", "br.")
-                isbn = isbn.split()[0] if " " in isbn else isbn
-                isbn = normalize_isbn(isbn)
-
-                # Correction notation scientifique BnF
-                if isbn and "e+" in str(isbn).lower():
-                    try:
-                        isbn = str(int(float(isbn)))
-                    except (ValueError, OverflowError):
-                        pass
-
-            # Éditeur
-            editeur = first_text(["260$c", "264$b"])
-
-            # Date de publication
-            date_pub = first_text(["260$d", "264$c"])
-            if date_pub:
-                # Extraire juste l'année (nettoyer "impr. 2010" → "2010")
-                import re
-
-                match = re.search(r"(\d{4})", date_pub)
-                if match:
-                    date_pub = match.group(1)
-
-            return BnfBook(
-                titre=titre,
-                sous_titre=sous_titre,
-                auteurs=auteurs_uniques,
-                isbn=isbn,
-                editeur=editeur,
-                date_publication=date_pub,
-                collection=None,  # BnF ne fournit pas ce champ de manière fiable
-            )
-
-        except Exception:
-            return None
+def index_marc_record(record: ET.Element) -> dict[tuple[str, str], list[str]]:
+    """Indexe une notice MARC en un seul parcours : {(tag, code): [valeurs]}.
+
+    Les sous-zones suivent leur zone dans l'ordre du document : il suffit de
+    retenir le tag de la dernière `datafield` rencontrée. Les valeurs vides
+    sont ignorées ; l'ordre d'apparition est conservé.
+    """
+    index: dict[tuple[str, str], list[str]] = {}
+    current_tag: str | None = None
+    for elem in record.iter():
+        name = _local_name(elem.tag)
+        if name == "subfield":
+            if current_tag is None:
+                continue
+            value = (elem.text or "").strip()
+            if value:
+                index.setdefault((current_tag, elem.get("code", "")), []).append(value)
+        elif name == "datafield":
+            current_tag = elem.get("tag", "")
+        elif name in ("controlfield", "leader"):
+            current_tag = None
+    return index
+
+
+def parse_sru_response(content: bytes | str) -> list[BnfBook]:
+    """Parse une réponse SRU BnF : une BnfBook par notice exploitable, dans l'ordre.
+
+    Le XML est parsé une seule fois ; une réponse de diagnostic (erreur SRU)
+    ou illisible donne une liste vide.
+    """
+    try:
+        root = ET.fromstring(content)
+    except ET.ParseError:
+        return []
+
+    if root.find(f".//{{{SRW_DIAGNOSTIC_NS}}}diagnostic") is not None:
+        return []
+    return [book for _, book in _records_from_root(root)]
+
+
+def _records_from_root(root: ET.Element) -> list[tuple[dict[tuple[str, str], list[str]], BnfBook]]:
+    """(index MARC, BnfBook) de chaque notice exploitable d'une réponse SRU."""
+    records = []
+    for record in root.iter(f"{{{SRW_NS}}}record"):
+        index = index_marc_record(record)
+        book = _book_from_index(index)
+        if book is not None:
+            records.append((index, book))
+    return records
+
+
+def _record_isbns(index: dict[tuple[str, str], list[str]]) -> list[str]:
+    """Tous les ISBN d'une notice (020$a, 021$a), sans les mentions ("br.", "rel.")."""
+    values = index.get(("020", "a"), []) + index.get(("021", "a"), [])
+    return [value.split()[0] for value in values if value.split()]
+
+
+def _book_from_index(index: dict[tuple[str, str], list[str]]) -> BnfBook | None:
+    """Construit une BnfBook depuis l'index MARC d'une notice INTERMARC."""
+
+    def first_text(codes: list[str]) -> str | None:
+        """Premier texte non vide parmi les codes MARC ("245$a")."""
+        for code in codes:
+            values = index.get(tuple(code.split("$", 1)))
+            if values:
+                return values[0]
+        return None
+
+    def all_texts(codes: list[str]) -> list[str]:
+        """Tous les textes (auteurs nettoyés) pour les codes donnés."""
+        return [clean_author(v) for code in codes for v in index.get(tuple(code.split("$", 1)), ())]
+
+    # 🎯 Extraction des champs principaux
+    titre = first_text(["245$a"])
+    if not titre:
+        return None
+
+    sous_titre = first_text(["245$e", "245$b"])
+
+    # Auteurs depuis différents champs possibles
+    auteurs = []
+    auteurs.extend(all_texts(["245$f"]))  # Auteur dans le titre
+    auteurs.extend(all_texts(["100$a", "100$m"]))  # Auteur principal
+    auteurs.extend(all_texts(["700$a", "700$m"]))  # Auteurs secondaires
+
+    # Dédoublonnage des auteurs
+    auteurs_uniques = []
+    for auteur in auteurs:
+        if auteur and auteur not in auteurs_uniques:
+            auteurs_uniques.append(auteur)
+
+    # ISBN - gestion multiple formats
+    isbn = first_text(["020$a", "021$a"])
+    if isbn:
+        # Nettoyer l'ISBN (enlever les mentions comme "rel.", "br.")
+        isbn = isbn.split()[0] if " " in isbn else isbn
+        isbn = normalize_isbn(isbn)
+
+        # Correction notation scientifique BnF
+        if isbn and "e+" in str(isbn).lower():
+            try:
+                isbn = str(int(float(isbn)))
+            except (ValueError, OverflowError):
+                pass
+
+    # Éditeur
+    editeur = first_text(["260$c", "264$b"])
+
+    # Date de publication
+    date_pub = first_text(["260$d", "264$c"])
+    if date_pub:
+        # Extraire juste l'année (nettoyer "impr. 2010" → "2010")
+        match = _YEAR_RE.search(date_pub)
+        if match:
+            date_pub = match.group(1)
+
+    return BnfBook(
+        titre=titre,
+        sous_titre=sous_titre,
+        auteurs=auteurs_uniques,
+        isbn=isbn,
+        editeur=editeur,
+        date_publication=date_pub,
+        collection=None,  # BnF ne fournit pas ce champ de manière fiable
+    )
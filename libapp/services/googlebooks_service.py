@@ -13,6 +13,7 @@ import logging
 
 import requests
 
+from .http_transport import HttpTransport, get_transport
 from .types import BookDTO
 
 logger = logging.getLogger("library.services.googlebooks")
@@ -70,14 +71,24 @@ class GoogleBooksService:
 
     API_URL = "https://www.googleapis.com/books/v1/volumes"
 
-    def __init__(self, timeout: int = 10):
+    def __init__(
+        self,
+        timeout: float | None = None,
+        transport: HttpTransport | None = None,
+        api_url: str | None = None,
+    ):
         """
         Initialise le service.
 
         Args:
-            timeout (int): Timeout en secondes pour les requêtes HTTP.
+            timeout (float | None): Timeout en secondes pour les requêtes HTTP
+                (None : timeout de la source "google" défini par le transport).
+            transport (HttpTransport | None): Transport HTTP (partagé par défaut).
+            api_url (str | None): URL de l'API (serveur de rejeu, voir http_replay).
         """
         self.timeout = timeout
+        self.transport = transport or get_transport()
+        self.API_URL = api_url or self.API_URL
 
     def search_by_isbn(self, isbn: str) -> BookDTO | None:
         """
@@ -94,7 +105,9 @@ class GoogleBooksService:
         """
         params = {"q": f"isbn:{isbn}"}
         try:
-            response = requests.get(self.API_URL, params=params, timeout=self.timeout)
+            response = self.transport.get(
+                self.API_URL, source="google", params=params, timeout=self.timeout
+            )
             response.raise_for_status()  # Lève une exception pour les codes 4xx/5xx
             data = response.json()
 
@@ -109,7 +122,11 @@ class GoogleBooksService:
             raise GoogleBooksServiceError("Impossible de contacter l'API Google Books.") from e
 
     def search_by_title_author(self, title: str, author: str = None) -> list[dict]:
-        """Recherche par titre et auteur."""
+        """Recherche par titre et auteur.
+
+        Raises:
+            GoogleBooksServiceError: En cas de problème de connexion ou d'API.
+        """
         logger.debug("🔍 GOOGLE BOOKS DEBUG - DÉBUT")
         logger.debug(f"  Titre: '{title}'")
         logger.debug(f"  Auteur: '{author}'")
@@ -125,8 +142,11 @@ class GoogleBooksService:
             params = {"q": query, "maxResults": 5, "printType": "books"}
             logger.debug(f"  Params: {params}")
 
-            response = requests.get(self.API_URL, params=params, timeout=self.timeout)
+            response = self.transport.get(
+                self.API_URL, source="google", params=params, timeout=self.timeout
+            )
             logger.debug(f"  Status code: {response.status_code}")
+            response.raise_for_status()
 
             data = response.json()
             logger.debug(f"  Total items dans réponse: {data.get('totalItems', 0)}")
@@ -146,6 +166,6 @@ class GoogleBooksService:
             logger.debug(f"  Résultats finaux: {len(books)}")
             return books
 
-        except Exception as e:
+        except requests.RequestException as e:
             logger.error(f"🚨 GOOGLE BOOKS ERROR: {e}")
-            return []
+            raise GoogleBooksServiceError("Impossible de contacter l'API Google Books.") from e
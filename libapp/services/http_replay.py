@@ -0,0 +1,325 @@
+"""
+Enregistrement et rejeu des réponses des sources bibliographiques.
+
+Les clients BnF, Google Books et OpenLibrary ne s'exercent sinon que contre
+les services en ligne : impossible de mesurer leur latence ou leur coût de
+parsing hors ligne, ni d'en faire des tests de non-régression. Un
+RecordingTransport capture les réponses réelles dans un FixtureStore ; un
+ReplayServer (serveur HTTP local) les rejoue ensuite, avec une latence et
+un taux d'erreur configurables par source. Les clients y sont branchés via
+leur URL de base (`base_url` / `api_url`).
+
+Ce module définit :
+- FixtureStore: Réponses enregistrées, un fichier JSON par requête.
+- RecordingTransport: Transport qui enregistre chaque réponse obtenue.
+- FaultProfile: Latence, gigue et erreurs injectées pour une source.
+- ReplayServer: Serveur HTTP local de rejeu (`/<source>/<chemin d'origine>`).
+- replay_services: Clients BnF/Google Books/OpenLibrary pointés vers un ReplayServer.
+
+En ligne de commande :
+    python -m libapp.services.http_replay record fixtures/ 9782070360420 ...
+    python -m libapp.services.http_replay serve fixtures/ --fault openlibrary=2.0:0.1
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from .bnf_service import BnfService
+from .googlebooks_service import GoogleBooksService
+from .http_transport import HttpTransport, SourcePolicy, get_transport
+from .openlibrary_service import OpenLibraryService
+
+logger = logging.getLogger(__name__)
+
+SOURCES = ("bnf", "google", "openlibrary")
+
+# Rejeu : ni limitation de débit ni nouvelle tentative (les erreurs injectées restent visibles)
+REPLAY_POLICIES: dict[str, SourcePolicy] = {
+    source: SourcePolicy(connect_timeout=1.0, read_timeout=10.0, retries=0) for source in SOURCES
+}
+
+
+def request_key(source: str, path: str, params: dict | None = None) -> str:
+    """Clé d'une requête, indépendante de l'hôte et de l'ordre des paramètres."""
+    query = urlencode(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return f"{source} {path}?{query}"
+
+
+class FixtureStore:
+    """Réponses enregistrées dans un dossier, un fichier JSON par requête."""
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._memory: dict[str, tuple[int, str, bytes] | None] = {}
+        self._lock = threading.Lock()
+
+    def _file(self, key: str) -> Path:
+        source = key.split(" ", 1)[0]
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return self.directory / f"{source}-{digest}.json"
+
+    def put(
+        self,
+        source: str,
+        path: str,
+        params: dict | None,
+        status: int,
+        body: bytes,
+        content_type: str = "application/octet-stream",
+    ) -> None:
+        """Enregistre (ou remplace) la réponse d'une requête."""
+        key = request_key(source, path, params)
+        entry = {"key": key, "status": status, "content_type": content_type}
+        try:
+            entry["text"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            entry["base64"] = base64.b64encode(body).decode("ascii")
+        self._file(key).write_text(json.dumps(entry, ensure_ascii=False), encoding="utf-8")
+        with self._lock:
+            self._memory[key] = (status, content_type, body)
+
+    def get(self, source: str, path: str, params: dict | None = None):
+        """(statut, type de contenu, corps) enregistrés, ou None."""
+        key = request_key(source, path, params)
+        with self._lock:
+            if key in self._memory:
+                return self._memory[key]
+        file = self._file(key)
+        found = None
+        if file.exists():
+            entry = json.loads(file.read_text(encoding="utf-8"))
+            if "text" in entry:
+                body = entry["text"].encode("utf-8")
+            else:
+                body = base64.b64decode(entry["base64"])
+            found = (entry["status"], entry["content_type"], body)
+        with self._lock:
+            self._memory[key] = found
+        return found
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.directory.glob("*.json"))
+
+
+class RecordingTransport:
+    """Transport qui délègue à `inner` et enregistre chaque réponse dans `store`."""
+
+    def __init__(self, store: FixtureStore, inner: HttpTransport | None = None):
+        self.store = store
+        self.inner = inner or get_transport()
+
+    def get(self, url: str, *, source: str, params=None, timeout=None, headers=None):
+        response = self.inner.get(
+            url, source=source, params=params, timeout=timeout, headers=headers
+        )
+        self.store.put(
+            source,
+            urlsplit(url).path,
+            params,
+            response.status_code,
+            response.content,
+            response.headers.get("Content-Type", "application/octet-stream"),
+        )
+        return response
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+@dataclass(slots=True)
+class FaultProfile:
+    """Comportement simulé d'une source pendant le rejeu."""
+
+    latency: float = 0.0  # Secondes ajoutées avant chaque réponse
+    jitter: float = 0.0  # Variation aléatoire de la latence (± secondes)
+    error_rate: float = 0.0  # Proportion de réponses remplacées par une erreur
+    error_status: int = 503
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, comme les vrais services
+
+    def do_GET(self):
+        replay: ReplayServer = self.server.replay
+        parts = urlsplit(self.path)
+        _, source, path = parts.path.split("/", 2) if parts.path.count("/") >= 2 else ("", "", "")
+        params = dict(parse_qsl(parts.query, keep_blank_values=True))
+        status, content_type, body = replay.respond(source, f"/{path}", params)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ReplayServer:
+    """Serveur HTTP local rejouant un FixtureStore, source par source.
+
+    Une requête `/<source>/<chemin>?<paramètres>` est servie depuis la
+    réponse enregistrée pour (source, chemin, paramètres) ; une requête
+    inconnue reçoit `missing_status`. `faults` est modifiable à chaud.
+    """
+
+    def __init__(
+        self,
+        store: FixtureStore,
+        faults: dict[str, FaultProfile] | None = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int = 0,
+        missing_status: int = 404,
+    ):
+        self.store = store
+        self.faults = dict(faults or {})
+        self.missing_status = missing_status
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "errors": 0, "missing": 0}
+        self._httpd = ThreadingHTTPServer((host, port), _ReplayHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.replay = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url_for(self, source: str) -> str:
+        """Préfixe d'URL d'une source (à compléter par son chemin d'origine)."""
+        return f"{self.url}/{source}"
+
+    def respond(self, source: str, path: str, params: dict) -> tuple[int, str, bytes]:
+        """Réponse à servir, après la latence et les erreurs simulées de `source`."""
+        fault = self.faults.get(source)
+        with self._lock:
+            self.stats["requests"] += 1
+            delay = fault.latency + self._random.uniform(-1, 1) * fault.jitter if fault else 0.0
+            failed = fault is not None and self._random.random() < fault.error_rate
+        if delay > 0:
+            time.sleep(delay)
+        if failed:
+            with self._lock:
+                self.stats["errors"] += 1
+            return fault.error_status, "text/plain", b"erreur simulee"
+
+        found = self.store.get(source, path, params)
+        if found is None:
+            with self._lock:
+                self.stats["missing"] += 1
+            logger.debug(
+                f"❓ Rejeu • requête non enregistrée : {request_key(source, path, params)}"
+            )
+            return self.missing_status, "text/plain", b"non enregistree"
+        return found
+
+    def serve_forever(self) -> None:
+        """Sert dans le thread courant (ligne de commande)."""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def start(self) -> ReplayServer:
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="replay-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> ReplayServer:
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def replay_services(server: ReplayServer, transport: HttpTransport | None = None) -> dict:
+    """Clients des trois sources pointés vers `server` (clés de MetaSearchService.services)."""
+    transport = transport or HttpTransport(REPLAY_POLICIES)
+    return {
+        "bnf": BnfService(transport=transport, base_url=f"{server.url_for('bnf')}/api/SRU"),
+        "google": GoogleBooksService(
+            transport=transport, api_url=f"{server.url_for('google')}/books/v1/volumes"
+        ),
+        "openlibrary": OpenLibraryService(
+            transport=transport, base_url=server.url_for("openlibrary")
+        ),
+    }
+
+
+def _parse_faults(specs: list[str]) -> dict[str, FaultProfile]:
+    """ "source=latence[:taux d'erreur]" -> FaultProfile."""
+    faults = {}
+    for spec in specs:
+        source, _, values = spec.partition("=")
+        latency, _, error_rate = values.partition(":")
+        faults[source] = FaultProfile(
+            latency=float(latency or 0), error_rate=float(error_rate or 0)
+        )
+    return faults
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m libapp.services.http_replay",
+        description="Enregistrement et rejeu des réponses BnF / Google Books / OpenLibrary.",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    record = sub.add_parser("record", help="enregistrer les réponses réelles pour des ISBN")
+    record.add_argument("directory")
+    record.add_argument("isbns", nargs="+")
+    serve = sub.add_parser("serve", help="rejouer un dossier d'enregistrements")
+    serve.add_argument("directory")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument(
+        "--fault", action="append", default=[], help="source=latence[:taux d'erreur]"
+    )
+    args = parser.parse_args()
+
+    fixtures = FixtureStore(args.directory)
+    if args.command == "record":
+        recorder = RecordingTransport(fixtures)
+        clients = [
+            BnfService(transport=recorder),
+            GoogleBooksService(transport=recorder),
+            OpenLibraryService(transport=recorder),
+        ]
+        for isbn in args.isbns:
+            for client in clients:
+                try:
+                    client.search_by_isbn(isbn)
+                except Exception as e:
+                    print(f"{type(client).__name__} • {isbn} : {e}")
+        print(f"{len(fixtures)} réponse(s) dans {fixtures.directory}")
+    else:
+        replay_server = ReplayServer(fixtures, _parse_faults(args.fault), port=args.port)
+        print(f"Rejeu de {len(fixtures)} réponse(s) sur {replay_server.url} (Ctrl+C pour arrêter)")
+        for source in SOURCES:
+            print(f"  {source}: {replay_server.url_for(source)}")
+        try:
+            replay_server.serve_forever()
+        except KeyboardInterrupt:
+            pass
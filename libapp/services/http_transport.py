@@ -0,0 +1,240 @@
+"""
+Transport HTTP partagé par les clients bibliographiques (BnF, Google Books, OpenLibrary).
+
+Plutôt qu'un `requests.get` (ou `urlopen`) par requête, qui paie à chaque
+fois une connexion TCP et une poignée de main TLS, les clients passent par
+un HttpTransport qui conserve une `requests.Session` par source et par hôte :
+connexions keep-alive réutilisées, pool borné, réponses gzip, nouvelles
+tentatives avec backoff exponentiel sur 429/5xx (attente `Retry-After`
+plafonnée) et timeouts propres à chaque source.
+
+Ce module définit :
+- SourcePolicy: Timeouts, tentatives, débit et taille de pool d'une source.
+- CappedRetry: Nouvelles tentatives urllib3 à attente Retry-After plafonnée.
+- TokenBucket: Limiteur de débit (seau à jetons) partagé par les threads.
+- HttpTransport: Les sessions poolées et la méthode `get`.
+- get_transport: Instance partagée par défaut.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (compatible; BibApp/1.0)"
+
+# Codes HTTP pour lesquels une nouvelle tentative a un sens
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Attente maximale demandée par un en-tête Retry-After avant une nouvelle tentative
+MAX_RETRY_AFTER_S = 5.0
+
+
+@dataclass(frozen=True, slots=True)
+class SourcePolicy:
+    """Paramètres réseau d'une source."""
+
+    connect_timeout: float = 3.05
+    read_timeout: float = 10.0
+    retries: int = 2
+    backoff_factor: float = 0.3  # 0.3 s, 0.6 s, 1.2 s...
+    max_retry_after: float = MAX_RETRY_AFTER_S  # Plafond de l'attente Retry-After
+    pool_maxsize: int = 8
+    rate_per_s: float | None = None  # Requêtes par seconde (None : pas de limite)
+    burst: int = 1  # Requêtes autorisées d'un coup après une pause
+
+    @property
+    def timeout(self) -> tuple[float, float]:
+        """Timeout au format `requests` (connexion, lecture)."""
+        return (self.connect_timeout, self.read_timeout)
+
+
+# Débits volontairement prudents : un enrichissement de nuit ne doit pas nous faire bannir
+DEFAULT_SOURCE_POLICIES: dict[str, SourcePolicy] = {
+    "bnf": SourcePolicy(read_timeout=10.0, rate_per_s=5.0, burst=5),  # SRU lent sur les titres
+    "google": SourcePolicy(read_timeout=6.0, rate_per_s=2.0, burst=4),  # Quota sans clé API
+    "openlibrary": SourcePolicy(read_timeout=8.0, rate_per_s=3.0, burst=3),
+}
+DEFAULT_POLICY = SourcePolicy()
+
+
+class CappedRetry(Retry):
+    """Retry dont l'attente `Retry-After` est plafonnée à `max_retry_after` secondes.
+
+    Un serveur surchargé peut répondre `Retry-After: 3600` : sans plafond, le
+    thread (et l'interface qui attend son résultat) resterait bloqué une heure.
+    """
+
+    def __init__(self, *args, max_retry_after: float = MAX_RETRY_AFTER_S, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_retry_after = max_retry_after
+
+    def new(self, **kw) -> CappedRetry:
+        kw.setdefault("max_retry_after", self.max_retry_after)
+        return super().new(**kw)
+
+    def get_retry_after(self, response) -> float | None:
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, self.max_retry_after)
+
+
+class TokenBucket:
+    """Seau à jetons : `rate` jetons par seconde, au plus `capacity` en réserve."""
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Prend un jeton, en attendant si nécessaire.
+
+        Returns:
+            Le temps d'attente en secondes.
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                delay = (1.0 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class HttpTransport:
+    """Sessions HTTP poolées par (source, hôte), avec retry et timeouts par source."""
+
+    def __init__(
+        self,
+        policies: dict[str, SourcePolicy] | None = None,
+        *,
+        user_agent: str = USER_AGENT,
+    ):
+        """
+        Args:
+            policies: Paramètres par nom de source (fusionnés avec les valeurs par défaut).
+            user_agent: En-tête User-Agent envoyé à toutes les sources.
+        """
+        self.policies = {**DEFAULT_SOURCE_POLICIES, **(policies or {})}
+        self.user_agent = user_agent
+        self._sessions: dict[tuple[str, str], requests.Session] = {}
+        self._buckets: dict[str, TokenBucket | None] = {}
+        self._lock = threading.Lock()
+
+    def policy(self, source: str) -> SourcePolicy:
+        """Paramètres de `source` (DEFAULT_POLICY si inconnue)."""
+        return self.policies.get(source, DEFAULT_POLICY)
+
+    def bucket(self, source: str) -> TokenBucket | None:
+        """Limiteur de débit de `source` (None si la politique n'en définit pas)."""
+        with self._lock:
+            if source not in self._buckets:
+                policy = self.policy(source)
+                self._buckets[source] = (
+                    TokenBucket(policy.rate_per_s, policy.burst) if policy.rate_per_s else None
+                )
+            return self._buckets[source]
+
+    def session_for(self, source: str, url: str) -> requests.Session:
+        """Session de `source` pour l'hôte de `url`, créée au premier appel."""
+        parts = urlsplit(url)
+        key = (source, f"{parts.scheme}://{parts.netloc}")
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._build_session(self.policy(source))
+                self._sessions[key] = session
+                logger.debug(f"🔌 Session HTTP créée pour {source} ({key[1]})")
+            return session
+
+    def _build_session(self, policy: SourcePolicy) -> requests.Session:
+        retry = CappedRetry(
+            total=policy.retries,
+            connect=policy.retries,
+            read=policy.retries,
+            status=policy.retries,
+            backoff_factor=policy.backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
+            max_retry_after=policy.max_retry_after,
+            # Après la dernière tentative, rendre la réponse (le client décide)
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=policy.pool_maxsize, max_retries=retry
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"User-Agent": self.user_agent, "Accept-Encoding": "gzip, deflate"})
+        return session
+
+    def get(
+        self,
+        url: str,
+        *,
+        source: str,
+        params: dict | None = None,
+        timeout: float | tuple[float, float] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> requests.Response:
+        """GET via la session poolée de `source`.
+
+        Args:
+            url: URL absolue.
+            source: Nom de la source ("bnf", "google", "openlibrary"...).
+            params: Paramètres de requête.
+            timeout: Remplace le timeout de la politique de la source.
+            headers: En-têtes supplémentaires.
+
+        Raises:
+            requests.RequestException: Erreur réseau après épuisement des tentatives.
+        """
+        bucket = self.bucket(source)
+        if bucket is not None:
+            waited = bucket.acquire()
+            if waited:
+                logger.debug(f"⏳ {source} • débit limité, attente {waited * 1000:.0f} ms")
+        session = self.session_for(source, url)
+        return session.get(
+            url,
+            params=params,
+            timeout=timeout if timeout is not None else self.policy(source).timeout,
+            headers=headers,
+        )
+
+    def close(self) -> None:
+        """Ferme toutes les sessions (et leurs connexions)."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+_shared_transport: HttpTransport | None = None
+_shared_lock = threading.Lock()
+
+
+def get_transport() -> HttpTransport:
+    """Transport partagé par tous les clients, créé au premier appel."""
+    global _shared_transport
+    with _shared_lock:
+        if _shared_transport is None:
+            _shared_transport = HttpTransport()
+        return _shared_transport
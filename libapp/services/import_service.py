@@ -2,13 +2,17 @@
 Service de gestion de l'import de données depuis des fichiers Excel (XLSX).
 
 Ce module fournit un pipeline complet pour l'import de livres :
-1.  **Parsing** (`parse_xlsx`): Lit un fichier XLSX et le transforme en une
-    liste de dictionnaires Python, un par ligne.
-2.  **Validation** (`validate_rows`): Vérifie la conformité des données lues
-    (champs obligatoires, types, etc.).
+1.  **Parsing** (`iter_xlsx_rows` / `parse_xlsx`): Lit un fichier XLSX et le
+    transforme en lignes normalisées (`BookRow`).
+2.  **Validation** (`iter_validated_rows` / `validate_rows`): Vérifie la
+    conformité des données lues (champs obligatoires, types, etc.).
 3.  **Upsert** (`upsert_rows`): Insère ou met à jour les données dans la base
     de données en appliquant une politique de gestion des doublons
-    (skip, merge, replace).
+    (skip, merge, replace), avec un commit tous les `chunk_size` lignes.
+
+Les variantes `iter_*` sont des générateurs : enchaînées, elles font
+circuler les lignes une à une jusqu'à l'upsert, ce qui garde la mémoire
+bornée quelle que soit la taille du fichier.
 
 Il est conçu pour être utilisé par l'interface utilisateur d'import, en lui
 fournissant des retours sur l'avancement et les erreurs.
@@ -18,19 +22,21 @@ from __future__ import annotations
 
 import csv
 import logging
-from collections.abc import Iterator
-from dataclasses import dataclass
+import threading
+from collections.abc import Iterable, Iterator, Sized
+from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
 from typing import Any, Literal, Protocol
 
 import openpyxl
 from openpyxl import load_workbook
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.orm import Session
 
 from ..persistence.database import get_session  # aligne avec projet courant
-from ..persistence.models_sa import Author, Book  # aligne avec projet courant
-from .types import ImportBatch, ImportErrorItem, ImportResult
+from ..persistence.models_sa import Author, Book, book_authors  # aligne avec projet courant
+from .types import BookRow, ImportBatch, ImportErrorItem, ImportResult
 
 try:
     # Nom actuel
@@ -168,16 +174,54 @@ def _normalize_user_mapping(user_mapping: dict[str, str]) -> dict[str, str]:
     return normalized
 
 
-# --- Parsing XLSX -> ImportBatch ---
+# --- Parsing XLSX -> BookRow ---
+def count_xlsx_rows(file_path: str | Path) -> int | None:
+    """Nombre de lignes de données annoncé par la feuille (None si inconnu)."""
+    wb = load_workbook(filename=str(file_path), read_only=True, data_only=True)
+    try:
+        max_row = wb.active.max_row
+        return max(max_row - 1, 0) if max_row else None
+    finally:
+        wb.close()
+
+
+def iter_xlsx_rows(
+    file_path: str | Path, mapping_ui: dict[str, str], errors: list[ImportErrorItem]
+) -> Iterator[BookRow]:
+    """
+    Lit un XLSX ligne par ligne et produit les lignes normalisées.
+
+    Le classeur est ouvert en lecture seule (streaming openpyxl) : aucune
+    liste de lignes n'est construite. Les erreurs de lecture sont ajoutées
+    au fur et à mesure dans `errors`.
+
+    Args:
+        file_path: Chemin du fichier XLSX.
+        mapping_ui: {champ_interne_EN: 'Header XLSX'}.
+        errors: Liste recevant les erreurs de mapping/lecture.
+    """
+    mapping = _normalize_user_mapping(mapping_ui)
+    wb = load_workbook(filename=str(file_path), read_only=True, data_only=True)
+    try:
+        yield from _iter_sheet_rows(wb.active, mapping, errors)
+    finally:
+        wb.close()
+
+
 def parse_xlsx(file_path: str | Path, mapping_ui: dict[str, str]) -> ImportBatch:
     """
     Lit un XLSX et retourne (rows normalisées, erreurs).
     mapping_ui: {champ_interne_EN: 'Header XLSX'}.
     """
-    mapping = _normalize_user_mapping(mapping_ui)
-    wb = load_workbook(filename=str(file_path), read_only=True, data_only=True)
-    ws = wb.active
+    errors: list[ImportErrorItem] = []
+    rows = list(iter_xlsx_rows(file_path, mapping_ui, errors))
+    return ImportBatch(rows=rows, errors=errors)
+
 
+def _iter_sheet_rows(
+    ws, mapping: dict[str, str], errors: list[ImportErrorItem]
+) -> Iterator[BookRow]:
+    """Produit les lignes normalisées d'une feuille (mapping {header: champ_FR})."""
     header_row = next(ws.iter_rows(min_row=1, max_row=1))
     headers = [
         (
@@ -188,34 +232,21 @@ def parse_xlsx(file_path: str | Path, mapping_ui: dict[str, str]) -> ImportBatch
         for c in header_row
     ]
 
-    errors: list[ImportErrorItem] = []
     col_idx_for_field: dict[str, int] = {}
-    for header_name, field in mapping.items():
+    for header_name, field_name in mapping.items():
         try:
             idx = headers.index(header_name)
-            col_idx_for_field[field] = idx
+            col_idx_for_field[field_name] = idx
         except ValueError:
-            errors.append(ImportErrorItem(0, field, f"Colonne introuvable: {header_name}", "error"))
-
-    @dataclass(slots=True)
-    class BookRow:
-        titre: str
-        sous_titre: str | None = None
-        auteurs: list[str] | None = None
-        isbn: str | None = None
-        editeur: str | None = None
-        date_publication: int | None = None
-        collection: str | None = None
-        tome: int | None = None
-        code_interne: str | None = None
-        mots_cles: list[str] | None = None
-
-    rows: list[BookRow] = []
+            errors.append(
+                ImportErrorItem(0, field_name, f"Colonne introuvable: {header_name}", "error")
+            )
+
     for i, r in enumerate(ws.iter_rows(min_row=2), start=2):
         data: dict[str, object] = {}
-        for field, idx in col_idx_for_field.items():
+        for field_name, idx in col_idx_for_field.items():
             v = r[idx].value
-            data[field] = v.strip() if isinstance(v, str) else v
+            data[field_name] = v.strip() if isinstance(v, str) else v
 
         titre = (str(data.get("titre") or "")).strip()
         if not titre:
@@ -262,34 +293,37 @@ def parse_xlsx(file_path: str | Path, mapping_ui: dict[str, str]) -> ImportBatch
             except Exception:
                 year = None
 
-        rows.append(
-            BookRow(
-                titre=titre,
-                sous_titre=(
-                    str(data.get("sous_titre")).strip() if data.get("sous_titre") else None
-                ),
-                auteurs=auteurs_list,
-                isbn=isbn,
-                editeur=(str(data.get("editeur")).strip() if data.get("editeur") else None),
-                date_publication=year,
-                collection=(
-                    str(data.get("collection")).strip() if data.get("collection") else None
-                ),
-                tome=tome,
-                code_interne=(
-                    str(data.get("code_interne")).strip() if data.get("code_interne") else None
-                ),
-                mots_cles=mots_cles,
-            )
+        yield BookRow(
+            titre=titre,
+            sous_titre=(str(data.get("sous_titre")).strip() if data.get("sous_titre") else None),
+            auteurs=auteurs_list,
+            isbn=isbn,
+            editeur=(str(data.get("editeur")).strip() if data.get("editeur") else None),
+            date_publication=year,
+            collection=(str(data.get("collection")).strip() if data.get("collection") else None),
+            tome=tome,
+            code_interne=(
+                str(data.get("code_interne")).strip() if data.get("code_interne") else None
+            ),
+            mots_cles=mots_cles,
         )
 
-    return ImportBatch(rows=rows, errors=errors)
-
 
 # --- Validation douce ---
-def validate_rows(rows: list, _progress=None) -> tuple[list, list[ImportErrorItem]]:
-    warnings: list[ImportErrorItem] = []
-    out: list = []
+def iter_validated_rows(
+    rows: Iterable, warnings: list[ImportErrorItem], _progress=None, total: int | None = None
+) -> Iterator:
+    """
+    Valide les lignes au fil de l'eau (générateur) et les transmet telles quelles.
+
+    Args:
+        rows: Lignes normalisées (liste ou générateur).
+        warnings: Liste recevant les avertissements.
+        _progress: Callback optionnel (index, total, message).
+        total: Nombre de lignes attendu, pour la progression (0 si inconnu).
+    """
+    if total is None:
+        total = len(rows) if isinstance(rows, Sized) else 0
     for idx, r in enumerate(rows, start=2):
         # isbn normalisé + longueur prudente
         if getattr(r, "isbn", None):
@@ -298,118 +332,302 @@ def validate_rows(rows: list, _progress=None) -> tuple[list, list[ImportErrorIte
                 warnings.append(
                     ImportErrorItem(idx, "isbn", f"Longueur ISBN suspecte: {r.isbn}", "warning")
                 )
-        out.append(r)
+        yield r
         if _progress:
-            _progress(idx, len(rows), "Validation…")
+            _progress(idx, total, "Validation…")
+
+
+def validate_rows(rows: list, _progress=None) -> tuple[list, list[ImportErrorItem]]:
+    warnings: list[ImportErrorItem] = []
+    out = list(iter_validated_rows(rows, warnings, _progress))
     return out, warnings
 
 
-# --- Upsert avec politiques ---
-def _get_author_objs(session: Session, names: list[str]) -> list[Author]:
-    objs: list[Author] = []
-    for name in names:
-        a = session.query(Author).filter_by(name=name).one_or_none()
-        if not a:
-            a = Author(name=name)
-            session.add(a)
-            session.flush()
-        objs.append(a)
-    return objs
+# --- Upsert avec politiques (moteur en masse) ---
+
+# Nombre de lignes importées par transaction (voir Preferences.import_chunk_size)
+DEFAULT_IMPORT_CHUNK_SIZE = 1000
+
+# Taille des lots pour les requêtes `IN (...)` (limite de variables liées SQLite)
+_IN_CHUNK_SIZE = 500
+
+# Champs complétés par la politique "merge" lorsqu'ils sont vides en base
+_MERGE_FIELDS = (
+    "subtitle",
+    "publisher",
+    "year",
+    "collection",
+    "volume",
+    "code_interne",
+    "mots_cles",
+)
+
+# Colonnes de Book relues pour les livres existants (comparaison merge/replace)
+_PREFETCH_COLUMNS = (Book.id, Book.isbn, Book.title, Book.authors_text) + tuple(
+    getattr(Book, name) for name in _MERGE_FIELDS
+)
+
+
+@dataclass(slots=True)
+class _BookState:
+    """État en mémoire d'un livre touché par l'import (existant ou à insérer)."""
+
+    values: dict[str, Any]
+    book_id: int | None = None  # None : livre à insérer
+    authors: list[str] | None = None  # None : liens auteurs inchangés
+    changed: set[str] = field(default_factory=set)
+
+
+def _chunked(items: Iterable[Any], size: int = _IN_CHUNK_SIZE) -> Iterator[list[Any]]:
+    items = list(items)
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _row_values(r) -> tuple[dict[str, Any], list[str]]:
+    """Valeurs des colonnes Book et liste d'auteurs d'une ligne importée."""
+    authors_list = [a for a in (r.auteurs or []) if a]
+    values = {
+        "title": r.titre,
+        "subtitle": getattr(r, "sous_titre", None),
+        "isbn": r.isbn,
+        "publisher": getattr(r, "editeur", None),
+        "year": getattr(r, "date_publication", None),
+        "collection": getattr(r, "collection", None),
+        "volume": getattr(r, "tome", None),
+        "code_interne": getattr(r, "code_interne", None),
+        "mots_cles": ";".join(r.mots_cles) if getattr(r, "mots_cles", None) else None,
+        "authors_text": ", ".join(authors_list) or None,
+    }
+    return values, authors_list
+
+
+def _prefetch_books_by_isbn(
+    session: Session, isbns: Iterable[str]
+) -> tuple[dict[str, _BookState], set[str]]:
+    """
+    Charge en quelques requêtes `IN` les livres existants pour les ISBN donnés.
+
+    Returns:
+        (livres par ISBN, ISBN présents plusieurs fois en base)
+    """
+    known: dict[str, _BookState] = {}
+    ambiguous: set[str] = set()
+    for chunk in _chunked(isbns):
+        for row in session.execute(select(*_PREFETCH_COLUMNS).where(Book.isbn.in_(chunk))):
+            values = row._asdict()
+            book_id = values.pop("id")
+            if values["isbn"] in known:
+                ambiguous.add(values["isbn"])
+            known[values["isbn"]] = _BookState(values=values, book_id=book_id)
+    return known, ambiguous
+
+
+def _author_ids_query(session: Session, names: list[str]) -> list[tuple[str, int]]:
+    stmt = select(Author.name, Author.id).where(Author.name.in_(names))
+    return [tuple(row) for row in session.execute(stmt)]
+
+
+def _resolve_author_ids(session: Session, names: Iterable[str]) -> dict[str, int]:
+    """Retourne {nom: id} des auteurs, en créant d'un bloc ceux qui manquent."""
+    names = set(names)
+    ids: dict[str, int] = {}
+    for chunk in _chunked(names):
+        ids.update(_author_ids_query(session, chunk))
+    missing = [name for name in names if name not in ids]
+    if missing:
+        session.execute(insert(Author), [{"name": name} for name in missing])
+        for chunk in _chunked(missing):
+            ids.update(_author_ids_query(session, chunk))
+    return ids
+
+
+def _write_books(
+    session: Session, new_books: list[_BookState], touched: dict[int, _BookState]
+) -> None:
+    """Écrit en masse les insertions, mises à jour et liens livre-auteurs."""
+    relinked = [s for s in touched.values() if s.authors is not None]
+    author_ids = _resolve_author_ids(
+        session, (name for s in new_books + relinked for name in s.authors or [])
+    )
+
+    # 1. Insertions (executemany, ids renvoyés dans l'ordre des paramètres)
+    if new_books:
+        ids = session.scalars(
+            insert(Book).returning(Book.id, sort_by_parameter_order=True),
+            [s.values for s in new_books],
+        ).all()
+        for state, book_id in zip(new_books, ids, strict=True):
+            state.book_id = book_id
+
+    # 2. Mises à jour par clé primaire (seules les colonnes modifiées)
+    updates = [
+        {"id": s.book_id, **{name: s.values[name] for name in s.changed}}
+        for s in touched.values()
+        if s.changed
+    ]
+    if updates:
+        session.execute(update(Book), updates)
+
+    # 3. Liens livre-auteurs (anciens liens supprimés pour les livres ré-attribués)
+    for chunk in _chunked(s.book_id for s in relinked):
+        session.execute(delete(book_authors).where(book_authors.c.book_id.in_(chunk)))
+    links = [
+        {"book_id": s.book_id, "author_id": author_ids[name]}
+        for s in new_books + relinked
+        for name in dict.fromkeys(s.authors or [])
+    ]
+    if links:
+        session.execute(book_authors.insert(), links)
+
+
+def _upsert_chunk(
+    session: Session,
+    chunk: list[tuple[int, Any]],
+    on_isbn_conflict: str,
+    errors: list[ImportErrorItem],
+) -> tuple[int, int, int]:
+    """
+    Applique la politique de doublon à un lot de lignes numérotées et l'écrit.
+
+    Les livres existants et les auteurs sont préchargés en quelques requêtes
+    `IN`, les décisions skip/merge/replace sont prises en mémoire (un ISBN
+    répété dans le lot est traité comme un doublon du livre inséré plus
+    haut), puis les écritures sont faites en masse (executemany).
+
+    Returns:
+        (inserted, updated, skipped) pour ce lot (non commité).
+    """
+    inserted = updated = skipped = 0
+
+    prepared: list[tuple[int, dict[str, Any], list[str]]] = []
+    for i, r in chunk:
+        try:
+            values, authors_list = _row_values(r)
+        except Exception as e:
+            errors.append(ImportErrorItem(i, "row", f"{type(e).__name__}: {e}", "error"))
+            continue
+        prepared.append((i, values, authors_list))
+
+    known, ambiguous = _prefetch_books_by_isbn(
+        session, {values["isbn"] for _, values, _ in prepared if values["isbn"]}
+    )
+    new_books: list[_BookState] = []
+    touched: dict[int, _BookState] = {}
+
+    for i, values, authors_list in prepared:
+        isbn = values["isbn"]
+        if isbn in ambiguous:
+            message = f"MultipleResultsFound: ISBN {isbn} présent plusieurs fois"
+            errors.append(ImportErrorItem(i, "row", message, "error"))
+            continue
+
+        state = known.get(isbn) if isbn else None
+        if state is None:
+            # insert
+            state = _BookState(values=values, authors=authors_list)
+            new_books.append(state)
+            if isbn:
+                known[isbn] = state
+            inserted += 1
+        elif on_isbn_conflict == "skip":
+            skipped += 1
+        else:
+            if on_isbn_conflict == "replace":
+                state.values.update(values)
+                state.changed.update(values)
+                state.authors = authors_list
+            else:
+                # merge doux : ne complète que les champs vides
+                for name in _MERGE_FIELDS:
+                    if state.values[name] in (None, "") and values[name] not in (None, ""):
+                        state.values[name] = values[name]
+                        state.changed.add(name)
+                if not state.values["authors_text"] and authors_list:
+                    state.values["authors_text"] = values["authors_text"]
+                    state.changed.add("authors_text")
+                    state.authors = authors_list
+            if state.book_id is not None:
+                touched[state.book_id] = state
+            updated += 1
+
+    _write_books(session, new_books, touched)
+    return inserted, updated, skipped
 
 
 def upsert_rows(
-    rows: list, on_isbn_conflict: Literal["skip", "merge", "replace"] = "merge", _progress=None
+    rows: Iterable,
+    on_isbn_conflict: Literal["skip", "merge", "replace"] = "merge",
+    _progress=None,
+    *,
+    chunk_size: int = DEFAULT_IMPORT_CHUNK_SIZE,
+    total: int | None = None,
+    cancel_event: threading.Event | None = None,
 ) -> ImportResult:
+    """
+    Insère ou met à jour les livres importés selon la politique de doublon ISBN.
+
+    Les lignes sont consommées par lots de `chunk_size` (une liste ou un
+    générateur, voir `iter_xlsx_rows`) et chaque lot est commité dans sa
+    propre transaction : la mémoire reste bornée et un échec n'annule que le
+    lot en cours (signalé dans les erreurs), les lots précédents restant
+    enregistrés.
+
+    L'annulation est coopérative : `cancel_event` est consulté avant chaque
+    écriture de lot. Le lot en cours est alors abandonné sans rien écrire et
+    le résultat porte `cancelled=True`.
+
+    Args:
+        rows: Lignes normalisées (`BookRow`).
+        on_isbn_conflict: Politique si l'ISBN existe déjà ("skip", "merge" ou "replace").
+        _progress: Callback optionnel (index, total, message), appelé après chaque lot.
+        chunk_size: Nombre de lignes par transaction.
+        total: Nombre de lignes attendu, pour la progression (0 si inconnu).
+        cancel_event: Événement optionnel demandant l'arrêt de l'import.
+
+    Returns:
+        ImportResult avec statistiques (inserted, updated, skipped, errors, cancelled)
+    """
+    if total is None:
+        total = len(rows) if isinstance(rows, Sized) else 0
+    chunk_size = max(1, chunk_size)
     inserted = updated = skipped = 0
     errors: list[ImportErrorItem] = []
-    with get_session() as session:
-        for i, r in enumerate(rows, start=2):
+    cancelled = False
+
+    numbered = enumerate(rows, start=2)
+    while chunk := list(islice(numbered, chunk_size)):
+        if cancel_event is not None and cancel_event.is_set():
+            cancelled = True
+            logger.info(f"⏹️ Import annulé avant la ligne {chunk[0][0]}")
+            break
+        first, last = chunk[0][0], chunk[-1][0]
+        # Erreurs par ligne du lot : écartées si le lot est annulé (rien n'est écrit)
+        chunk_errors: list[ImportErrorItem] = []
+        with get_session() as session:
             try:
-                existing = None
-                if getattr(r, "isbn", None):
-                    existing = session.execute(
-                        select(Book).where(Book.isbn == r.isbn)
-                    ).scalar_one_or_none()
-                if existing is None:
-                    # insert
-                    authors_list = [a for a in (r.auteurs or []) if a]
-                    b = Book(
-                        title=r.titre,
-                        subtitle=getattr(r, "sous_titre", None),
-                        isbn=r.isbn,
-                        publisher=getattr(r, "editeur", None),
-                        year=getattr(r, "date_publication", None),
-                        collection=getattr(r, "collection", None),
-                        volume=getattr(r, "tome", None),
-                        code_interne=getattr(r, "code_interne", None),
-                        mots_cles=(
-                            ";".join(r.mots_cles) if getattr(r, "mots_cles", None) else None
-                        ),
-                        authors_text=", ".join(authors_list) or None,
-                    )
-                    session.add(b)
-                    session.flush()
-                    if authors_list:
-                        b.authors = _get_author_objs(session, authors_list)
-                    inserted += 1
-                else:
-                    if on_isbn_conflict == "skip":
-                        skipped += 1
-                        continue
-                    elif on_isbn_conflict == "replace":
-                        existing.title = r.titre
-                        existing.subtitle = getattr(r, "sous_titre", None)
-                        existing.isbn = r.isbn
-                        existing.publisher = getattr(r, "editeur", None)
-                        existing.year = getattr(r, "date_publication", None)
-                        existing.collection = getattr(r, "collection", None)
-                        existing.volume = getattr(r, "tome", None)
-                        existing.code_interne = getattr(r, "code_interne", None)
-                        existing.mots_cles = (
-                            ";".join(r.mots_cles) if getattr(r, "mots_cles", None) else None
-                        )
-                        authors_list = [a for a in (r.auteurs or []) if a]
-                        existing.authors_text = ", ".join(authors_list) or None
-                        existing.authors = _get_author_objs(session, authors_list)
-                        updated += 1
-                    else:
-                        # merge doux
-                        def choose(cur, new, join=False):
-                            if cur in (None, "") and new not in (None, "", []):
-                                return ";".join(new) if join else new
-                            return cur
-
-                        existing.subtitle = choose(
-                            existing.subtitle, getattr(r, "sous_titre", None)
-                        )
-                        existing.isbn = choose(existing.isbn, r.isbn)
-                        existing.publisher = choose(existing.publisher, getattr(r, "editeur", None))
-                        existing.year = choose(existing.year, getattr(r, "date_publication", None))
-                        existing.collection = choose(
-                            existing.collection, getattr(r, "collection", None)
-                        )
-                        existing.volume = choose(existing.volume, getattr(r, "tome", None))
-                        existing.code_interne = choose(
-                            existing.code_interne, getattr(r, "code_interne", None)
-                        )
-                        existing.mots_cles = choose(
-                            existing.mots_cles, getattr(r, "mots_cles", None), join=True
-                        )
-                        authors_list = [a for a in (r.auteurs or []) if a]
-                        if not existing.authors_text and authors_list:
-                            existing.authors_text = ", ".join(authors_list) or None
-                            existing.authors = _get_author_objs(session, authors_list)
-                        updated += 1
+                counts = _upsert_chunk(session, chunk, on_isbn_conflict, chunk_errors)
+                session.commit()
             except Exception as e:
-                errors.append(ImportErrorItem(i, "row", f"{type(e).__name__}: {e}", "error"))
-            if _progress:
-                _progress(i, len(rows), "Enregistrement…")
-        try:
-            session.commit()
-        except Exception:
-            session.rollback()
-            raise
-    return ImportResult(inserted=inserted, updated=updated, skipped=skipped, errors=errors)
+                session.rollback()
+                logger.error(f"❌ Import : lot des lignes {first}-{last} annulé ({e})")
+                message = f"{type(e).__name__}: {e} (lignes {first}-{last} annulées)"
+                chunk_errors = [ImportErrorItem(first, "row", message, "error")]
+                counts = (0, 0, 0)
+        errors.extend(chunk_errors)
+        inserted += counts[0]
+        updated += counts[1]
+        skipped += counts[2]
+        if _progress:
+            _progress(last, total, "Enregistrement…")
+
+    return ImportResult(
+        inserted=inserted,
+        updated=updated,
+        skipped=skipped,
+        errors=errors,
+        cancelled=cancelled,
+    )
 
 
 # ============================================================================
@@ -478,21 +696,23 @@ def parse_members_xlsx(file_path: str | Path, mapping_ui: dict[str, str]) -> Imp
     col_idx_for_field: dict[str, int] = {}
 
     # Mapper les colonnes
-    for header_name, field in mapping.items():
+    for header_name, field_name in mapping.items():
         try:
             idx = headers.index(header_name)
-            col_idx_for_field[field] = idx
+            col_idx_for_field[field_name] = idx
         except ValueError:
-            errors.append(ImportErrorItem(0, field, f"Colonne introuvable: {header_name}", "error"))
+            errors.append(
+                ImportErrorItem(0, field_name, f"Colonne introuvable: {header_name}", "error")
+            )
 
     rows: list[MemberRow] = []
 
     # Parser les lignes
     for i, r in enumerate(ws.iter_rows(min_row=2), start=2):
         data: dict[str, any] = {}
-        for field, idx in col_idx_for_field.items():
+        for field_name, idx in col_idx_for_field.items():
             v = r[idx].value
-            data[field] = v.strip() if isinstance(v, str) else v
+            data[field_name] = v.strip() if isinstance(v, str) else v
 
         # Champs requis
         numero = (str(data.get("numero_membre") or "")).strip()
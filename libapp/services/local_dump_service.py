@@ -0,0 +1,374 @@
+"""
+Résolution d'ISBN hors ligne depuis un dump bibliographique local.
+
+Les sites mal connectés ne peuvent pas compter sur BnF/OpenLibrary pour
+chaque notice. Un dump (éditions OpenLibrary en JSONL/TSV, ou export
+MARCXML INTERMARC de la BnF), éventuellement compressé, est ingéré en flux
+dans une base SQLite indexée par ISBN-13 ; la mémoire utilisée ne dépend
+pas de la taille du dump. MetaSearchService consulte cette base avant le
+réseau : une recherche ISBN y coûte une lecture de clé primaire.
+
+Ce module définit :
+- LocalDumpService: Base de consultation (ingestion, recherche par ISBN).
+- open_dump / iter_openlibrary_rows / iter_marcxml_rows: Lecture en flux des dumps.
+- get_local_dump: Instance partagée, si une base a été ingérée.
+
+Ingestion en ligne de commande :
+    python -m libapp.services.local_dump_service ingest ol_dump_editions.txt.gz
+"""
+
+from __future__ import annotations
+
+import bz2
+import gzip
+import io
+import json
+import logging
+import lzma
+import sqlite3
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import IO
+
+from ..utils.paths import user_data_dir
+from .bnf_service import _book_from_index, _local_name, _record_isbns, index_marc_record
+from .openlibrary_service import ExtBook
+from .utils import clean_author, to_isbn13
+
+logger = logging.getLogger(__name__)
+
+# Nom de la source dans les résultats de MetaSearchService
+LOCAL_SOURCE = "Local"
+
+FORMATS = ("openlibrary", "marcxml")
+
+# Lignes insérées par transaction pendant l'ingestion
+INGEST_BATCH_SIZE = 10_000
+# ISBN par requête `IN (...)` (limite de variables SQLite)
+LOOKUP_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS editions (
+    isbn TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    subtitle TEXT,
+    authors TEXT NOT NULL,
+    publisher TEXT,
+    published TEXT,
+    origin TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+_COLUMNS = "isbn, title, subtitle, authors, publisher, published, origin"
+
+Row = tuple[str, str, str | None, str, str | None, str | None, str]
+
+
+# ---------- Lecture des dumps ----------
+
+
+def open_dump(path: str | Path) -> IO[bytes]:
+    """Ouvre un dump en binaire, décompressé à la volée selon l'extension (.gz, .bz2, .xz)."""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".gz":
+        return gzip.open(path, "rb")
+    if suffix == ".bz2":
+        return bz2.open(path, "rb")
+    if suffix in (".xz", ".lzma"):
+        return lzma.open(path, "rb")
+    return open(path, "rb")
+
+
+def guess_format(path: str | Path) -> str:
+    """ "marcxml" pour un fichier .xml (compressé ou non), sinon "openlibrary"."""
+    suffixes = [s.lower() for s in Path(path).suffixes]
+    return "marcxml" if ".xml" in suffixes else "openlibrary"
+
+
+def _authors_json(authors: Iterable[str]) -> str:
+    cleaned = []
+    for author in authors:
+        author = clean_author(author)
+        if author and author not in cleaned:
+            cleaned.append(author)
+    return json.dumps(cleaned, ensure_ascii=False)
+
+
+def iter_openlibrary_rows(stream: IO[bytes]) -> Iterator[Row]:
+    """Lignes à indexer d'un dump d'éditions OpenLibrary.
+
+    Accepte le format officiel (TSV : type, clé, révision, date, JSON) comme
+    un JSONL d'éditions. Une ligne par ISBN-13 distinct de chaque édition.
+    """
+    for line in io.TextIOWrapper(stream, encoding="utf-8", errors="replace"):
+        line = line.strip()
+        if not line:
+            continue
+        payload = line if line.startswith("{") else line.rsplit("\t", 1)[-1]
+        try:
+            edition = json.loads(payload)
+        except ValueError:
+            continue
+        if not isinstance(edition, dict) or not edition.get("title"):
+            continue
+        title = edition["title"]
+
+        isbns = {
+            to_isbn13(str(isbn))
+            for isbn in (edition.get("isbn_13") or []) + (edition.get("isbn_10") or [])
+        }
+        isbns.discard(None)
+        if not isbns:
+            continue
+
+        # Les éditions du dump ne référencent les auteurs que par clé
+        names = [
+            str(a["name"])
+            for a in edition.get("authors") or []
+            if isinstance(a, dict) and a.get("name")
+        ]
+        if not names and edition.get("by_statement"):
+            names = [str(edition["by_statement"])]
+        publishers = edition.get("publishers") or []
+        publisher = str(publishers[0]) if publishers else None
+
+        row_tail = (
+            str(title),
+            edition.get("subtitle"),
+            _authors_json(names),
+            publisher,
+            edition.get("publish_date"),
+            "openlibrary",
+        )
+        for isbn in isbns:
+            yield (isbn, *row_tail)
+
+
+def iter_marcxml_rows(stream: IO[bytes]) -> Iterator[Row]:
+    """Lignes à indexer d'un export MARCXML INTERMARC (collection ou réponse SRU).
+
+    Chaque notice est indexée puis retirée de l'arbre dès sa balise fermante.
+    """
+    stack: list[ET.Element] = []
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            stack.append(elem)
+            continue
+        stack.pop()
+        if _local_name(elem.tag) != "record":
+            continue
+
+        index = index_marc_record(elem)
+        book = _book_from_index(index) if index else None
+        if book is not None:
+            isbns = {to_isbn13(value) for value in _record_isbns(index)}
+            isbns.discard(None)
+            row_tail = (
+                book.titre,
+                book.sous_titre,
+                _authors_json(book.auteurs),
+                book.editeur,
+                book.date_publication,
+                "bnf",
+            )
+            for isbn in isbns:
+                yield (isbn, *row_tail)
+
+        # Mémoire constante : la notice traitée quitte l'arbre
+        elem.clear()
+        if stack:
+            stack[-1].remove(elem)
+
+
+# ---------- Base de consultation ----------
+
+
+class LocalDumpService:
+    """Base SQLite ISBN-13 -> notice, alimentée par un ou plusieurs dumps."""
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path else local_dump_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        # Le verrou ne protège que la connexion de consultation ; l'ingestion
+        # écrit sur sa propre connexion (WAL : lectures non bloquées)
+        self._lock = threading.Lock()
+        self._ingest_lock = threading.Lock()
+
+    def ingest(
+        self,
+        dump_path: str | Path,
+        *,
+        fmt: str | None = None,
+        batch_size: int = INGEST_BATCH_SIZE,
+        progress: Callable[[int], None] | None = None,
+    ) -> int:
+        """Ingère un dump en flux (insertion par lots, ISBN existants remplacés).
+
+        L'ingestion utilise une connexion dédiée : les recherches restent
+        possibles pendant toute sa durée et voient chaque lot dès son commit.
+
+        Args:
+            dump_path: Fichier du dump (.gz/.bz2/.xz acceptés).
+            fmt: "openlibrary" ou "marcxml" (deviné depuis l'extension par défaut).
+            batch_size: Lignes par transaction.
+            progress: Appelé avec le nombre de lignes insérées après chaque lot.
+
+        Returns:
+            Nombre de lignes (ISBN) insérées.
+        """
+        fmt = fmt or guess_format(dump_path)
+        if fmt not in FORMATS:
+            raise ValueError(f"Format de dump inconnu : {fmt} (attendu : {', '.join(FORMATS)})")
+        reader = iter_marcxml_rows if fmt == "marcxml" else iter_openlibrary_rows
+
+        started = time.perf_counter()
+        total = 0
+        sql = f"INSERT OR REPLACE INTO editions ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)"
+        with open_dump(dump_path) as stream, self._ingest_lock:
+            conn = sqlite3.connect(self.path)
+            try:
+                # Base reconstructible : durabilité sacrifiée au débit (cette connexion seule)
+                conn.execute("PRAGMA synchronous=OFF")
+                batch: list[Row] = []
+                for row in reader(stream):
+                    batch.append(row)
+                    if len(batch) >= batch_size:
+                        total += self._insert(conn, sql, batch)
+                        batch = []
+                        if progress:
+                            progress(total)
+                if batch:
+                    total += self._insert(conn, sql, batch)
+                    if progress:
+                        progress(total)
+            finally:
+                conn.close()
+
+        logger.info(
+            f"✅ Dump {Path(dump_path).name} ingéré : {total} ISBN "
+            f"en {time.perf_counter() - started:.1f} s"
+        )
+        return total
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, sql: str, rows: list[Row]) -> int:
+        with conn:
+            conn.executemany(sql, rows)
+        return len(rows)
+
+    def search_by_isbn(self, isbn: str) -> ExtBook | None:
+        """Notice de l'ISBN (ISBN-10 ou 13), ou None s'il n'est pas dans le dump."""
+        key = to_isbn13(isbn or "")
+        if not key:
+            return None
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM editions WHERE isbn = ?", (key,)
+            ).fetchone()
+        return _row_to_book(row) if row else None
+
+    def search_many_isbns(self, isbns: Iterable[str]) -> dict[str, ExtBook | None]:
+        """Notices d'un lot d'ISBN : {isbn demandé: ExtBook ou None}."""
+        found: dict[str, ExtBook | None] = {}
+        keys: dict[str, list[str]] = {}
+        for isbn in isbns:
+            if isbn in found:
+                continue
+            found[isbn] = None
+            key = to_isbn13(isbn or "")
+            if key:
+                keys.setdefault(key, []).append(isbn)
+
+        wanted = list(keys)
+        for start in range(0, len(wanted), LOOKUP_CHUNK):
+            chunk = wanted[start : start + LOOKUP_CHUNK]
+            placeholders = ", ".join("?" * len(chunk))
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT {_COLUMNS} FROM editions WHERE isbn IN ({placeholders})", chunk
+                ).fetchall()
+            for row in rows:
+                book = _row_to_book(row)
+                for requested in keys[row[0]]:
+                    found[requested] = book
+        return found
+
+    def count(self) -> int:
+        """Nombre d'ISBN indexés."""
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM editions").fetchone()
+        return count
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _row_to_book(row: Row) -> ExtBook:
+    isbn, title, subtitle, authors, publisher, published, _origin = row
+    return ExtBook(
+        titre=title,
+        sous_titre=subtitle,
+        auteurs=json.loads(authors),
+        isbn=isbn,
+        editeur=publisher,
+        date_publication=published,
+        collection=None,
+    )
+
+
+_shared_dump: LocalDumpService | None = None
+_shared_lock = threading.Lock()
+
+
+def local_dump_path() -> Path:
+    """Fichier de la base de consultation, dans le dossier de données utilisateur."""
+    return user_data_dir() / "cache" / "local_dump.sqlite3"
+
+
+def get_local_dump() -> LocalDumpService | None:
+    """Instance partagée, ou None tant qu'aucun dump n'a été ingéré."""
+    global _shared_dump
+    with _shared_lock:
+        if _shared_dump is None and local_dump_path().exists():
+            _shared_dump = LocalDumpService(local_dump_path())
+            logger.info(f"✅ Dump local ouvert : {_shared_dump.path}")
+        return _shared_dump
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m libapp.services.local_dump_service",
+        description="Ingestion d'un dump bibliographique pour la recherche ISBN hors ligne.",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    ingest = sub.add_parser("ingest", help="ingérer un dump (OpenLibrary ou MARCXML)")
+    ingest.add_argument("dump", help="fichier du dump (.gz, .bz2, .xz acceptés)")
+    ingest.add_argument("--format", choices=FORMATS, help="format (deviné par défaut)")
+    ingest.add_argument("--db", help=f"base cible (défaut : {local_dump_path()})")
+    lookup = sub.add_parser("lookup", help="chercher un ISBN dans la base")
+    lookup.add_argument("isbn")
+    lookup.add_argument("--db")
+    args = parser.parse_args()
+
+    service = LocalDumpService(args.db)
+    if args.command == "ingest":
+        count = service.ingest(
+            args.dump,
+            fmt=args.format,
+            progress=lambda n: print(f"\r{n} ISBN indexés", end="", file=sys.stderr),
+        )
+        print(f"\nIngestion terminée : {count} ISBN ({service.count()} dans {service.path})")
+    else:
+        print(service.search_by_isbn(args.isbn) or "ISBN absent du dump local")
+    service.close()
@@ -8,18 +8,32 @@ en utilisant différentes stratégies et en fusionnant les résultats.
 from __future__ import annotations
 
 import concurrent.futures
+import functools
+import json
 import logging
+import threading
 import time
 from abc import ABC, abstractmethod
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 
 # Import des services existants
-from .bnf_service import BnfBook, BnfService
+from .bnf_service import ISBN_BATCH_SIZE, BnfBook, BnfService
 from .googlebooks_service import GoogleBooksService
+from .local_dump_service import LOCAL_SOURCE, get_local_dump
+from .metadata_cache import (
+    MetadataCache,
+    get_metadata_cache,
+    get_single_flight,
+    isbn_key,
+    title_author_key,
+)
 from .openlibrary_service import OpenLibraryService
+from .source_health import LatencyTracker, SourceHealth, get_source_health
 
 logger = logging.getLogger(__name__)
 
@@ -39,15 +53,17 @@ class CacheEntry:
 
 
 class SimpleCache:
-    """Cache mémoire simple avec TTL."""
+    """Cache mémoire simple avec TTL, borné (éviction LRU)."""
 
-    def __init__(self):
-        self._cache: dict[str, CacheEntry] = {}
+    def __init__(self, max_entries: int = 256):
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.max_entries = max_entries
 
     def get(self, key: str) -> list[UnifiedBookResult] | None:
         """Récupère une entrée du cache si elle existe et n'est pas expirée."""
         entry = self._cache.get(key)
         if entry and not entry.is_expired:
+            self._cache.move_to_end(key)
             return entry.data
         elif entry:
             # Nettoie l'entrée expirée
@@ -57,6 +73,9 @@ class SimpleCache:
     def set(self, key: str, data: list[UnifiedBookResult]) -> None:
         """Stocke une entrée dans le cache."""
         self._cache[key] = CacheEntry(data=data, created_at=datetime.now())
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
 
     def clear(self) -> None:
         """Vide le cache."""
@@ -65,6 +84,34 @@ class SimpleCache:
 
 _global_cache = SimpleCache()
 
+# Recherches ISBN simultanées de search_many_isbns (le débit réel est borné
+# par les limiteurs de chaque source dans le transport HTTP)
+BATCH_CONCURRENCY = 4
+
+_executors: dict[tuple[str, int], ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def _shared_executor(name: str, max_workers: int) -> ThreadPoolExecutor:
+    """Pool de threads durable, partagé par nom et taille (jamais recréé par appel)."""
+    key = (name, max_workers)
+    with _executors_lock:
+        executor = _executors.get(key)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+            _executors[key] = executor
+        return executor
+
+
+# Sources de la recherche progressive (nom affiché, clé dans MetaSearchService.services),
+# soumises par ordre de fiabilité
+PROGRESSIVE_SOURCES = (("BnF", "bnf"), ("Google Books", "google"), ("OpenLibrary", "openlibrary"))
+
+
+def _clean_isbn(isbn: str) -> str:
+    """ISBN sans espaces ni tirets."""
+    return isbn.strip().replace("-", "").replace(" ", "")
+
 
 @dataclass(slots=True)
 class _SourceMetric:
@@ -73,7 +120,7 @@ class _SourceMetric:
     source: str
     started: float
     ended: float = 0.0
-    status: str = "success"  # success | timeout | error
+    status: str = "success"  # success | timeout | error | cancelled | skipped
     results_count: int = 0
     error: str = ""
 
@@ -136,6 +183,7 @@ class UnifiedBookResult:
             "BnF": 1.0,  # Le plus fiable
             "Google Books": 0.8,  # Très bon
             "OpenLibrary": 0.6,  # Correct
+            LOCAL_SOURCE: 0.9,  # Dump BnF/OpenLibrary consulté hors ligne
         }
         score += source_scores.get(self.source.name, 0.5) * 30
 
@@ -192,6 +240,65 @@ class UnifiedBookResult:
         self._score = self._calculate_quality_score()
 
 
+def _results_to_json(results: list[UnifiedBookResult]) -> str:
+    """Sérialise des résultats pour le cache persistant (score recalculé au chargement)."""
+    payload = []
+    for result in results:
+        data = asdict(result)
+        data.pop("_score", None)
+        payload.append(data)
+    # raw_data peut contenir des valeurs non JSON (dates...) : repli sur str()
+    return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+def _results_from_json(payload: str) -> list[UnifiedBookResult]:
+    """Inverse de `_results_to_json`."""
+    results = []
+    for data in json.loads(payload):
+        source = SearchSourceInfo(**data.pop("source"))
+        results.append(UnifiedBookResult(source=source, **data))
+    return results
+
+
+class SearchResults(list):
+    """Résultats d'une recherche multi-sources, avec les sources restées sans réponse.
+
+    `failed` ({source: erreur}) non vide : une source n'a pas répondu (erreur,
+    timeout, disjoncteur ouvert), l'absence de résultat n'est donc pas établie
+    et la recherche n'est pas mise en cache.
+    """
+
+    def __init__(self, results: Iterable[UnifiedBookResult] = (), failed=None):
+        super().__init__(results)
+        self.failed: dict[str, str] = dict(failed or {})
+
+
+def failed_sources(results: list[UnifiedBookResult]) -> dict[str, str]:
+    """Sources en échec d'une recherche ({} pour une liste ordinaire)."""
+    return getattr(results, "failed", None) or {}
+
+
+def _failure_summary(failed: dict[str, str]) -> str:
+    """ "BnF (503 Server Error), Google Books (timeout)"."""
+    return ", ".join(f"{source} ({error})" for source, error in failed.items())
+
+
+@dataclass(slots=True)
+class IsbnLookup:
+    """Résultat de la résolution d'un ISBN par search_many_isbns."""
+
+    isbn: str
+    results: list[UnifiedBookResult] = field(default_factory=list)
+    # Échec de la recherche pour cet ISBN uniquement (ou des sources sans réponse :
+    # les résultats éventuels sont partiels et ne sont pas mis en cache)
+    error: str | None = None
+    from_cache: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 class SearchSource(Enum):
     """Sources de recherche disponibles."""
 
@@ -274,6 +381,15 @@ class SearchResultAdapter:
         )
 
 
+# Sources interrogées par paquets d'ISBN par search_many_isbns, dans l'ordre :
+# (nom, clé de service, confiance, conversion vers UnifiedBookResult)
+BATCH_SOURCES = (
+    (LOCAL_SOURCE, "local", 0.9, SearchResultAdapter.from_ext_book),
+    ("BnF", "bnf", 0.95, SearchResultAdapter.from_bnf_book),
+    ("OpenLibrary", "openlibrary", 0.75, SearchResultAdapter.from_ext_book),
+)
+
+
 # ==================== STRATEGIES PATTERN ====================
 
 
@@ -299,6 +415,7 @@ class SequentialSearchStrategy(SearchStrategy):
     def search_by_isbn(self, isbn: str, services: dict[str, any]) -> list[UnifiedBookResult]:
         """Recherche séquentielle par ISBN."""
         results = []
+        failed: dict[str, str] = {}
 
         # Ordre de priorité: BnF, Google Books, OpenLibrary
         search_order = [
@@ -365,16 +482,18 @@ class SequentialSearchStrategy(SearchStrategy):
             except Exception as e:
                 response_time = time.time() - start_time
                 logger.info(f"❌ Erreur recherche {source_name}: {e}")
+                failed[source_name] = str(e)
                 # On continue avec le service suivant
                 continue
 
-        return results
+        return SearchResults(results, failed)
 
     def search_by_title_author(
         self, title: str, author: str, services: dict[str, any]
     ) -> list[UnifiedBookResult]:
         """Recherche séquentielle par titre/auteur."""
         results = []
+        failed: dict[str, str] = {}
 
         search_order = [
             ("BnF", services.get("bnf")),
@@ -444,9 +563,10 @@ class SequentialSearchStrategy(SearchStrategy):
 
             except Exception as e:
                 logger.error(f"❌ Erreur recherche {source_name}: {e}")
+                failed[source_name] = str(e)
                 continue
 
-        return results
+        return SearchResults(results, failed)
 
 
 # ==================== CLASSE PRINCIPALE ====================
@@ -457,15 +577,16 @@ class MetaSearchService:
     Service de recherche bibliographique multi-sources.
 
     Coordonne les recherches sur BnF, Google Books et OpenLibrary
-    avec différentes stratégies et un système de cache.
+    avec différentes stratégies et un cache persistant (voir metadata_cache).
     """
 
-    def __init__(self, strategy: SearchStrategy = None):
+    def __init__(self, strategy: SearchStrategy = None, cache: MetadataCache | None = None):
         """
         Initialize le MetaSearchService.
 
         Args:
             strategy: Stratégie de recherche (par défaut: SequentialSearchStrategy)
+            cache: Cache des résultats (par défaut: cache SQLite partagé du profil)
         """
         self.strategy = strategy or SequentialSearchStrategy()
 
@@ -475,13 +596,22 @@ class MetaSearchService:
             "google": GoogleBooksService(),
             "openlibrary": OpenLibraryService(),
         }
+        # Dump ingéré localement (local_dump_service) : consulté avant le réseau
+        local = get_local_dump()
+        if local is not None:
+            self.services["local"] = local
 
-        # Cache simple en mémoire (ISBN -> List[UnifiedBookResult])
-        self._isbn_cache: dict[str, list[UnifiedBookResult]] = {}
-        self._title_cache: dict[str, list[UnifiedBookResult]] = {}
+        # Cache persistant (clé normalisée -> List[UnifiedBookResult]), partagé entre instances
+        self.cache = cache or get_metadata_cache(encode=_results_to_json, decode=_results_from_json)
+        # Recherches en vol, partagées entre instances : une requête réseau par clé
+        self.flights = get_single_flight()
 
         logger.info(f"✅ MetaSearchService initialisé avec {type(self.strategy).__name__}")
 
+    def _store(self, key: str, results: list[UnifiedBookResult]) -> None:
+        """Met en cache les résultats (liste vide = cache négatif)."""
+        self.cache.set(key, results, sources=(r.source.name for r in results))
+
     def search_by_isbn(self, isbn: str, use_cache: bool = True) -> list[UnifiedBookResult]:
         """
         Recherche un livre par ISBN.
@@ -496,27 +626,342 @@ class MetaSearchService:
         if not isbn or not isbn.strip():
             return []
 
-        isbn_clean = isbn.strip().replace("-", "").replace(" ", "")
+        isbn_clean = _clean_isbn(isbn)
+        cache_key = isbn_key(isbn_clean)
 
         # Vérifier le cache
-        if use_cache and isbn_clean in self._isbn_cache:
-            logger.info(f"✅ Résultat ISBN {isbn_clean} trouvé dans le cache")
-            return self._isbn_cache[isbn_clean]
+        if use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(
+                    f"💾 ISBN {isbn_clean} trouvé dans le cache ({len(cached)} résultat(s))"
+                )
+                return cached
 
-        # Recherche via la stratégie
+        # Recherche via la stratégie (partagée avec un appel identique en cours)
         logger.info(f"✅ Recherche ISBN {isbn_clean} via {type(self.strategy).__name__}")
-        results = self.strategy.search_by_isbn(isbn_clean, self.services)
+        results = self._coalesced(
+            cache_key, lambda: self._lookup_isbn(isbn_clean), use_cache=use_cache
+        )
 
-        # Trier par score de qualité (décroissant)
-        results.sort(key=lambda r: r.score, reverse=True)
+        logger.info(f"✅ Trouvé {len(results)} résultats pour ISBN {isbn_clean}")
+        return results
 
-        # Mettre en cache
-        if use_cache:
-            self._isbn_cache[isbn_clean] = results
+    def _coalesced(
+        self, cache_key: str, search: Callable[[], list[UnifiedBookResult]], *, use_cache: bool
+    ) -> list[UnifiedBookResult]:
+        """Exécute `search` une seule fois pour les appels simultanés de même clé.
 
-        logger.info(f"✅ Trouvé {len(results)} résultats pour ISBN {isbn_clean}")
+        Le premier appelant relit le cache (une recherche identique vient
+        peut-être de se terminer), cherche puis remplit le cache avant de
+        libérer la clé ; les autres reçoivent une copie du même résultat.
+        Une recherche dont une source n'a pas répondu n'est pas mise en cache.
+        """
+
+        def run() -> list[UnifiedBookResult]:
+            if use_cache:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return cached
+            results = search()
+            failed = failed_sources(results)
+            if failed:
+                logger.warning(
+                    f"⚠️ {cache_key} • non mis en cache, sans réponse de : "
+                    f"{_failure_summary(failed)}"
+                )
+            elif use_cache:
+                self._store(cache_key, results)
+            return results
+
+        results, shared = self.flights.do(cache_key, run)
+        return SearchResults(results, failed_sources(results)) if shared else results
+
+    def _lookup_isbn(
+        self, isbn_clean: str, skip: frozenset[str] = frozenset()
+    ) -> list[UnifiedBookResult]:
+        """Recherche un ISBN (dump local, sinon stratégie), triés par score (décroissant).
+
+        `skip` : clés des services ayant déjà répondu sans résultat (requête groupée),
+        que la stratégie n'interroge pas une seconde fois.
+        """
+        if "local" not in skip:
+            local_results = self._lookup_local(isbn_clean)
+            if local_results:
+                return local_results
+        services = {key: svc for key, svc in self.services.items() if key not in skip}
+        results = self.strategy.search_by_isbn(isbn_clean, services)
+        results.sort(key=lambda r: r.score, reverse=True)
         return results
 
+    def _lookup_local(self, isbn_clean: str) -> list[UnifiedBookResult]:
+        """Notice du dump local pour cet ISBN (liste vide sans dump ou si absent)."""
+        local = self.services.get("local")
+        if local is None:
+            return []
+        started = time.perf_counter()
+        book = local.search_by_isbn(isbn_clean)
+        if book is None:
+            return []
+        source_info = SearchSourceInfo(
+            name=LOCAL_SOURCE, confidence=0.9, response_time=time.perf_counter() - started
+        )
+        return [SearchResultAdapter.from_ext_book(book, source_info)]
+
+    def search_many_isbns(
+        self,
+        isbns: Iterable[str],
+        *,
+        use_cache: bool = True,
+        concurrency: int = BATCH_CONCURRENCY,
+    ) -> Iterator[IsbnLookup]:
+        """
+        Résout un lot d'ISBN (enrichissement d'un catalogue importé).
+
+        Les ISBN absents du cache sont d'abord cherchés par paquets à la BnF
+        (une requête SRU pour ISBN_BATCH_SIZE ISBN), puis à OpenLibrary (API
+        multi-clés) ; seuls les ISBN non trouvés passent par la stratégie
+        courante dans un pool de threads durable, qui n'interroge que les
+        sources n'ayant pas déjà répondu pour eux. Au plus `2 * concurrency` ISBN sont en vol, ce qui permet
+        de consommer un itérable de plusieurs milliers d'ISBN sans tout
+        soumettre d'un coup. Le débit par source est borné par le transport HTTP.
+
+        Args:
+            isbns: ISBN à résoudre (doublons et valeurs vides ignorés).
+            use_cache: Si True, sert et alimente le cache persistant.
+            concurrency: Nombre de recherches ISBN simultanées.
+
+        Yields:
+            Un IsbnLookup par ISBN, dans l'ordre d'achèvement. Une erreur sur un
+            ISBN est rapportée dans son IsbnLookup sans interrompre le lot.
+        """
+        concurrency = max(1, concurrency)
+        executor = _shared_executor("meta-search-batch", concurrency)
+        in_flight: dict[Future, str] = {}
+        seen: set[str] = set()
+        source = self._prefetch_isbns(isbns, seen, use_cache=use_cache)
+        exhausted = False
+
+        try:
+            while True:
+                # Alimenter la fenêtre de recherches en vol
+                while not exhausted and len(in_flight) < 2 * concurrency:
+                    item = next(source, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    if isinstance(item, IsbnLookup):
+                        yield item
+                        continue
+                    isbn, answered = item
+                    search = functools.partial(self._lookup_isbn, isbn, skip=answered)
+                    fut = executor.submit(
+                        self._coalesced, isbn_key(isbn), search, use_cache=use_cache
+                    )
+                    in_flight[fut] = isbn
+
+                if not in_flight:
+                    break
+
+                done, _ = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for fut in done:
+                    isbn = in_flight.pop(fut)
+                    try:
+                        results = fut.result()
+                    except Exception as e:
+                        logger.warning(f"⚠️ Lot ISBN • {isbn} en échec : {e}")
+                        yield IsbnLookup(isbn, error=str(e))
+                        continue
+                    failed = failed_sources(results)
+                    yield IsbnLookup(isbn, results, error=_failure_summary(failed) or None)
+        finally:
+            # Consommateur arrêté en cours de route : abandonner ce qui n'a pas démarré
+            for fut in in_flight:
+                fut.cancel()
+
+        logger.info(f"✅ Lot ISBN terminé • {len(seen)} ISBN distinct(s)")
+
+    def _prefetch_isbns(
+        self, isbns: Iterable[str], seen: set[str], *, use_cache: bool
+    ) -> Iterator[IsbnLookup | tuple[str, frozenset[str]]]:
+        """Résout ce qui peut l'être sans recherche unitaire : cache, puis BnF par lots.
+
+        Yields:
+            Un IsbnLookup pour chaque ISBN résolu, sinon (ISBN nettoyé, services
+            ayant déjà répondu sans résultat) à confier à la stratégie.
+        """
+        batch: list[str] = []
+        for raw in isbns:
+            isbn = _clean_isbn(raw or "")
+            if not isbn or isbn in seen:
+                continue
+            seen.add(isbn)
+            if use_cache:
+                cached = self.cache.get(isbn_key(isbn))
+                if cached is not None:
+                    yield IsbnLookup(isbn, cached, from_cache=True)
+                    continue
+            batch.append(isbn)
+            if len(batch) >= ISBN_BATCH_SIZE:
+                yield from self._batch_resolve(batch, use_cache=use_cache)
+                batch = []
+        if batch:
+            yield from self._batch_resolve(batch, use_cache=use_cache)
+
+    def _batch_resolve(
+        self, isbns: list[str], *, use_cache: bool
+    ) -> Iterator[IsbnLookup | tuple[str, frozenset[str]]]:
+        """Requêtes multi-ISBN (BATCH_SOURCES, dans l'ordre) ; les ISBN non trouvés
+        sont rendus avec les clés des services qui ont répondu sans les connaître.
+
+        Un lot en échec compte comme un échec de la source (disjoncteur) : ses
+        ISBN restent à chercher, y compris auprès de cette source.
+        """
+        health = get_source_health()
+        remaining = isbns
+        answered: set[str] = set()
+        for source_name, service_key, confidence, convert in BATCH_SOURCES:
+            service = self.services.get(service_key)
+            if not remaining or not hasattr(service, "search_many_isbns"):
+                continue
+            if not health.allow(source_name):
+                continue
+
+            started = time.perf_counter()
+            try:
+                books = service.search_many_isbns(remaining)
+            except Exception as e:
+                health.record_failure(source_name)
+                logger.warning(f"⚠️ Lot ISBN • requête {source_name} groupée en échec : {e}")
+                continue
+            elapsed = time.perf_counter() - started
+            # La latence d'un lot n'est pas comparable à celle d'une recherche unitaire
+            health.record_success(source_name, None, elapsed)
+            answered.add(service_key)
+
+            source_info = SearchSourceInfo(
+                name=source_name, confidence=confidence, response_time=elapsed
+            )
+            misses = []
+            for isbn in remaining:
+                book = books.get(isbn)
+                if book is None:
+                    misses.append(isbn)
+                    continue
+                results = [convert(book, source_info)]
+                if use_cache:
+                    self._store(isbn_key(isbn), results)
+                yield IsbnLookup(isbn, results)
+            logger.info(
+                f"📚 Lot ISBN • {source_name} groupée : "
+                f"{len(remaining) - len(misses)}/{len(remaining)} ISBN en {elapsed:.2f} s"
+            )
+            remaining = misses
+        skip = frozenset(answered)
+        for isbn in remaining:
+            yield isbn, skip
+
+    def iter_search_by_source(
+        self, isbn: str = "", title: str = "", author: str = "", *, use_cache: bool = True
+    ) -> Iterator[tuple[str, list[UnifiedBookResult]]]:
+        """
+        Recherche progressive : un lot de résultats par source, dès qu'elle répond.
+
+        Toutes les sources sont interrogées en parallèle (soumises dans l'ordre
+        PROGRESSIVE_SOURCES) ; chaque source est bornée par son propre timeout
+        HTTP, sans attendre la plus lente pour livrer les autres. Une source
+        dont le disjoncteur est ouvert n'est pas interrogée. Comme pour
+        l'enrichissement classique, la recherche titre/auteur n'est lancée que
+        si l'ISBN ne donne rien. Les résultats complets de chaque étape sont
+        mis en cache, sauf si une source n'a pas répondu (erreur, disjoncteur
+        ouvert) ; un résultat en cache est livré sous la source "cache".
+
+        Args:
+            isbn: ISBN à rechercher (optionnel)
+            title: Titre, pour l'étape de repli (optionnel)
+            author: Auteur, pour l'étape de repli (optionnel)
+            use_cache: Si True, utilise le cache local
+
+        Yields:
+            (nom de la source, résultats de cette source), dans l'ordre d'arrivée.
+        """
+        # Stratégie courante si elle sait livrer source par source, sinon parallèle
+        iter_by_source = getattr(self.strategy, "iter_by_source", None)
+        if iter_by_source is None:
+            iter_by_source = ParallelSearchStrategy().iter_by_source
+        steps = []
+        if isbn and isbn.strip():
+            isbn_clean = _clean_isbn(isbn)
+            tasks = {name: ("search_by_isbn", isbn_clean) for name, _ in PROGRESSIVE_SOURCES}
+            steps.append((isbn_key(isbn_clean), tasks))
+        if title and title.strip():
+            title, author = title.strip(), (author or "").strip()
+            tasks = {
+                "BnF": ("search_by_title_author", (title, author)),
+                "Google Books": ("search_by_title_author", (title, author)),
+                "OpenLibrary": ("search_by_title", title),
+            }
+            steps.append((title_author_key(title, author), tasks))
+
+        for cache_key, tasks in steps:
+            if use_cache:
+                cached = self.cache.get(cache_key)
+                if cached:
+                    yield "cache", cached
+                    return
+                if cached is not None:
+                    continue  # Résultat négatif en cache : étape suivante
+
+            if cache_key.startswith("isbn:"):
+                local_results = self._lookup_local(isbn_clean)
+                if local_results:
+                    yield LOCAL_SOURCE, local_results
+                    return
+
+            # Recherche identique déjà en cours ailleurs (import, éditeur) : la rejoindre
+            pending = self.flights.in_flight(cache_key)
+            if pending is not None:
+                try:
+                    shared = pending.result()
+                except Exception:
+                    shared = None
+                if shared:
+                    yield "cache", list(shared)
+                    return
+                if shared is not None and not failed_sources(shared):
+                    continue  # Toutes les sources ont répondu sans résultat
+
+            search_tasks = [
+                (source_name, service, *tasks[source_name])
+                for source_name, service_key in PROGRESSIVE_SOURCES
+                if (service := self.services.get(service_key)) is not None
+            ]
+            found: list[UnifiedBookResult] = []
+            failed: dict[str, str] = {}
+            stream = iter_by_source(search_tasks)
+            try:
+                for source_name, source_results, error in stream:
+                    if error is not None:
+                        failed[source_name] = error
+                    found.extend(source_results)
+                    yield source_name, source_results
+            finally:
+                # Consommateur arrêté en cours de route : annule les sources pas encore démarrées
+                stream.close()
+
+            found.sort(key=lambda r: r.score, reverse=True)
+            if failed:
+                logger.warning(
+                    f"⚠️ {cache_key} • non mis en cache, sans réponse de : "
+                    f"{_failure_summary(failed)}"
+                )
+            elif use_cache:
+                self._store(cache_key, found)
+            if found:
+                return
+
     def search_by_title_author(
         self, title: str, author: str = "", use_cache: bool = True
     ) -> list[UnifiedBookResult]:
@@ -534,38 +979,43 @@ class MetaSearchService:
         if not title or not title.strip():
             return []
 
-        cache_key = f"{title.strip().lower()}:{author.strip().lower()}"
+        author = author or ""
+        cache_key = title_author_key(title, author)
 
         # Vérifier le cache
-        if use_cache and cache_key in self._title_cache:
-            logger.info("✅ Résultat titre/auteur trouvé dans le cache")
-            return self._title_cache[cache_key]
+        if use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"💾 Titre/auteur trouvé dans le cache ({len(cached)} résultat(s))")
+                return cached
 
-        # Recherche via la stratégie
+        # Recherche via la stratégie (partagée avec un appel identique en cours)
         logger.info(
             f"✅ Recherche titre '{title}' auteur '{author}' via {type(self.strategy).__name__}"
         )
-        results = self.strategy.search_by_title_author(title.strip(), author.strip(), self.services)
 
-        # Trier par score de qualité (décroissant)
-        results.sort(key=lambda r: r.score, reverse=True)
+        def search() -> list[UnifiedBookResult]:
+            found = self.strategy.search_by_title_author(
+                title.strip(), author.strip(), self.services
+            )
+            # Trier par score de qualité (décroissant)
+            found.sort(key=lambda r: r.score, reverse=True)
+            return found
 
-        # Mettre en cache
-        if use_cache:
-            self._title_cache[cache_key] = results
+        results = self._coalesced(cache_key, search, use_cache=use_cache)
 
         logger.info(f"✅ Trouvé {len(results)} résultats pour titre '{title}'")
         return results
 
     def clear_cache(self):
         """Vide le cache de recherche."""
-        self._isbn_cache.clear()
-        self._title_cache.clear()
+        self.cache.clear()
         logger.info("✅ Cache vidé")
 
-    def get_cache_stats(self) -> dict[str, int]:
-        """Retourne les statistiques du cache."""
-        return {"isbn_entries": len(self._isbn_cache), "title_entries": len(self._title_cache)}
+    def get_cache_stats(self) -> dict[str, int | float]:
+        """Retourne les statistiques du cache (hits, misses, entrées, évictions...)
+        et le nombre de recherches partagées avec un appel identique en cours."""
+        return {**self.cache.stats(), "coalesced": self.flights.stats()["shared"]}
 
     def set_strategy(self, strategy: SearchStrategy):
         """Change la stratégie de recherche."""
@@ -576,24 +1026,81 @@ class MetaSearchService:
 # ==================== STRATÉGIES AVANCÉES ====================
 
 
+@dataclass(frozen=True, slots=True)
+class CompletionPolicy:
+    """Quand une recherche ISBN parallèle s'arrête-t-elle ?
+
+    - good_score: Dès qu'un résultat atteint ce score, on rend la main
+      (None : attendre toutes les sources ou le timeout global).
+    - hedge: Interroger d'abord la source prioritaire seule, puis lancer la
+      suivante si elle n'a pas répondu après le percentile `hedge_quantile`
+      de ses latences observées (ou aussitôt si elle répond sans résultat).
+      Sans hedge, toutes les sources partent ensemble.
+    - cancel_losers: Annuler les requêtes pas encore démarrées et ne pas
+      attendre celles en cours une fois la recherche terminée.
+    """
+
+    good_score: float | None = 70.0
+    hedge: bool = True
+    hedge_quantile: float = 0.95
+    default_hedge_delay: float = 1.0  # Tant que les latences sont inconnues
+    min_hedge_delay: float = 0.05
+    cancel_losers: bool = True
+
+    @classmethod
+    def wait_all(cls) -> CompletionPolicy:
+        """Ancien comportement : toutes les sources, jusqu'au timeout global."""
+        return cls(good_score=None, hedge=False)
+
+
+def _unanswered(metrics: dict[str, _SourceMetric]) -> dict[str, str]:
+    """Sources interrogeables restées sans réponse : erreur, timeout ou disjoncteur ouvert.
+
+    Une source abandonnée parce qu'une autre a déjà donné un bon résultat ne compte pas.
+    """
+    return {
+        name: m.error or m.status
+        for name, m in metrics.items()
+        if m.status in ("error", "timeout", "skipped")
+    }
+
+
 class ParallelSearchStrategy(SearchStrategy):
-    """Stratégie parallèle avec timeouts globaux et par source."""
+    """Stratégie parallèle avec timeouts globaux et par source.
+
+    Les recherches ISBN suivent une CompletionPolicy (premier bon résultat,
+    couverture après le p95 de la source prioritaire) ; les recherches
+    titre/auteur interrogent toujours toutes les sources pour proposer un choix.
+    Une source dont le disjoncteur est ouvert (SourceHealth) est ignorée, et
+    le timeout de chaque source suit ses latences observées.
+    """
 
     def __init__(
         self,
         timeout: float = 5.0,
         max_workers: int = 3,
         source_timeouts: dict[str, float] | None = None,
+        policy: CompletionPolicy | None = None,
+        latency: LatencyTracker | None = None,
+        health: SourceHealth | None = None,
     ) -> None:
         """Initialise la stratégie.
 
         Args:
             timeout: Timeout global d’attente des futures en secondes.
-            max_workers: Nombre maximal de workers du pool threads.
-            source_timeouts: Timeouts individuels par source.
+            max_workers: Nombre de sources interrogées simultanément par recherche.
+            source_timeouts: Timeouts par source tant qu'aucune latence n'a été observée.
+            policy: Politique de complétion des recherches ISBN.
+            latency: Latences observées par source (tracker partagé par défaut).
+            health: Disjoncteurs et timeouts adaptatifs (état partagé par défaut).
         """
         self.timeout = timeout
         self.max_workers = max_workers
+        self.policy = policy or CompletionPolicy()
+        if health is None:
+            health = SourceHealth(latency) if latency is not None else get_source_health()
+        self.health = health
+        self.latency = health.latency
         self.source_timeouts = source_timeouts or {
             "BnF": 3.0,
             "OpenLibrary": 4.0,
@@ -602,10 +1109,170 @@ class ParallelSearchStrategy(SearchStrategy):
         self.cache = _global_cache
         logger.debug("✅  META SEARCH SERVICE LOADED")
 
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Pool durable partagé, dimensionné pour BATCH_CONCURRENCY recherches simultanées.
+
+        Contrairement à un `with ThreadPoolExecutor(...)` par appel, une source
+        en timeout ne bloque pas le retour : sa tâche se termine en arrière-plan.
+        """
+        return _shared_executor("meta-search-sources", self.max_workers * BATCH_CONCURRENCY)
+
     @property
     def duration_ms(self) -> int:
         return int((self.ended - self.started) * 1000)
 
+    @staticmethod
+    def latency_key(source_name: str, method_name: str) -> str:
+        """Clé du LatencyTracker : une recherche ISBN et une recherche titre ne se comparent pas."""
+        return f"{source_name}:{method_name}"
+
+    def hedge_delay(self, latency_key: str, policy: CompletionPolicy) -> float:
+        """Délai avant de couvrir la source de `latency_key` par la suivante."""
+        delay = self.latency.percentile(latency_key, policy.hedge_quantile)
+        if delay is None:
+            delay = policy.default_hedge_delay
+        return min(self.timeout, max(policy.min_hedge_delay, delay))
+
+    def source_timeout(self, source_name: str, latency_key: str) -> float:
+        """Timeout d'une source : déduit de ses latences, sinon `source_timeouts`."""
+        default = self.source_timeouts.get(source_name, self.timeout)
+        return min(self.timeout, self.health.timeout_for(latency_key, default))
+
+    def _run_with_policy(
+        self, search_tasks: list[tuple], policy: CompletionPolicy
+    ) -> tuple[list[UnifiedBookResult], dict[str, _SourceMetric]]:
+        """Exécute les tâches (par ordre de priorité) selon `policy`.
+
+        Returns:
+            Les résultats reçus et les métriques par source interrogée.
+        """
+        executor = self.executor
+        pending = list(search_tasks)
+        future_to_source: dict[Future, str] = {}
+        latency_keys: dict[str, str] = {}
+        source_deadlines: dict[str, float] = {}
+        metrics: dict[str, _SourceMetric] = {}
+        results: list[UnifiedBookResult] = []
+        deadline = time.perf_counter() + self.timeout
+        next_hedge: float | None = None
+        winner: str | None = None
+
+        def launch() -> None:
+            """Lance la prochaine source dont le disjoncteur n'est pas ouvert."""
+            nonlocal next_hedge
+            while pending:
+                source_name, service, method_name, query = pending.pop(0)
+                if not self.health.allow(source_name):
+                    now = time.perf_counter()
+                    metrics[source_name] = _SourceMetric(
+                        source=source_name, started=now, ended=now, status="skipped"
+                    )
+                    logger.info("⛔ %s • disjoncteur ouvert, source ignorée", source_name)
+                    continue
+
+                key = latency_keys[source_name] = self.latency_key(source_name, method_name)
+                started = time.perf_counter()
+                metrics[source_name] = _SourceMetric(source=source_name, started=started)
+                source_deadlines[source_name] = started + self.source_timeout(source_name, key)
+                fut = executor.submit(
+                    self._search_single_source, source_name, service, method_name, query, True
+                )
+                future_to_source[fut] = source_name
+                next_hedge = None
+                if policy.hedge and pending:
+                    next_hedge = started + self.hedge_delay(key, policy)
+                    logger.debug(
+                        "🕐 %s lancé • couverture dans %.0f ms",
+                        source_name,
+                        (next_hedge - started) * 1000,
+                    )
+                return
+
+        def give_up(fut: Future, source_name: str, status: str) -> None:
+            """Abandonne une source encore en vol (annulée si pas démarrée)."""
+            m = metrics[source_name]
+            m.ended = time.perf_counter()
+            m.status = status
+            if status == "timeout":
+                # Borne inférieure de la latence réelle : fait monter le timeout des sources lentes
+                self.health.record_failure(
+                    source_name, latency_keys[source_name], m.ended - m.started
+                )
+                logger.info("⏱️ %s • %d ms • timeout", source_name, m.duration_ms)
+            else:
+                self.health.release(source_name)
+            if policy.cancel_losers and not fut.cancel():
+                logger.debug("🚫 %s • Abandonnée (réponse ignorée)", source_name)
+
+        launch()
+        while pending and not policy.hedge:
+            launch()
+
+        while future_to_source:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            wake_at = min(
+                [deadline]
+                + [source_deadlines[name] for name in future_to_source.values()]
+                + ([next_hedge] if next_hedge is not None else [])
+            )
+            done, _ = concurrent.futures.wait(
+                future_to_source.keys(),
+                timeout=max(0.0, wake_at - now),
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+
+            for fut in done:
+                source_name = future_to_source.pop(fut)
+                m = metrics[source_name]
+                m.ended = time.perf_counter()
+                try:
+                    value = fut.result()
+                except Exception as exc:
+                    m.status = "error"
+                    m.error = str(exc)
+                    self.health.record_failure(source_name)
+                    logger.error("❌ %s • %d ms • erreur: %s", source_name, m.duration_ms, m.error)
+                    continue
+                # Accepte soit [UnifiedBookResult,...], soit ( [UnifiedBookResult,...], <info> )
+                source_results = value[0] if isinstance(value, tuple) else value
+                m.results_count = len(source_results) if source_results else 0
+                m.status = "success"
+                self.health.record_success(
+                    source_name, latency_keys[source_name], m.ended - m.started
+                )
+                logger.info(
+                    "✅ %s • %d ms • %d résultat(s)", source_name, m.duration_ms, m.results_count
+                )
+                if source_results:
+                    results.extend(source_results)
+                    if policy.good_score is not None and winner is None:
+                        if any(r.score >= policy.good_score for r in source_results):
+                            winner = source_name
+
+            if winner is not None:
+                logger.info("🏁 %s • résultat satisfaisant, arrêt de la recherche", winner)
+                break
+
+            # Sources ayant dépassé leur propre timeout
+            now = time.perf_counter()
+            for fut, source_name in list(future_to_source.items()):
+                if now >= source_deadlines[source_name]:
+                    del future_to_source[fut]
+                    give_up(fut, source_name, "timeout")
+
+            # Couverture : la source en cours tarde, ou plus rien n'est en vol
+            if pending and (not future_to_source or (next_hedge is not None and now >= next_hedge)):
+                launch()
+
+        # Sources toujours en vol : gagnant trouvé (annulées) ou timeout global
+        for fut, source_name in future_to_source.items():
+            give_up(fut, source_name, "cancelled" if winner is not None else "timeout")
+
+        return results, metrics
+
     def search_by_isbn(self, isbn: str, services: dict[str, any]) -> list[UnifiedBookResult]:
         """Recherche parallèle par ISBN avec cache."""
         # 🆕 Vérifier le cache d'abord
@@ -622,79 +1289,16 @@ class ParallelSearchStrategy(SearchStrategy):
         # Préparer les tâches de recherche
         search_tasks = []
 
+        # Par ordre de priorité : la couverture (hedging) suit cet ordre
         if services.get("bnf"):
             search_tasks.append(("BnF", services["bnf"], "search_by_isbn", isbn))
-        if services.get("openlibrary"):
-            search_tasks.append(("OpenLibrary", services["openlibrary"], "search_by_isbn", isbn))
         if services.get("google"):
             search_tasks.append(("Google Books", services["google"], "search_by_isbn", isbn))
+        if services.get("openlibrary"):
+            search_tasks.append(("OpenLibrary", services["openlibrary"], "search_by_isbn", isbn))
 
-        # Exécution parallèle
-        metrics: dict[str, _SourceMetric] = {}
-
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_source = {}
-            for source_name, service, method_name, query in search_tasks:
-                metrics[source_name] = _SourceMetric(
-                    source=source_name, started=time.perf_counter()
-                )
-                fut = executor.submit(
-                    self._search_single_source, source_name, service, method_name, query
-                )
-                future_to_source[fut] = source_name
-
-            logger.debug("🕐 Démarrage wait() avec timeout=%ss", self.timeout)
-            done, not_done = concurrent.futures.wait(future_to_source.keys(), timeout=self.timeout)
-            logger.debug("🕐 Fin wait() - done:%d not_done:%d", len(done), len(not_done))
-
-            for fut in done:
-                source_name = future_to_source[fut]
-                m = metrics[source_name]  # ✅ Assigner m d'abord !
-                try:
-                    value = fut.result()
-                    # Accepte soit [UnifiedBookResult,...], soit ( [UnifiedBookResult,...], <info> )
-                    if isinstance(value, tuple):
-                        source_results = value[0]
-                    else:
-                        source_results = value
-                    m.ended = time.perf_counter()
-                    m.results_count = len(source_results) if source_results else 0
-                    m.status = "success"
-                    logger.info(
-                        "✅ %s • %d ms • %d résultat(s)",
-                        source_name,
-                        m.duration_ms,
-                        m.results_count,
-                    )
-                    if source_results:
-                        results.extend(source_results)
-                except Exception as exc:
-                    m.ended = time.perf_counter()
-                    m.status = "error"
-                    m.error = str(exc)
-                    logger.error("❌ %s • %d ms • erreur: %s", source_name, m.duration_ms, m.error)
-
-            for fut in not_done:
-                source_name = future_to_source[fut]
-                m = metrics[source_name]
-
-                # Tentative d'annulation avec vérification
-                try:
-                    was_cancelled = fut.cancel()
-                    if was_cancelled:
-                        logger.debug("🚫 %s • Annulation réussie", source_name)
-                    else:
-                        logger.debug(
-                            "⚠️ %s • Annulation impossible (tâche déjà en cours)", source_name
-                        )
-                except Exception as e:
-                    logger.warning("❌ %s • Erreur lors de l'annulation: %s", source_name, e)
-
-                m.ended = m.started + self.timeout
-                m.status = "timeout"
-                logger.info(
-                    "⏱️ %s • %d ms • timeout après %ss", source_name, m.duration_ms, self.timeout
-                )
+        # Exécution selon la politique de complétion
+        results, metrics = self._run_with_policy(search_tasks, self.policy)
 
         # Résumé agrégé de la recherche
         if metrics:
@@ -713,11 +1317,12 @@ class ParallelSearchStrategy(SearchStrategy):
                 len(results),
             )
 
-        if results:
+        failed = _unanswered(metrics)
+        if results and not failed:
             self.cache.set(cache_key, results)
             logger.info("💾 Résultats mis en cache pour ISBN %s", isbn)
 
-        return results
+        return SearchResults(results, failed)
 
     def search_by_title_author(
         self, title: str, author: str, services: dict[str, any]
@@ -735,8 +1340,6 @@ class ParallelSearchStrategy(SearchStrategy):
         logger.info("🔍 Cache MISS pour '%s' par '%s' • recherche en cours", title, author)
 
         setup_start = time.perf_counter()
-        results = []
-
         search_tasks = []
 
         if services.get("bnf"):
@@ -755,71 +1358,8 @@ class ParallelSearchStrategy(SearchStrategy):
 
         logger.info(f"✅ Nombre de tâches créées: {len(search_tasks)}")
         setup_time = (time.perf_counter() - setup_start) * 1000
-        metrics: dict[str, _SourceMetric] = {}
-
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_source = {}
-            for source_name, service, method_name, query in search_tasks:
-                metrics[source_name] = _SourceMetric(
-                    source=source_name, started=time.perf_counter()
-                )
-                fut = executor.submit(
-                    self._search_single_source, source_name, service, method_name, query
-                )
-                future_to_source[fut] = source_name
-
-            logger.debug("🕐 Démarrage wait() avec timeout=%ss", self.timeout)
-            done, not_done = concurrent.futures.wait(future_to_source.keys(), timeout=self.timeout)
-            logger.debug("🕐 Fin wait() - done:%d not_done:%d", len(done), len(not_done))
-
-            for fut in done:
-                source_name = future_to_source[fut]
-                m = metrics[source_name]  # ✅ Assigner m d'abord !
-                try:
-                    value = fut.result()
-                    # Accepte soit [UnifiedBookResult,...], soit ( [UnifiedBookResult,...], <info> )
-                    if isinstance(value, tuple):
-                        source_results = value[0]
-                    else:
-                        source_results = value
-                    m.ended = time.perf_counter()
-                    m.results_count = len(source_results) if source_results else 0
-                    m.status = "success"
-                    logger.info(
-                        "✅ %s • %d ms • %d résultat(s)",
-                        source_name,
-                        m.duration_ms,
-                        m.results_count,
-                    )
-                    if source_results:
-                        results.extend(source_results)
-                except Exception as exc:
-                    m.ended = time.perf_counter()
-                    m.status = "error"
-                    m.error = str(exc)
-                    logger.error("❌ %s • %d ms • erreur: %s", source_name, m.duration_ms, m.error)
-
-            for fut in not_done:
-                source_name = future_to_source[fut]
-                m = metrics[source_name]
-
-                # Tentative d'annulation avec vérification
-                try:
-                    was_cancelled = fut.cancel()
-                    if was_cancelled:
-                        logger.debug("🚫 %s • Annulation réussie", source_name)
-                    else:
-                        logger.debug(
-                            "⚠️ %s • Annulation impossible (tâche déjà en cours)", source_name
-                        )
-                except Exception as e:
-                    logger.warning("❌ %s • Erreur lors de l'annulation: %s", source_name, e)
-
-                m.ended = m.started + self.timeout
-                m.status = "timeout"
-                logger.info(
-                    "⏱️ %s • %d ms • timeout après %ss", source_name, m.duration_ms, self.timeout
-                )
+        # Toutes les sources : l'utilisateur choisit parmi les résultats
+        results, metrics = self._run_with_policy(search_tasks, CompletionPolicy.wait_all())
 
         # Résumé agrégé
         if metrics:
@@ -838,7 +1378,9 @@ class ParallelSearchStrategy(SearchStrategy):
                 len(results),
             )
 
-        if results:
+        failed = _unanswered(metrics)
+        cache_time = 0.0
+        if results and not failed:
             cache_start = time.perf_counter()
             self.cache.set(cache_key, results)
             cache_time = (time.perf_counter() - cache_start) * 1000
@@ -850,15 +1392,63 @@ class ParallelSearchStrategy(SearchStrategy):
             "⏱️ PROFIL total • %.1fms (setup:%.1f cache:%.1f)",
             total_time,
             setup_time,
-            cache_time if results else 0.0,
+            cache_time,
         )
 
-        return results
+        return SearchResults(results, failed)
+
+    def iter_by_source(
+        self, search_tasks: list[tuple]
+    ) -> Iterator[tuple[str, list[UnifiedBookResult], str | None]]:
+        """Interroge toutes les sources à la fois ; un lot de résultats par source, dès qu'elle répond.
+
+        Chaque source est bornée par son propre timeout HTTP, sans attendre la
+        plus lente pour livrer les autres. Une source dont le disjoncteur est
+        ouvert n'est pas interrogée. Arrêter l'itération annule les sources pas
+        encore démarrées.
+
+        Args:
+            search_tasks: (source, service, méthode, requête), soumises dans l'ordre.
+
+        Yields:
+            (source, résultats, erreur) dans l'ordre d'arrivée ; `erreur` vaut None
+            si la source a répondu, "skipped" si son disjoncteur est ouvert.
+        """
+        futures: dict[Future, str] = {}
+        skipped: list[str] = []
+        for source_name, service, method_name, query in search_tasks:
+            if not self.health.allow(source_name):
+                logger.info(f"⛔ {source_name} • disjoncteur ouvert, source ignorée")
+                skipped.append(source_name)
+                continue
+            fut = self.executor.submit(
+                self._search_tracked, source_name, service, method_name, query
+            )
+            futures[fut] = source_name
+
+        try:
+            for source_name in skipped:
+                yield source_name, [], "skipped"
+            for fut in concurrent.futures.as_completed(futures):
+                try:
+                    source_results, error = fut.result(), None
+                except Exception as e:
+                    # Déjà journalisée et comptée par _search_tracked
+                    source_results, error = [], str(e)
+                yield futures[fut], source_results, error
+        finally:
+            for fut, source_name in futures.items():
+                if fut.cancel():
+                    self.health.release(source_name)
 
     def _search_single_source(
-        self, source_name: str, service, method_name: str, query
+        self, source_name: str, service, method_name: str, query, raise_errors: bool = False
     ) -> list[UnifiedBookResult]:
-        """Effectue la recherche sur une source unique."""
+        """Effectue la recherche sur une source unique.
+
+        Avec `raise_errors`, l'erreur de la source est propagée (pour le
+        disjoncteur) au lieu d'être journalisée et convertie en liste vide.
+        """
         results = []
         start_time = time.time()
 
@@ -873,7 +1463,9 @@ class ParallelSearchStrategy(SearchStrategy):
             if method_name == "search_by_isbn":
                 # ISBN - Tous les services supportés
                 if source_name == "BnF":
-                    bnf_books = service.search_by_isbn(query)
+                    found = service.search_by_isbn(query)
+                    # BnfService.search_by_isbn renvoie une notice unique (ou None)
+                    bnf_books = found if isinstance(found, list) else [found] if found else []
                     response_time = time.time() - start_time
                     for bnf_book in bnf_books:
                         source_info = SearchSourceInfo(
@@ -909,20 +1501,19 @@ class ParallelSearchStrategy(SearchStrategy):
                             success=True,
                         )
                         # Convertir BookDTO vers dict pour SearchResultAdapter
-                        google_data = {
-                            "volumeInfo": {
-                                "title": book_dto.title,
-                                "authors": [book_dto.authors_text] if book_dto.authors_text else [],
-                                "publisher": book_dto.publisher,
-                                "publishedDate": book_dto.year,
-                                "industryIdentifiers": [
-                                    {"type": "ISBN", "identifier": book_dto.isbn}
-                                ]
-                                if book_dto.isbn
-                                else [],
-                                "description": book_dto.description,
-                            }
+                        volume_info = {
+                            "title": book_dto.title,
+                            "publisher": book_dto.publisher,
+                            "publishedDate": str(book_dto.year) if book_dto.year else None,
+                            "industryIdentifiers": [
+                                {"type": "ISBN_13", "identifier": book_dto.isbn}
+                            ]
+                            if book_dto.isbn
+                            else [],
                         }
+                        if book_dto.author:
+                            volume_info["authors"] = [book_dto.author]
+                        google_data = {"volumeInfo": volume_info}
                         result = SearchResultAdapter.from_google_books(google_data, source_info)
                         results.append(result)
 
@@ -1015,10 +1606,33 @@ class ParallelSearchStrategy(SearchStrategy):
                         results.append(result)
 
         except Exception as e:
+            if raise_errors:
+                raise
             logger.error(f"❌ Erreur source {source_name}: {e}")
 
         return results
 
+    def _search_tracked(
+        self, source_name: str, service, method_name: str, query
+    ) -> list[UnifiedBookResult]:
+        """`_search_single_source` avec mise à jour de l'état de santé de la source.
+
+        L'erreur de la source est journalisée, comptée, puis propagée.
+        """
+        started = time.perf_counter()
+        try:
+            results = self._search_single_source(source_name, service, method_name, query, True)
+        except Exception as e:
+            self.health.record_failure(source_name)
+            logger.error(f"❌ Erreur source {source_name}: {e}")
+            raise
+        self.health.record_success(
+            source_name,
+            self.latency_key(source_name, method_name),
+            time.perf_counter() - started,
+        )
+        return results
+
 
 class BestResultStrategy(SearchStrategy):
     """Combine séquentiel et parallèle: parallèle d'abord, puis déduplication et scoring."""
@@ -1034,7 +1648,7 @@ class BestResultStrategy(SearchStrategy):
         # Déduplication par titre + auteur principal
         deduplicated = self._deduplicate_results(results)
 
-        return deduplicated
+        return SearchResults(deduplicated, failed_sources(results))
 
     def search_by_title_author(
         self, title: str, author: str, services: dict[str, any]
@@ -1044,7 +1658,13 @@ class BestResultStrategy(SearchStrategy):
 
         deduplicated = self._deduplicate_results(results)
 
-        return deduplicated
+        return SearchResults(deduplicated, failed_sources(results))
+
+    def iter_by_source(
+        self, search_tasks: list[tuple]
+    ) -> Iterator[tuple[str, list[UnifiedBookResult], str | None]]:
+        """Livraison source par source de la stratégie parallèle (sans déduplication)."""
+        return self.parallel_strategy.iter_by_source(search_tasks)
 
     def _deduplicate_results(self, results: list[UnifiedBookResult]) -> list[UnifiedBookResult]:
         """Déduplique les résultats en gardant le meilleur score."""
@@ -0,0 +1,403 @@
+"""
+Cache persistant des résultats de recherche bibliographique.
+
+Les résultats de MetaSearchService sont conservés dans une petite base
+SQLite (dossier de données utilisateur) pour survivre aux redémarrages :
+un ISBN consulté hier ne relance pas BnF, Google Books et OpenLibrary.
+
+Ce module définit :
+- MetadataCache: Cache clé -> liste de résultats, avec TTL par source,
+  cache négatif (« introuvable ») à durée courte, plafond d'entrées avec
+  éviction LRU et statistiques de hits/misses. Un LRU mémoire placé devant
+  SQLite sert les lectures répétées sans accès disque.
+- SingleFlight: Regroupement des recherches identiques simultanées (un seul
+  appel réseau par clé en vol, résultat partagé).
+- isbn_key / title_author_key: Normalisation des clés de cache.
+- get_metadata_cache / get_single_flight: Instances partagées.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future
+from pathlib import Path
+
+from ..utils.paths import user_data_dir
+
+logger = logging.getLogger(__name__)
+
+_DAY_S = 24 * 3600
+
+# Durée de validité des résultats selon la source (secondes)
+DEFAULT_SOURCE_TTLS: dict[str, float] = {
+    "BnF": 30 * _DAY_S,  # Notices stables
+    "OpenLibrary": 14 * _DAY_S,
+    "Google Books": 7 * _DAY_S,  # Couvertures/descriptions plus volatiles
+}
+DEFAULT_TTL_S = 7 * _DAY_S  # Source inconnue
+NEGATIVE_TTL_S = _DAY_S  # « Aucun résultat » : réessayer dès le lendemain
+DEFAULT_MAX_ENTRIES = 5000
+DEFAULT_MEMORY_ENTRIES = 256
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    negative INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_entries_last_access ON entries(last_access);
+"""
+
+_SPACES = re.compile(r"\s+")
+
+
+def _normalize_text(value: str | None) -> str:
+    """Minuscules, sans accents ni espaces superflus."""
+    text = unicodedata.normalize("NFKD", value or "")
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return _SPACES.sub(" ", text).strip().casefold()
+
+
+def isbn_key(isbn: str) -> str:
+    """Clé de cache d'un ISBN (sans tirets ni espaces, X en majuscule)."""
+    return "isbn:" + re.sub(r"[\s-]", "", isbn or "").upper()
+
+
+def title_author_key(title: str, author: str | None = "") -> str:
+    """Clé de cache d'une recherche titre/auteur."""
+    return f"title:{_normalize_text(title)}|{_normalize_text(author)}"
+
+
+class MetadataCache:
+    """Cache SQLite des résultats de recherche, borné et à expiration."""
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        encode: Callable[[list], str] = json.dumps,
+        decode: Callable[[str], list] = json.loads,
+        source_ttls: dict[str, float] | None = None,
+        default_ttl: float = DEFAULT_TTL_S,
+        negative_ttl: float = NEGATIVE_TTL_S,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+    ):
+        """
+        Args:
+            path: Fichier SQLite (":memory:" pour un cache non persistant).
+            encode: Sérialise une liste de résultats en texte.
+            decode: Inverse de `encode`.
+            source_ttls: TTL par nom de source (secondes).
+            default_ttl: TTL d'une source absente de `source_ttls`.
+            negative_ttl: TTL d'une recherche sans résultat.
+            max_entries: Nombre maximal d'entrées sur disque (éviction LRU).
+            memory_entries: Taille du LRU mémoire placé devant SQLite.
+        """
+        self._encode = encode
+        self._decode = decode
+        self.source_ttls = dict(DEFAULT_SOURCE_TTLS if source_ttls is None else source_ttls)
+        self.default_ttl = default_ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max(1, max_entries)
+        self.memory_entries = max(0, memory_entries)
+
+        self._lock = threading.Lock()
+        # clé -> (expires_at, résultats décodés)
+        self._memory: OrderedDict[str, tuple[float, list]] = OrderedDict()
+        # Accès servis par la mémoire, reportés sur disque au prochain `set`
+        self._pending_touch: dict[str, float] = {}
+        self._stats = dict.fromkeys(
+            ("hits", "memory_hits", "negative_hits", "misses", "expired", "writes", "evictions"),
+            0,
+        )
+
+        self.path = str(path) if path is not None else ":memory:"
+        self._conn = self._open(self.path)
+
+    # ---------- Connexion ----------
+
+    @staticmethod
+    def _open(path: str) -> sqlite3.Connection:
+        """Ouvre (ou crée) la base ; repli en mémoire si le fichier est inutilisable."""
+        try:
+            if path != ":memory:":
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            conn.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),))
+            return conn
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"⚠️ Cache métadonnées inutilisable ({path}) : {e} - cache en mémoire")
+            conn = sqlite3.connect(":memory:", check_same_thread=False, isolation_level=None)
+            conn.executescript(_SCHEMA)
+            return conn
+
+    def close(self) -> None:
+        """Reporte les accès en attente et ferme la base."""
+        with self._lock:
+            self._flush_touches()
+            self._conn.close()
+
+    # ---------- Lecture / écriture ----------
+
+    def get(self, key: str) -> list | None:
+        """Résultats en cache pour `key`.
+
+        Returns:
+            La liste des résultats (vide pour un résultat négatif), ou None
+            si la clé est absente ou expirée.
+        """
+        now = time.time()
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                expires_at, results = cached
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._pending_touch[key] = now
+                    self._count_hit(results, memory=True)
+                    return list(results)
+                del self._memory[key]
+
+            row = self._conn.execute(
+                "SELECT payload, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+            payload, expires_at = row
+            if expires_at <= now:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+            try:
+                results = self._decode(payload)
+            except Exception as e:
+                logger.warning(f"⚠️ Entrée de cache illisible ({key}) : {e}")
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._stats["misses"] += 1
+                return None
+
+            self._conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+            self._remember(key, expires_at, results)
+            self._count_hit(results, memory=False)
+            return list(results)
+
+    def set(self, key: str, results: list, sources: Iterable[str] = ()) -> None:
+        """Stocke les résultats de `key`.
+
+        Args:
+            key: Clé normalisée (voir isbn_key / title_author_key).
+            results: Résultats à conserver ; une liste vide est un résultat négatif.
+            sources: Sources ayant fourni les résultats. L'entrée expire avec la
+                source au TTL le plus court.
+        """
+        now = time.time()
+        if results:
+            ttls = [self.source_ttls.get(s, self.default_ttl) for s in set(sources)]
+            ttl = min(ttls) if ttls else self.default_ttl
+        else:
+            ttl = self.negative_ttl
+        expires_at = now + ttl
+
+        try:
+            payload = self._encode(results)
+        except Exception as e:
+            logger.warning(f"⚠️ Résultats non sérialisables pour le cache ({key}) : {e}")
+            return
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries"
+                " (key, payload, negative, created_at, expires_at, last_access)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, payload, 0 if results else 1, now, expires_at, now),
+            )
+            self._pending_touch.pop(key, None)
+            self._remember(key, expires_at, list(results))
+            self._stats["writes"] += 1
+            self._flush_touches()
+            self._evict()
+
+    def invalidate(self, key: str) -> None:
+        """Supprime une entrée."""
+        with self._lock:
+            self._memory.pop(key, None)
+            self._pending_touch.pop(key, None)
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Vide le cache (mémoire et disque) et remet les statistiques à zéro."""
+        with self._lock:
+            self._memory.clear()
+            self._pending_touch.clear()
+            self._conn.execute("DELETE FROM entries")
+            for name in self._stats:
+                self._stats[name] = 0
+
+    # ---------- Statistiques ----------
+
+    def stats(self) -> dict[str, int | float]:
+        """Compteurs de hits/misses et taille du cache."""
+        with self._lock:
+            entries, negative = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(negative), 0) FROM entries"
+            ).fetchone()
+            stats: dict[str, int | float] = dict(self._stats)
+            lookups = stats["hits"] + stats["misses"]
+            stats.update(
+                entries=entries,
+                negative_entries=negative,
+                memory_entries=len(self._memory),
+                max_entries=self.max_entries,
+                hit_rate=round(stats["hits"] / lookups, 3) if lookups else 0.0,
+            )
+            return stats
+
+    # ---------- Interne (verrou tenu) ----------
+
+    def _count_hit(self, results: list, memory: bool) -> None:
+        self._stats["hits"] += 1
+        if memory:
+            self._stats["memory_hits"] += 1
+        if not results:
+            self._stats["negative_hits"] += 1
+
+    def _remember(self, key: str, expires_at: float, results: list) -> None:
+        """Place l'entrée en tête du LRU mémoire."""
+        if not self.memory_entries:
+            return
+        self._memory[key] = (expires_at, results)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _flush_touches(self) -> None:
+        """Reporte sur disque les accès servis par le LRU mémoire."""
+        if not self._pending_touch:
+            return
+        self._conn.executemany(
+            "UPDATE entries SET last_access = ? WHERE key = ?",
+            [(ts, key) for key, ts in self._pending_touch.items()],
+        )
+        self._pending_touch.clear()
+
+    def _evict(self) -> None:
+        """Supprime les entrées expirées puis les moins récemment utilisées au-delà du plafond."""
+        self._conn.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),))
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        excess = count - self.max_entries
+        if excess <= 0:
+            return
+        evicted = [
+            key
+            for (key,) in self._conn.execute(
+                "SELECT key FROM entries ORDER BY last_access LIMIT ?", (excess,)
+            )
+        ]
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", [(k,) for k in evicted])
+        for key in evicted:
+            self._memory.pop(key, None)
+        self._stats["evictions"] += len(evicted)
+        logger.debug(f"🧹 Cache métadonnées : {len(evicted)} entrée(s) évincée(s)")
+
+
+class SingleFlight:
+    """Regroupe les recherches identiques simultanées (« single-flight »).
+
+    Le premier appelant d'une clé exécute la recherche ; ceux qui arrivent
+    pendant qu'elle est en vol attendent son Future et reçoivent le même
+    résultat (ou la même exception). La recherche doit remplir le cache
+    avant de rendre la main : un appel postérieur est alors servi par lui.
+    """
+
+    def __init__(self):
+        self._calls: dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._stats = {"leaders": 0, "shared": 0}
+
+    def do(self, key: str, fn: Callable[[], list]) -> tuple[list, bool]:
+        """Exécute `fn` pour `key`, ou rejoint l'exécution déjà en vol.
+
+        Returns:
+            (résultat, partagé) : `partagé` est True si un autre appelant a fait la recherche.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+                self._stats["leaders"] += 1
+            else:
+                self._stats["shared"] += 1
+
+        if not leader:
+            logger.debug(f"🔗 Recherche partagée avec une requête en cours : {key}")
+            return future.result(), True
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def in_flight(self, key: str) -> Future | None:
+        """Future de la recherche en cours pour `key`, s'il y en a une."""
+        with self._lock:
+            return self._calls.get(key)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._calls)}
+
+
+_shared_cache: MetadataCache | None = None
+_shared_flights = SingleFlight()
+_shared_lock = threading.Lock()
+
+
+def metadata_cache_path() -> Path:
+    """Fichier du cache partagé, dans le dossier de données utilisateur."""
+    return user_data_dir() / "cache" / "metadata_cache.sqlite3"
+
+
+def get_metadata_cache(
+    encode: Callable[[list], str] = json.dumps,
+    decode: Callable[[str], list] = json.loads,
+) -> MetadataCache:
+    """Instance partagée du cache, ouverte au premier appel.
+
+    `encode`/`decode` ne sont pris en compte qu'à la création.
+    """
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = MetadataCache(metadata_cache_path(), encode=encode, decode=decode)
+            logger.info(f"✅ Cache métadonnées ouvert : {_shared_cache.path}")
+        return _shared_cache
+
+
+def get_single_flight() -> SingleFlight:
+    """Regroupement partagé : la liste, l'éditeur et l'import rejoignent les mêmes recherches."""
+    return _shared_flights
@@ -2,13 +2,30 @@
 
 Ce module fournit des décorateurs pour mesurer automatiquement
 le temps d'exécution des fonctions critiques.
+
+La mémoire utilisée est fixe quelle que soit la durée de fonctionnement :
+chaque opération conserve ses derniers échantillons dans un tampon circulaire
+et l'ensemble de ses durées dans un histogramme à classes logarithmiques
+(p50/p95/p99 à ~5 % près). Les échantillons sont ajoutés à un fichier JSONL
+(une ligne par mesure) qui tourne au-delà d'une taille maximale.
+
+Ce module définit :
+- LogHistogram: Histogramme de durées à classes logarithmiques.
+- OperationMetrics: Tampon circulaire + histogramme d'une opération.
+- MetricsLog: Journal JSONL en ajout seul, avec rotation.
+- benchmark / record_metric / get_metrics_summary: API du service.
 """
 
+from __future__ import annotations
+
+import atexit
 import functools
 import json
 import logging
+import math
+import threading
 import time
-from collections import defaultdict
+from collections import deque
 from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
@@ -16,9 +33,169 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
-# Storage des métriques en mémoire
-_metrics_store: dict[str, list[dict]] = defaultdict(list)
-_metrics_file = Path("metrics.json")
+# Échantillons récents conservés par opération
+RING_SIZE = 256
+# Classes par doublement de durée : largeur relative 2^(1/8) - 1 ≈ 9 %
+BUCKETS_PER_OCTAVE = 8
+# Plus petite durée distinguée (ms) ; en dessous, tout tombe dans la classe 0
+MIN_BUCKET_MS = 0.01
+# Rotation du journal JSONL
+METRICS_MAX_BYTES = 1024 * 1024
+METRICS_BACKUPS = 3
+# Vidage du tampon d'écriture du journal (nombre d'échantillons)
+METRICS_FLUSH_EVERY = 10
+
+
+class LogHistogram:
+    """Histogramme de durées (ms) à classes de largeur relative constante.
+
+    La classe d'une durée se calcule en O(1) ; le nombre de classes est borné
+    par l'étendue des durées (~8 classes par doublement), pas par leur nombre.
+    """
+
+    __slots__ = ("_buckets", "count", "total", "min", "max")
+
+    def __init__(self):
+        self._buckets: dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    @staticmethod
+    def bucket_of(value_ms: float) -> int:
+        if value_ms <= MIN_BUCKET_MS:
+            return 0
+        return 1 + int(math.log2(value_ms / MIN_BUCKET_MS) * BUCKETS_PER_OCTAVE)
+
+    @staticmethod
+    def bucket_value(index: int) -> float:
+        """Valeur représentative d'une classe (milieu géométrique de ses bornes)."""
+        if index == 0:
+            return MIN_BUCKET_MS
+        return MIN_BUCKET_MS * 2 ** ((index - 0.5) / BUCKETS_PER_OCTAVE)
+
+    def add(self, value_ms: float) -> None:
+        index = self.bucket_of(value_ms)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value_ms
+        self.min = min(self.min, value_ms)
+        self.max = max(self.max, value_ms)
+
+    def percentile(self, q: float) -> float | None:
+        """Percentile `q` (0-1), borné par le min/max observés ; None si vide."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return min(self.max, max(self.min, self.bucket_value(index)))
+        return self.max
+
+
+class OperationMetrics:
+    """Mesures d'une opération : derniers échantillons et histogramme des succès."""
+
+    __slots__ = ("recent", "histogram", "count", "failures")
+
+    def __init__(self, ring_size: int = RING_SIZE):
+        self.recent: deque[dict] = deque(maxlen=ring_size)
+        self.histogram = LogHistogram()
+        self.count = 0
+        self.failures = 0
+
+    def add(self, metric: dict) -> None:
+        self.recent.append(metric)
+        self.count += 1
+        if metric["success"]:
+            self.histogram.add(metric["duration_ms"])
+        else:
+            self.failures += 1
+
+    def summary(self) -> dict[str, Any]:
+        h = self.histogram
+        return {
+            "count": self.count,
+            "success_count": h.count,
+            "avg_ms": round(h.total / h.count, 2),
+            "min_ms": round(h.min, 2),
+            "max_ms": round(h.max, 2),
+            "p50_ms": round(h.percentile(0.50), 2),
+            "p95_ms": round(h.percentile(0.95), 2),
+            "p99_ms": round(h.percentile(0.99), 2),
+        }
+
+
+class MetricsLog:
+    """Journal JSONL des métriques, en ajout seul.
+
+    Au-delà de `max_bytes`, le fichier devient `<nom>.1` (les sauvegardes
+    existantes sont décalées, la plus ancienne au-delà de `backups` supprimée).
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        *,
+        max_bytes: int = METRICS_MAX_BYTES,
+        backups: int = METRICS_BACKUPS,
+        flush_every: int = METRICS_FLUSH_EVERY,
+    ):
+        self._path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.flush_every = max(1, flush_every)
+        self._pending: list[str] = []
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            from ..utils.paths import logs_path
+
+            self._path = logs_path() / "metrics.jsonl"
+        return self._path
+
+    def append(self, metric: dict) -> None:
+        """Ajoute une ligne au tampon ; l'écrit tous les `flush_every` échantillons."""
+        self._pending.append(json.dumps(metric, ensure_ascii=False, default=str) + "\n")
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        lines, self._pending = self._pending, []
+        path = self.path
+        try:
+            if path.exists() and path.stat().st_size >= self.max_bytes:
+                self._rotate(path)
+            with path.open("a", encoding="utf-8") as f:
+                f.writelines(lines)
+            logger.debug(f"Metrics appended to {path}")
+        except Exception as e:
+            logger.error(f"Failed to save metrics: {e}")
+
+    def _rotate(self, path: Path) -> None:
+        oldest = path.with_name(f"{path.name}.{self.backups}")
+        if oldest.exists():
+            oldest.unlink()
+        for i in range(self.backups - 1, 0, -1):
+            backup = path.with_name(f"{path.name}.{i}")
+            if backup.exists():
+                backup.replace(path.with_name(f"{path.name}.{i + 1}"))
+        if self.backups > 0:
+            path.replace(path.with_name(f"{path.name}.1"))
+        else:
+            path.unlink()
+
+
+# Storage des métriques en mémoire (taille fixe par opération)
+_metrics_store: dict[str, OperationMetrics] = {}
+_metrics_log = MetricsLog()
+_lock = threading.Lock()
 
 
 def benchmark(operation_name: str | None = None) -> Callable:
@@ -78,8 +255,9 @@ def record_metric(
     success: bool = True,
     error: str | None = None,
     metadata: dict[str, Any] | None = None,
+    quiet: bool = False,
 ) -> None:
-    """Enregistre une métrique de performance.
+    """Enregistre une métrique de performance (coût constant).
 
     Args:
         operation: Nom de l'opération mesurée
@@ -87,6 +265,7 @@ def record_metric(
         success: Si l'opération a réussi
         error: Message d'erreur (si échec)
         metadata: Données supplémentaires
+        quiet: Mémoire seule, sans log ni journal JSONL (mesures très fréquentes, ex. SQL)
     """
     metric = {
         "timestamp": datetime.utcnow().isoformat(),
@@ -97,8 +276,16 @@ def record_metric(
         "metadata": metadata or {},
     }
 
-    # Stocker en mémoire
-    _metrics_store[operation].append(metric)
+    # Stocker en mémoire + journal (écrit tous les METRICS_FLUSH_EVERY échantillons)
+    with _lock:
+        metrics = _metrics_store.get(operation)
+        if metrics is None:
+            metrics = _metrics_store[operation] = OperationMetrics()
+        metrics.add(metric)
+        if not quiet:
+            _metrics_log.append(metric)
+    if quiet:
+        return
 
     # Logger
     if success:
@@ -106,58 +293,46 @@ def record_metric(
     else:
         logger.warning(f"⏱️ {operation} FAILED after {metric['duration_ms']}ms: {error}")
 
-    # Sauvegarder périodiquement (tous les 10 enregistrements)
-    total_metrics = sum(len(v) for v in _metrics_store.values())
-    if total_metrics % 10 == 0:
-        save_metrics()
-
 
 def save_metrics() -> None:
-    """Sauvegarde les métriques dans un fichier JSON."""
-    try:
-        with _metrics_file.open("w", encoding="utf-8") as f:
-            json.dump(dict(_metrics_store), f, indent=2)
-        logger.debug(f"Metrics saved to {_metrics_file}")
-    except Exception as e:
-        logger.error(f"Failed to save metrics: {e}")
+    """Écrit dans le journal JSONL les échantillons encore en tampon."""
+    with _lock:
+        _metrics_log.flush()
+
+
+atexit.register(save_metrics)
 
 
 def get_metrics_summary() -> dict[str, dict]:
     """Retourne un résumé des métriques collectées.
 
     Returns:
-        Dict avec statistiques par opération (count, avg, min, max)
+        Dict avec statistiques par opération (count, avg, min, max, p50, p95, p99)
     """
-    summary = {}
-
-    for operation, metrics in _metrics_store.items():
-        durations = [m["duration_ms"] for m in metrics if m["success"]]
-
-        if durations:
-            summary[operation] = {
-                "count": len(metrics),
-                "success_count": len(durations),
-                "avg_ms": round(sum(durations) / len(durations), 2),
-                "min_ms": round(min(durations), 2),
-                "max_ms": round(max(durations), 2),
-            }
-
-    return summary
+    with _lock:
+        return {
+            operation: metrics.summary()
+            for operation, metrics in _metrics_store.items()
+            if metrics.histogram.count
+        }
 
 
 def export_metrics_csv(filepath: Path) -> None:
-    """Exporte les métriques vers un fichier CSV.
+    """Exporte les échantillons récents (tampons circulaires) vers un fichier CSV.
 
     Args:
         filepath: Chemin du fichier CSV de destination
     """
     import csv
 
+    with _lock:
+        recent = {operation: list(m.recent) for operation, m in _metrics_store.items()}
+
     with filepath.open("w", newline="", encoding="utf-8") as f:
         writer = csv.writer(f)
         writer.writerow(["Timestamp", "Operation", "Duration (ms)", "Success", "Error"])
 
-        for operation, metrics in _metrics_store.items():
+        for operation, metrics in recent.items():
             for metric in metrics:
                 writer.writerow(
                     [
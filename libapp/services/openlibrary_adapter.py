@@ -4,6 +4,9 @@ from typing import Any
 
 import requests
 
+from .http_transport import HttpTransport, get_transport
+from .openlibrary_service import BIBKEYS_BATCH_SIZE
+
 BOOKS_API = "https://openlibrary.org/api/books"
 ISBN_API = "https://openlibrary.org/isbn/{isbn}.json"
 WORKS_API = "https://openlibrary.org{path}.json"
@@ -17,10 +20,35 @@ def _year_only(val) -> str:
     return s
 
 
+def _books_api_entry(blob: dict[str, Any] | None) -> dict[str, str] | None:
+    """Entrée `api/books` (jscmd=data) -> dict title/author/publisher/year."""
+    if not blob:
+        return None
+    title = blob.get("title") or ""
+    author = ", ".join([a.get("name", "") for a in (blob.get("authors") or []) if a.get("name")])
+    pub = (blob.get("publishers") or [{}])[0].get("name", "") if blob.get("publishers") else ""
+    year = _year_only(blob.get("publish_date"))
+    if any([title, author, pub, year]):
+        return {"title": title, "author": author, "publisher": pub, "year": year}
+    return None
+
+
 class OpenLibraryAdapter:
-    def __init__(self, session: requests.Session | None = None, timeout: int = 10):
-        self.session = session or requests.Session()
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        timeout: float | None = None,
+        transport: HttpTransport | None = None,
+    ):
+        # Une session explicite reste prioritaire ; sinon transport poolé partagé
+        self.session = session
         self.timeout = timeout
+        self.transport = transport or get_transport()
+
+    def _get(self, url: str, params: dict | None = None) -> requests.Response:
+        if self.session is not None:
+            return self.session.get(url, params=params, timeout=self.timeout or 10)
+        return self.transport.get(url, source="openlibrary", params=params, timeout=self.timeout)
 
     def by_isbn(self, isbn: str) -> dict[str, str] | None:
         isbn = (isbn or "").strip()
@@ -28,7 +56,7 @@ class OpenLibraryAdapter:
             return None
 
         try:
-            r = self.session.get(ISBN_API.format(isbn=isbn), timeout=self.timeout)
+            r = self._get(ISBN_API.format(isbn=isbn))
             if r.status_code == 200:
                 b = r.json()
                 title = b.get("title") or ""
@@ -41,16 +69,14 @@ class OpenLibraryAdapter:
                     key = b["works"][0].get("key")
                     if key:
                         try:
-                            wr = self.session.get(WORKS_API.format(path=key), timeout=self.timeout)
+                            wr = self._get(WORKS_API.format(path=key))
                             if wr.status_code == 200:
                                 w = wr.json()
                                 names: list[str] = []
                                 for a in w.get("authors") or []:
                                     akey = (a.get("author") or {}).get("key")
                                     if akey:
-                                        ar = self.session.get(
-                                            WORKS_API.format(path=akey), timeout=self.timeout
-                                        )
+                                        ar = self._get(WORKS_API.format(path=akey))
                                         if ar.status_code == 200:
                                             nm = (ar.json() or {}).get("name")
                                             if nm:
@@ -66,23 +92,37 @@ class OpenLibraryAdapter:
 
         try:
             params = {"bibkeys": f"ISBN:{isbn}", "jscmd": "data", "format": "json"}
-            r = self.session.get(BOOKS_API, params=params, timeout=self.timeout)
+            r = self._get(BOOKS_API, params=params)
             r.raise_for_status()
             data: dict[str, Any] = r.json() or {}
-            blob = data.get(f"ISBN:{isbn}") or {}
-            if blob:
-                title = blob.get("title") or ""
-                author = ", ".join(
-                    [a.get("name", "") for a in (blob.get("authors") or []) if a.get("name")]
-                )
-                pub = (
-                    (blob.get("publishers") or [{}])[0].get("name", "")
-                    if blob.get("publishers")
-                    else ""
-                )
-                year = _year_only(blob.get("publish_date"))
-                if any([title, author, pub, year]):
-                    return {"title": title, "author": author, "publisher": pub, "year": year}
+            return _books_api_entry(data.get(f"ISBN:{isbn}"))
         except Exception:
             pass
         return None
+
+    def by_isbns(
+        self, isbns: list[str], *, batch_size: int = BIBKEYS_BATCH_SIZE
+    ) -> dict[str, dict[str, str] | None]:
+        """Notices d'un lot d'ISBN via `api/books?bibkeys=ISBN:a,ISBN:b`, par paquets."""
+        found: dict[str, dict[str, str] | None] = {}
+        for isbn in isbns:
+            found.setdefault((isbn or "").strip(), None)
+        found.pop("", None)
+
+        keys = list(found)
+        for start in range(0, len(keys), batch_size):
+            chunk = keys[start : start + batch_size]
+            params = {
+                "bibkeys": ",".join(f"ISBN:{isbn}" for isbn in chunk),
+                "jscmd": "data",
+                "format": "json",
+            }
+            try:
+                r = self._get(BOOKS_API, params=params)
+                r.raise_for_status()
+                data: dict[str, Any] = r.json() or {}
+            except Exception:
+                continue
+            for isbn in chunk:
+                found[isbn] = _books_api_entry(data.get(f"ISBN:{isbn}"))
+        return found
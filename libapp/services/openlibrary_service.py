@@ -2,17 +2,43 @@
 Service pour interroger l'API OpenLibrary.
 
 Recherche des informations sur un livre par ISBN et les transforme
-en `BookDTO` via son adaptateur.
+en `BookDTO` via son adaptateur. Les ISBN passent par l'API multi-clés
+`api/books?bibkeys=ISBN:a,ISBN:b` (par paquets) ; les éditions des works
+d'une recherche par titre sont récupérées en parallèle.
 """
 
 from __future__ import annotations
 
+import logging
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
-import requests
-
+from .http_transport import HttpTransport, get_transport
 from .utils import clean_author, normalize_isbn
 
+logger = logging.getLogger(__name__)
+
+# Clés ISBN par requête api/books (borne la longueur de l'URL)
+BIBKEYS_BATCH_SIZE = 50
+# Récupérations d'éditions simultanées pour une recherche par titre
+EDITIONS_CONCURRENCY = 4
+
+_editions_executor: ThreadPoolExecutor | None = None
+_editions_lock = threading.Lock()
+
+
+def _get_editions_executor() -> ThreadPoolExecutor:
+    """Pool durable des requêtes d'éditions (jamais recréé par recherche)."""
+    global _editions_executor
+    with _editions_lock:
+        if _editions_executor is None:
+            _editions_executor = ThreadPoolExecutor(
+                max_workers=EDITIONS_CONCURRENCY, thread_name_prefix="openlibrary-editions"
+            )
+        return _editions_executor
+
 
 @dataclass
 class ExtBook:
@@ -28,74 +54,111 @@ class ExtBook:
 class OpenLibraryService:
     BASE = "https://openlibrary.org"
 
+    def __init__(self, transport: HttpTransport | None = None, base_url: str | None = None):
+        self.transport = transport or get_transport()
+        # URL de base substituable (serveur de rejeu, voir http_replay)
+        self.BASE = (base_url or self.BASE).rstrip("/")
+
+    def _get(self, url: str, params: dict | None = None):
+        """GET via la session poolée de la source "openlibrary"."""
+        return self.transport.get(url, source="openlibrary", params=params)
+
     def search_by_isbn(self, isbn: str) -> ExtBook | None:
-        """Recherche par ISBN - inchangée, fonctionne déjà."""
+        """Recherche par ISBN (une clé de l'API multi-clés)."""
         s = normalize_isbn(isbn)
         if not s:
             return None
-        url = f"{self.BASE}/isbn/{s}.json"
-        try:
-            r = requests.get(url, timeout=10)
-            if r.status_code != 200:
-                return None
-            data = r.json()
-            return self._map(data)
-        except Exception:
-            return None
+        return self.search_many_isbns([s]).get(s)
+
+    def search_many_isbns(
+        self, isbns: Iterable[str], *, batch_size: int = BIBKEYS_BATCH_SIZE
+    ) -> dict[str, ExtBook | None]:
+        """Recherche d'un lot d'ISBN via `api/books?bibkeys=ISBN:a,ISBN:b`.
+
+        Returns:
+            {isbn demandé: ExtBook ou None}, dans l'ordre de la demande ; None
+            signifie qu'OpenLibrary ne connaît pas l'ISBN.
+
+        Raises:
+            requests.RequestException: Un paquet en échec (transport ou réponse
+                HTTP d'erreur) : ses ISBN ne sont pas « introuvables ».
+        """
+        found: dict[str, ExtBook | None] = {}
+        keys: dict[str, list[str]] = {}
+        for isbn in isbns:
+            if isbn in found:
+                continue
+            found[isbn] = None
+            s = normalize_isbn(isbn)
+            if s:
+                keys.setdefault(s, []).append(isbn)
+
+        normalized = list(keys)
+        for start in range(0, len(normalized), batch_size):
+            chunk = normalized[start : start + batch_size]
+            params = {
+                "bibkeys": ",".join(f"ISBN:{s}" for s in chunk),
+                "jscmd": "data",
+                "format": "json",
+            }
+            r = self._get(f"{self.BASE}/api/books", params=params)
+            r.raise_for_status()  # Un ISBN inconnu est simplement absent de la réponse
+            data = r.json() or {}
+            for s in chunk:
+                book = self._map_books_api(data.get(f"ISBN:{s}"), s)
+                for requested in keys[s]:
+                    found[requested] = book
+        return found
 
     def search_by_title(self, title: str) -> list[ExtBook]:
         """Recherche par titre avec récupération des éditions détaillées.
 
-        Utilise l'approche works → editions pour récupérer les ISBN et éditeurs.
+        Utilise l'approche works → editions pour récupérer les ISBN et éditeurs ;
+        les éditions des works trouvés sont demandées en parallèle.
 
         Args:
             title: Titre du livre à rechercher
 
         Returns:
             Liste d'ExtBook avec ISBN et éditeur remplis
+
+        Raises:
+            requests.RequestException: Échec de transport ou réponse HTTP d'erreur.
         """
         url = f"{self.BASE}/search.json"
-        try:
-            # Première requête pour obtenir les works
-            r = requests.get(url, params={"title": title, "limit": 3}, timeout=10)
-
-            if r.status_code != 200:
-                return []
+        # Première requête pour obtenir les works
+        r = self._get(url, params={"title": title, "limit": 3})
+        r.raise_for_status()
 
-            docs = r.json().get("docs", [])
-            results = []
-
-            for doc in docs:
-                work_key = doc.get("key")
-                if not work_key:
-                    continue
-
-                # Récupérer les éditions pour ce work
-                editions_url = f"{self.BASE}{work_key}/editions.json"
-                try:
-                    editions_response = requests.get(editions_url, timeout=10)
+        docs = [doc for doc in r.json().get("docs", []) if doc.get("key")]
+        if not docs:
+            return []
 
-                    if editions_response.status_code == 200:
-                        editions_data = editions_response.json()
-                        entries = editions_data.get("entries", [])
+        # Éditions de chaque work en parallèle (ordre des works conservé)
+        futures = [_get_editions_executor().submit(self._work_edition, doc) for doc in docs]
+        return [book for book in (f.result() for f in futures) if book]
 
-                        # Prendre la première édition avec les meilleures données
-                        for edition in entries[:3]:  # Max 3 éditions par work
-                            ext_book = self._map_edition(edition, doc)
-                            if ext_book:
-                                results.append(ext_book)
-                                break  # Une seule édition par work pour éviter doublons
+    def _work_edition(self, doc: dict) -> ExtBook | None:
+        """Meilleure édition d'un work, ou ses données de base si les éditions manquent.
 
-                except Exception:
-                    # Si on ne peut pas récupérer les éditions, on utilise les données de base
-                    basic_book = self._map(doc)
-                    if basic_book:
-                        results.append(basic_book)
+        Une erreur de transport ou HTTP est levée (échec de la source).
+        """
+        editions_url = f"{self.BASE}{doc['key']}/editions.json"
+        editions_response = self._get(editions_url)
+        editions_response.raise_for_status()
+        try:
+            entries = editions_response.json().get("entries", [])
 
-            return results
+            # Prendre la première édition avec les meilleures données
+            for edition in entries[:3]:  # Max 3 éditions par work
+                ext_book = self._map_edition(edition, doc)
+                if ext_book:
+                    return ext_book  # Une seule édition par work pour éviter doublons
+            return None
 
         except Exception:
-            return []
+            # Éditions illisibles : on utilise les données de base du work
+            return self._map(doc)
 
     def _map_edition(self, edition_data: dict, work_data: dict) -> ExtBook | None:
         """Mappe les données d'édition + work vers ExtBook.
@@ -163,6 +226,36 @@ class OpenLibraryService:
             collection=None,
         )
 
+    def _map_books_api(self, blob: dict | None, isbn: str) -> ExtBook | None:
+        """Convertit une entrée `api/books` (jscmd=data) vers ExtBook."""
+        if not blob or not blob.get("title"):
+            return None
+
+        auteurs = [
+            clean_author(str(a["name"]))
+            for a in blob.get("authors") or []
+            if isinstance(a, dict) and a.get("name")
+        ]
+        publishers = blob.get("publishers") or []
+        editeur = None
+        if publishers:
+            first = publishers[0]
+            editeur = str(first.get("name") if isinstance(first, dict) else first) or None
+
+        identifiers = blob.get("identifiers") or {}
+        isbn_13 = identifiers.get("isbn_13") or []
+        found_isbn = normalize_isbn(str(isbn_13[0])) if isbn_13 else None
+
+        return ExtBook(
+            titre=blob["title"],
+            sous_titre=blob.get("subtitle"),
+            auteurs=auteurs,
+            isbn=found_isbn or isbn,
+            editeur=editeur,
+            date_publication=blob.get("publish_date"),
+            collection=None,
+        )
+
     def _map(self, d: dict) -> ExtBook | None:
         """Convertit les données brutes OpenLibrary vers ExtBook.
 
@@ -29,6 +29,7 @@ class Preferences:
     # Préférences spécifiques aux modules
     import_last_directory: str | None = None
     import_last_mapping: dict[str, str] = field(default_factory=dict)
+    import_chunk_size: int = 1000  # Lignes commitées par transaction lors d'un import
 
     # États des vues
     books_view_state: dict[str, Any] = field(default_factory=dict)
@@ -95,6 +96,11 @@ class Preferences:
     # Politique de prêt simplifiée (durée fixe pour tous)
     default_loan_days: int = 14
 
+    # Base de données (profil de performance SQLite)
+    db_performance_profile: str = "performance"
+    db_cache_size_mb: int = 64
+    db_mmap_size_mb: int = 256
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Preferences:
         """Crée une instance de Preferences à partir d'un dictionnaire."""
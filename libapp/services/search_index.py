@@ -1,9 +1,19 @@
+"""
+Services de recherche sur le catalogue.
+
+- get_suggestions(): titres et auteurs pour l'autocomplétion.
+- search_book_ids(): recherche plein texte classée via l'index FTS5.
+"""
+
 from __future__ import annotations
 
-from sqlalchemy import func, inspect
+import re
+
+from sqlalchemy import func, inspect, text
 from sqlalchemy.exc import OperationalError
 
 from libapp.persistence.database import SessionLocal
+from libapp.persistence.fts import FTS_TABLE, FTS_WEIGHTS, rebuild_book_fts
 from libapp.persistence.models_sa import Author, Book
 
 
@@ -52,3 +62,67 @@ def get_suggestions(limit=200):
 
 
 # [PATCH-END get_suggestions search_index.py]
+
+
+# --- Recherche plein texte (FTS5) ---
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def build_fts_query(search_text: str) -> str | None:
+    """
+    Convertit une saisie utilisateur en requête FTS5 sûre.
+
+    Chaque mot devient un préfixe entre guillemets (`"harr"*`), les mots
+    étant combinés en ET implicite. Les opérateurs FTS5 tapés par
+    l'utilisateur (`AND`, `NEAR`, `-`, `:`...) sont ainsi neutralisés.
+
+    Returns:
+        La requête MATCH, ou None si la saisie ne contient aucun mot.
+    """
+    tokens = _TOKEN_RE.findall(search_text or "")
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def search_book_ids(search_text: str, limit: int | None = None) -> list[int]:
+    """
+    Recherche plein texte dans le catalogue.
+
+    Couvre titre, sous-titre, auteurs, mots-clés, résumé, collection et ISBN,
+    avec un classement bm25 pondéré (titre et auteurs d'abord).
+
+    Args:
+        search_text: Saisie brute de l'utilisateur.
+        limit: Nombre maximal d'identifiants retournés (None = tous).
+
+    Returns:
+        Liste d'identifiants de livres, du plus pertinent au moins pertinent.
+
+    Raises:
+        OperationalError: Si l'index FTS5 est indisponible.
+    """
+    match = build_fts_query(search_text)
+    if match is None:
+        return []
+
+    weights = ", ".join(str(w) for w in FTS_WEIGHTS)
+    sql = (
+        f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match "
+        f"ORDER BY bm25({FTS_TABLE}, {weights})"
+    )
+    params: dict[str, object] = {"match": match}
+    if limit is not None:
+        sql += " LIMIT :limit"
+        params["limit"] = int(limit)
+
+    with SessionLocal() as s:
+        return list(s.execute(text(sql), params).scalars())
+
+
+def rebuild_search_index() -> None:
+    """Reconstruit l'index plein texte (après une restauration de base par ex.)."""
+    with SessionLocal() as s:
+        rebuild_book_fts(s.connection())
+        s.commit()
@@ -0,0 +1,272 @@
+"""
+Suivi de l'état de santé des sources bibliographiques.
+
+Les stratégies de recherche enregistrent la latence et l'issue de chaque
+appel à une source (BnF, Google Books, OpenLibrary). Les percentiles
+observés pilotent le délai avant une requête de couverture (« hedging »)
+et le timeout de chaque source ; les échecs répétés ouvrent un disjoncteur
+qui fait ignorer la source pendant un temps de refroidissement, puis une
+requête de test (semi-ouvert) décide de sa réintégration.
+
+Ce module définit :
+- LatencyTracker: Fenêtres glissantes de latences par source et percentiles.
+- CircuitState: États du disjoncteur d'une source.
+- SourceHealth: Disjoncteurs par source et timeouts adaptatifs.
+- get_latency_tracker / get_source_health: Instances partagées.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from enum import Enum
+
+logger = logging.getLogger(__name__)
+
+# Nombre d'échantillons conservés par source
+DEFAULT_WINDOW = 200
+# En dessous, les percentiles ne sont pas jugés fiables
+MIN_SAMPLES = 5
+
+
+class LatencyTracker:
+    """Latences récentes (secondes) par source, thread-safe."""
+
+    def __init__(self, window: int = DEFAULT_WINDOW, min_samples: int = MIN_SAMPLES):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, source: str, seconds: float) -> None:
+        """Ajoute une mesure pour `source`."""
+        with self._lock:
+            samples = self._samples.get(source)
+            if samples is None:
+                samples = self._samples[source] = deque(maxlen=self.window)
+            samples.append(max(0.0, seconds))
+
+    def count(self, source: str) -> int:
+        with self._lock:
+            return len(self._samples.get(source, ()))
+
+    def percentile(self, source: str, q: float) -> float | None:
+        """Percentile `q` (0-1) des latences de `source`, ou None si trop peu de mesures."""
+        with self._lock:
+            samples = sorted(self._samples.get(source, ()))
+        if len(samples) < self.min_samples:
+            return None
+        # Rang le plus proche : p95 sur 20 mesures -> 19e valeur
+        rank = min(len(samples) - 1, max(0, round(q * len(samples)) - 1))
+        return samples[rank]
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Nombre de mesures et p50/p95/p99 (secondes) par source."""
+        stats = {}
+        with self._lock:
+            sources = list(self._samples)
+        for source in sources:
+            stats[source] = {
+                "count": self.count(source),
+                "p50": self.percentile(source, 0.50),
+                "p95": self.percentile(source, 0.95),
+                "p99": self.percentile(source, 0.99),
+            }
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+
+class CircuitState(str, Enum):
+    """États du disjoncteur d'une source."""
+
+    CLOSED = "closed"  # Source interrogée normalement
+    OPEN = "open"  # Source ignorée jusqu'à la fin du refroidissement
+    HALF_OPEN = "half_open"  # Une requête de test est autorisée
+
+
+@dataclass(slots=True)
+class _Circuit:
+    state: CircuitState = CircuitState.CLOSED
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    probe_in_flight: bool = False
+    outcomes: deque[bool] = field(default_factory=lambda: deque(maxlen=20))
+
+
+class SourceHealth:
+    """Disjoncteurs par source et timeouts déduits des latences observées."""
+
+    def __init__(
+        self,
+        latency: LatencyTracker | None = None,
+        *,
+        failure_threshold: int = 3,
+        error_rate_threshold: float = 0.5,
+        window: int = 20,
+        cooldown_s: float = 30.0,
+        timeout_quantile: float = 0.99,
+        timeout_factor: float = 1.5,
+        min_timeout: float = 0.5,
+        max_timeout: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            latency: Latences observées (tracker partagé par défaut).
+            failure_threshold: Échecs consécutifs qui ouvrent le disjoncteur.
+            error_rate_threshold: Taux d'échec (sur `window` appels) qui l'ouvre aussi.
+            window: Nombre d'issues récentes conservées par source.
+            cooldown_s: Durée pendant laquelle une source ouverte est ignorée.
+            timeout_quantile: Percentile de latence servant de base au timeout.
+            timeout_factor: Marge appliquée à ce percentile.
+            min_timeout: Timeout adaptatif minimal (secondes).
+            max_timeout: Timeout adaptatif maximal (secondes).
+            clock: Horloge (remplaçable dans les tests).
+        """
+        self.latency = latency or get_latency_tracker()
+        self.failure_threshold = failure_threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.window = window
+        self.cooldown_s = cooldown_s
+        self.timeout_quantile = timeout_quantile
+        self.timeout_factor = timeout_factor
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self._clock = clock
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, source: str) -> _Circuit:
+        circuit = self._circuits.get(source)
+        if circuit is None:
+            circuit = self._circuits[source] = _Circuit(outcomes=deque(maxlen=self.window))
+        return circuit
+
+    # ---------- Disjoncteur ----------
+
+    def allow(self, source: str) -> bool:
+        """True si `source` peut être interrogée maintenant.
+
+        Après le refroidissement, un seul appel de test passe (semi-ouvert).
+        """
+        with self._lock:
+            circuit = self._circuit(source)
+            if circuit.state is CircuitState.CLOSED:
+                return True
+            if circuit.state is CircuitState.OPEN:
+                if self._clock() - circuit.opened_at < self.cooldown_s:
+                    return False
+                circuit.state = CircuitState.HALF_OPEN
+                logger.info(f"🔌 {source} • disjoncteur semi-ouvert, requête de test")
+            if circuit.probe_in_flight:
+                return False
+            circuit.probe_in_flight = True
+            return True
+
+    def state(self, source: str) -> CircuitState:
+        with self._lock:
+            return self._circuit(source).state
+
+    def record_success(self, source: str, latency_key: str | None, seconds: float) -> None:
+        """Appel réussi : latence mesurée, disjoncteur refermé."""
+        if latency_key:
+            self.latency.record(latency_key, seconds)
+        with self._lock:
+            circuit = self._circuit(source)
+            circuit.outcomes.append(True)
+            circuit.consecutive_failures = 0
+            circuit.probe_in_flight = False
+            if circuit.state is not CircuitState.CLOSED:
+                circuit.state = CircuitState.CLOSED
+                logger.info(f"✅ {source} • disjoncteur refermé")
+
+    def record_failure(
+        self, source: str, latency_key: str | None = None, seconds: float | None = None
+    ) -> None:
+        """Erreur ou timeout : peut ouvrir le disjoncteur.
+
+        `seconds` (durée avant abandon) est une borne inférieure de la latence
+        réelle ; l'enregistrer fait monter le timeout adaptatif d'une source lente.
+        """
+        if latency_key and seconds is not None:
+            self.latency.record(latency_key, seconds)
+        with self._lock:
+            circuit = self._circuit(source)
+            circuit.outcomes.append(False)
+            circuit.consecutive_failures += 1
+            circuit.probe_in_flight = False
+            failures = circuit.outcomes.count(False)
+            error_rate = failures / len(circuit.outcomes)
+            if circuit.state is CircuitState.HALF_OPEN or (
+                circuit.state is CircuitState.CLOSED
+                and (
+                    circuit.consecutive_failures >= self.failure_threshold
+                    or (
+                        len(circuit.outcomes) >= self.window // 2
+                        and error_rate >= self.error_rate_threshold
+                    )
+                )
+            ):
+                circuit.state = CircuitState.OPEN
+                circuit.opened_at = self._clock()
+                logger.warning(
+                    f"⛔ {source} • disjoncteur ouvert pour {self.cooldown_s:.0f} s "
+                    f"({circuit.consecutive_failures} échec(s) consécutif(s), "
+                    f"taux d'échec {error_rate:.0%})"
+                )
+
+    def release(self, source: str) -> None:
+        """Appel abandonné sans issue connue (annulé) : libère la requête de test."""
+        with self._lock:
+            self._circuit(source).probe_in_flight = False
+
+    # ---------- Timeouts adaptatifs ----------
+
+    def timeout_for(self, latency_key: str, default: float) -> float:
+        """Timeout d'un appel : percentile observé avec marge, `default` sans historique."""
+        observed = self.latency.percentile(latency_key, self.timeout_quantile)
+        if observed is None:
+            return default
+        return min(self.max_timeout, max(self.min_timeout, observed * self.timeout_factor))
+
+    def snapshot(self) -> dict[str, dict]:
+        """État du disjoncteur et taux d'échec récent par source."""
+        with self._lock:
+            return {
+                source: {
+                    "state": circuit.state.value,
+                    "consecutive_failures": circuit.consecutive_failures,
+                    "error_rate": (
+                        circuit.outcomes.count(False) / len(circuit.outcomes)
+                        if circuit.outcomes
+                        else 0.0
+                    ),
+                }
+                for source, circuit in self._circuits.items()
+            }
+
+
+_shared_tracker = LatencyTracker()
+_shared_health: SourceHealth | None = None
+_shared_lock = threading.Lock()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """Tracker partagé : les mesures s'accumulent d'une recherche à l'autre."""
+    return _shared_tracker
+
+
+def get_source_health() -> SourceHealth:
+    """État de santé partagé par toutes les stratégies (sur le tracker partagé)."""
+    global _shared_health
+    with _shared_lock:
+        if _shared_health is None:
+            _shared_health = SourceHealth(_shared_tracker)
+        return _shared_health
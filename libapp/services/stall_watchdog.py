@@ -0,0 +1,225 @@
+"""
+Détection des blocages de la boucle d'événements Qt.
+
+Un QTimer du thread principal bat toutes les `heartbeat_ms` ; un thread de
+surveillance vérifie l'âge du dernier battement. Au-delà de `threshold_ms`,
+la boucle est considérée bloquée : la pile Python du thread principal est
+capturée (`sys._current_frames`), puis recapturée tant que le blocage dure.
+Au battement suivant, la durée du blocage est enregistrée dans
+`metrics_service` (opération `ui_stall`) et le rapport conservé pour le
+dialogue « Blocages de l'interface » (menu Aide).
+
+Ce module définit :
+- StallReport: Un blocage (début, durée, piles capturées, lieu).
+- StallWatchdog: Battement + thread de surveillance, rapports récents.
+- format_report: Texte d'un rapport.
+- get_stall_watchdog: Instance partagée.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+# Période du battement du thread principal
+HEARTBEAT_MS = 50
+# Retard du battement au-delà duquel la boucle est considérée bloquée
+STALL_THRESHOLD_MS = 250
+# Piles capturées au maximum par blocage (une par seuil écoulé)
+MAX_STACK_SAMPLES = 5
+# Rapports conservés
+MAX_REPORTS = 50
+
+
+@dataclass(slots=True)
+class StallReport:
+    """Un blocage de la boucle d'événements."""
+
+    started: datetime
+    duration_s: float = 0.0
+    ongoing: bool = True
+    where: str = "?"  # Frame applicative la plus profonde de la première pile
+    stacks: list[list[str]] = field(default_factory=list)
+
+
+def _format_stack(frame) -> tuple[list[str], str]:
+    """Pile formatée d'une frame et frame `libapp` la plus profonde."""
+    summary = traceback.extract_stack(frame)
+    where = "?"
+    for entry in reversed(summary):
+        path = entry.filename.replace("\\", "/")
+        if "/libapp/" in path:
+            where = f"libapp/{path.rsplit('/libapp/', 1)[1]}:{entry.lineno} {entry.name}"
+            break
+    return [line.rstrip() for line in traceback.format_list(summary)], where
+
+
+class StallWatchdog:
+    """Surveille les battements du thread principal et capture sa pile s'il se bloque."""
+
+    def __init__(
+        self,
+        *,
+        threshold_ms: float = STALL_THRESHOLD_MS,
+        heartbeat_ms: int = HEARTBEAT_MS,
+        max_reports: int = MAX_REPORTS,
+        clock: Callable[[], float] = time.monotonic,
+        record: bool = True,
+    ):
+        """
+        Args:
+            threshold_ms: Retard du battement considéré comme un blocage.
+            heartbeat_ms: Période du battement (QTimer).
+            max_reports: Nombre de rapports conservés.
+            clock: Horloge (remplaçable dans les tests).
+            record: Enregistrer les durées dans `metrics_service`.
+        """
+        self.threshold = threshold_ms / 1000
+        self.heartbeat_ms = heartbeat_ms
+        self.record = record
+        self._clock = clock
+        self._reports: deque[StallReport] = deque(maxlen=max_reports)
+        self._lock = threading.Lock()
+        self._last_beat: float | None = None
+        self._current: StallReport | None = None
+        self._last_sample = 0.0
+        self._main_thread_id = threading.main_thread().ident
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._timer = None
+
+    # ---------- Thread principal ----------
+
+    def attach(self, parent) -> None:
+        """Démarre le battement (QTimer de `parent`) et le thread de surveillance."""
+        from PySide6.QtCore import QTimer
+
+        self._main_thread_id = threading.get_ident()
+        self._timer = QTimer(parent)
+        self._timer.setInterval(self.heartbeat_ms)
+        self._timer.timeout.connect(self.beat)
+        self._timer.start()
+        self.start()
+
+    def beat(self) -> None:
+        """Battement (thread principal) : clôt le blocage en cours s'il y en a un."""
+        now = self._clock()
+        with self._lock:
+            previous, self._last_beat = self._last_beat, now
+            report, self._current = self._current, None
+        if previous is None:
+            return
+        # Retard par rapport au battement attendu
+        delay = now - previous - self.heartbeat_ms / 1000
+        if report is None and delay < self.threshold:
+            return
+        if report is None:
+            # Blocage plus court que la période de surveillance : durée seule
+            report = StallReport(started=datetime.now() - timedelta(seconds=delay))
+            with self._lock:
+                self._reports.append(report)
+        report.duration_s = max(0.0, delay)
+        report.ongoing = False
+        logger.warning(f"🧊 Interface bloquée {report.duration_s * 1000:.0f} ms ({report.where})")
+        if self.record:
+            from .metrics_service import record_metric
+
+            record_metric("ui_stall", report.duration_s, metadata={"where": report.where})
+
+    # ---------- Thread de surveillance ----------
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._timer is not None:
+            self._timer.stop()
+        if self._thread is not None:
+            self._thread.join(1.0)
+
+    def _run(self) -> None:
+        interval = max(0.01, min(self.threshold, self.heartbeat_ms / 1000) / 2)
+        while not self._stop.wait(interval):
+            self.check()
+
+    def check(self) -> StallReport | None:
+        """Vérifie l'âge du dernier battement ; capture la pile si la boucle est bloquée."""
+        now = self._clock()
+        with self._lock:
+            beat_seen = self._last_beat
+            if beat_seen is None:
+                return None
+            late = now - beat_seen - self.heartbeat_ms / 1000
+            if late < self.threshold:
+                return None
+            report = self._current
+            if report is not None and (
+                len(report.stacks) >= MAX_STACK_SAMPLES or now - self._last_sample < self.threshold
+            ):
+                report.duration_s = late
+                return report
+        frame = sys._current_frames().get(self._main_thread_id)
+        stack, where = _format_stack(frame) if frame is not None else ([], "?")
+        with self._lock:
+            if self._last_beat != beat_seen:
+                return None  # Le battement est revenu pendant la capture
+            if self._current is None:
+                started = datetime.now() - timedelta(seconds=late)
+                self._current = StallReport(started=started, where=where)
+                self._reports.append(self._current)
+            report = self._current
+            report.stacks.append(stack)
+            report.duration_s = late
+            self._last_sample = now
+        return report
+
+    # ---------- Rapports ----------
+
+    def reports(self) -> list[StallReport]:
+        """Rapports conservés, du plus récent au plus ancien."""
+        with self._lock:
+            return list(reversed(self._reports))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._reports.clear()
+
+
+def format_report(report: StallReport) -> str:
+    """Texte d'un rapport : en-tête puis piles capturées (la plus ancienne d'abord)."""
+    status = " (en cours)" if report.ongoing else ""
+    lines = [
+        f"{report.started:%Y-%m-%d %H:%M:%S} • {report.duration_s * 1000:.0f} ms{status}"
+        f" • {report.where}"
+    ]
+    for i, stack in enumerate(report.stacks, 1):
+        lines.append(f"--- Pile {i}/{len(report.stacks)} ---")
+        lines.extend(stack)
+    return "\n".join(lines)
+
+
+_shared_watchdog: StallWatchdog | None = None
+_shared_lock = threading.Lock()
+
+
+def get_stall_watchdog() -> StallWatchdog:
+    """Surveillance partagée de la boucle d'événements de l'application."""
+    global _shared_watchdog
+    with _shared_lock:
+        if _shared_watchdog is None:
+            _shared_watchdog = StallWatchdog()
+        return _shared_watchdog
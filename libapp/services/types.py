@@ -70,3 +70,4 @@ class ImportResult:
     updated: int
     skipped: int
     errors: list[ImportErrorItem]
+    cancelled: bool = False  # Import interrompu : seuls les lots déjà commités sont conservés
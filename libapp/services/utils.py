@@ -50,6 +50,26 @@ def normalize_isbn(isbn: str) -> str | None:
     return None
 
 
+def to_isbn13(isbn: str) -> str | None:
+    """
+    Forme ISBN-13 d'un ISBN (un ISBN-10 est préfixé par 978, clé recalculée).
+
+    Args:
+        isbn: ISBN-10 ou ISBN-13, éventuellement avec tirets
+
+    Returns:
+        ISBN-13 (chiffres seuls) ou None si la longueur est invalide
+    """
+    normalized = normalize_isbn(isbn)
+    if not normalized or len(normalized) == 13:
+        return normalized
+    body = "978" + normalized[:9]
+    if not body.isdigit():
+        return None
+    total = sum(int(c) * (1 if i % 2 == 0 else 3) for i, c in enumerate(body))
+    return body + str((10 - total % 10) % 10)
+
+
 def validate_isbn(isbn: str) -> bool:
     """
     Valide un ISBN-10 ou ISBN-13.
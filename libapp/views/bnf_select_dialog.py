@@ -4,6 +4,8 @@ Boîte de dialogue modale pour la sélection d'une notice bibliographique.
 Ce module est utilisé lorsque une recherche externe (comme celle de la BnF)
 retourne plusieurs résultats possibles pour une même requête (par exemple, un ISBN).
 Il présente ces résultats à l'utilisateur et lui permet d'en choisir un.
+Les résultats peuvent aussi arriver au fil de l'eau (`add_notices`) pendant
+qu'une recherche multi-sources se poursuit en arrière-plan.
 """
 
 from __future__ import annotations
@@ -33,9 +35,15 @@ class BnfSelectDialog(QDialog):
     La fenêtre est modale. Après sa fermeture, l'attribut `self.selected_notice`
     contiendra la notice choisie par l'utilisateur (un dictionnaire) si le
     dialogue a été accepté, sinon il sera `None`.
+
+    En mode recherche (`searching=True`), la liste démarre vide et se remplit
+    via `add_notices` ; les notices portant une clé "score" sont classées par
+    score décroissant et seules les MAX_ITEMS meilleures sont conservées.
     """
 
-    def __init__(self, parent=None, items: list[BnfNotice] | None = None):
+    MAX_ITEMS = 10
+
+    def __init__(self, parent=None, items: list[BnfNotice] | None = None, searching: bool = False):
         """
         Initialise la boîte de dialogue.
 
@@ -43,33 +51,27 @@ class BnfSelectDialog(QDialog):
             parent: Le widget parent de cette fenêtre.
             items: Une liste de dictionnaires, chaque dictionnaire représentant
                    une notice de livre trouvée.
+            searching: True si des résultats doivent encore arriver.
         """
         super().__init__(parent)
         self.setWindowTitle(translate("bnf_select.title"))
 
         # Attribut public pour stocker le résultat
         self.selected_notice: BnfNotice | None = None
+        self._sources_done: list[str] = []
 
         items = items or []
 
         # --- Création des widgets et du layout ---
         v_layout = QVBoxLayout(self)
-        v_layout.addWidget(QLabel(translate("bnf_select.multiple_results")))
+        self.status_label = QLabel(
+            translate("bnf_select.searching" if searching else "bnf_select.multiple_results")
+        )
+        v_layout.addWidget(self.status_label)
 
         self.list_widget = QListWidget()
         for notice in items:
-            # Construit une ligne lisible pour l'affichage
-            title = notice.get("title", translate("bnf_select.unknown_title"))
-            author = notice.get("author", translate("bnf_select.unknown_author"))
-            year = notice.get("year", "N/A")
-            line = f"{title} — {author} ({year})"
-            if isbn := notice.get("isbn"):
-                line += f" [ISBN {isbn}]"
-
-            list_item = QListWidgetItem(line)
-            # Astuce : on stocke la notice complète (le dict) dans l'item
-            list_item.setData(Qt.UserRole, notice)
-            self.list_widget.addItem(list_item)
+            self.list_widget.addItem(self._make_item(notice))
 
         v_layout.addWidget(self.list_widget)
 
@@ -88,6 +90,62 @@ class BnfSelectDialog(QDialog):
         # Permet de valider avec un double-clic sur un item
         self.list_widget.itemDoubleClicked.connect(self._on_accept)
 
+    @staticmethod
+    def _make_item(notice: BnfNotice) -> QListWidgetItem:
+        """Construit une ligne lisible pour l'affichage."""
+        title = notice.get("title", translate("bnf_select.unknown_title"))
+        author = notice.get("author", translate("bnf_select.unknown_author"))
+        year = notice.get("year", "N/A")
+        line = f"{title} — {author} ({year})"
+        if isbn := notice.get("isbn"):
+            line += f" [ISBN {isbn}]"
+        if source := notice.get("source"):
+            line += f" {source}"
+
+        list_item = QListWidgetItem(line)
+        # Astuce : on stocke la notice complète (le dict) dans l'item
+        list_item.setData(Qt.UserRole, notice)
+        return list_item
+
+    # ---------- Résultats progressifs ----------
+
+    def add_notices(self, notices: list[BnfNotice]) -> None:
+        """Insère des notices à leur rang (score décroissant), sans changer la sélection."""
+        for notice in notices:
+            score = notice.get("score", 0.0)
+            row = 0
+            while row < self.list_widget.count():
+                other = self.list_widget.item(row).data(Qt.UserRole)
+                if other.get("score", 0.0) < score:
+                    break
+                row += 1
+            if row >= self.MAX_ITEMS:
+                continue
+            self.list_widget.insertItem(row, self._make_item(notice))
+            while self.list_widget.count() > self.MAX_ITEMS:
+                self.list_widget.takeItem(self.list_widget.count() - 1)
+
+        if self.list_widget.currentItem() is None and self.list_widget.count():
+            self.list_widget.setCurrentRow(0)
+
+    def set_source_done(self, source_name: str, count: int) -> None:
+        """Indique qu'une source a répondu."""
+        self._sources_done.append(
+            translate("bnf_select.source_done", source=source_name, count=count)
+        )
+        self.status_label.setText(
+            f"{translate('bnf_select.searching')} {' • '.join(self._sources_done)}"
+        )
+
+    def set_search_finished(self) -> None:
+        """Indique que toutes les sources ont répondu."""
+        key = "bnf_select.multiple_results" if self.list_widget.count() else "bnf_select.no_results"
+        self.status_label.setText(translate(key))
+
+    def set_search_failed(self, error: str) -> None:
+        """Indique que la recherche a échoué (les notices déjà reçues restent choisissables)."""
+        self.status_label.setText(translate("bnf_select.search_failed", error=error))
+
     def _on_accept(self):
         """
         Gère la validation du dialogue.
@@ -7,10 +7,19 @@ Vue principale affichant la liste des livres de la bibliothèque.
 from __future__ import annotations
 
 import logging
-
-from PySide6.QtCore import QAbstractTableModel, QByteArray, QModelIndex, Qt, Signal, Slot
+from collections import OrderedDict
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QByteArray,
+    QModelIndex,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+    Slot,
+)
 from PySide6.QtWidgets import (
-    QApplication,
     QDialog,
     QHBoxLayout,
     QLabel,
@@ -23,22 +32,45 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
 
 from ..persistence.database import get_session
 from ..persistence.models_sa import Book
+from ..persistence.projections import SUMMARY_PREVIEW_CHARS, BookListRow
+from ..persistence.repositories import BOOK_SORT_COLUMNS, RELEVANCE_SORT_KEY, BookRepository
 from ..services.audit_service import audit_book_created, audit_book_deleted, audit_book_updated
 from ..services.export_service import ExportMetadata, export_data
 from ..services.meta_search_service import BestResultStrategy, MetaSearchService
 from ..services.preferences import Preferences
+from ..services.search_index import build_fts_query
 from ..services.translation_service import translate
 from .export_dialog import ExportDialog
+from .meta_search_worker import MetaSearchWorker
 from .natural_sort_proxy import NaturalSortProxyModel
 
 logger = logging.getLogger(__name__)
 
 
 class BookTableModel(QAbstractTableModel):
-    """Modèle de données Qt pour la table des livres."""
+    """Modèle de données Qt pour la table des livres.
+
+    Le modèle est fenêtré : les livres sont lus par pages en pagination par
+    clé (keyset) sur la colonne de tri + id. Qt réclame les pages suivantes
+    via `canFetchMore` / `fetchMore` au fil du défilement, et seules les
+    `MAX_CACHED_PAGES` pages les plus récemment consultées restent en mémoire
+    (les autres sont relues à la demande à partir de leur curseur).
+    Une page relue qui ne correspond plus à la fenêtre (livres ajoutés ou
+    supprimés entre-temps) déclenche une réinitialisation du modèle.
+    Le tri et le filtre sont exécutés en SQL. Sans colonne de tri choisie,
+    un filtre plein texte classe les livres par pertinence (bm25 pondéré),
+    sinon par titre.
+
+    Les pages contiennent des projections `BookListRow` (colonnes affichées,
+    résumé tronqué) ; l'objet `Book` complet s'obtient avec `load_book()`.
+    """
+
+    PAGE_SIZE = 200
+    MAX_CACHED_PAGES = 25
 
     # 🎯 Toutes les colonnes disponibles (identifiant: label par défaut)
     ALL_COLUMNS = {
@@ -56,9 +88,24 @@ class BookTableModel(QAbstractTableModel):
         "cover_image": translate("column.cover_image"),
     }
 
+    # Indique à NaturalSortProxyModel que le tri est délégué au modèle source
+    handles_sorting = True
+
     def __init__(self, visible_columns: list[str] | None = None):
         super().__init__()
-        self._all_books: list[Book] = []
+        # Fenêtre de pages : curseurs de fin de page + cache LRU des pages
+        self._page_cursors: list[tuple] = []
+        self._pages: OrderedDict[int, list[BookListRow]] = OrderedDict()
+        self._row_count = 0
+        self._exhausted = True
+        self._reload_pending = False
+
+        # Tri et filtre (exécutés en SQL) ; None = aucune colonne de tri choisie
+        self._sort_key: str | None = None
+        self._descending = False
+        self._search_text = ""
+        self._fts_match: str | None = None
+        self._like: str | None = None
 
         # Colonnes visibles (par défaut = toutes)
         if visible_columns is None:
@@ -69,34 +116,172 @@ class BookTableModel(QAbstractTableModel):
         self._visible_columns = [col for col in self._visible_columns if col in self.ALL_COLUMNS]
         self._column_headers = [self.ALL_COLUMNS[col] for col in self._visible_columns]
 
-    def set_books(self, books: list[Book]):
+    # --- Chargement des pages ---
+
+    def _query_page(
+        self,
+        after: tuple | None,
+        limit: int | None = None,
+        summary_chars: int | None = SUMMARY_PREVIEW_CHARS,
+    ) -> list[BookListRow]:
+        with get_session() as session:
+            return BookRepository(session).page(
+                sort_key=self._effective_sort_key(),
+                descending=self._descending,
+                after=after,
+                limit=limit or self.PAGE_SIZE,
+                fts_match=self._fts_match,
+                like=self._like,
+                summary_chars=summary_chars,
+            )
+
+    def _effective_sort_key(self) -> str:
+        if self._sort_key is not None:
+            return self._sort_key
+        return RELEVANCE_SORT_KEY if self._fts_match else "title"
+
+    def _cursor_of(self, book: BookListRow) -> tuple:
+        return (BookRepository.sort_value(book, self._effective_sort_key()), book.id)
+
+    def _store_page(self, page_index: int, books: list[BookListRow]) -> None:
+        self._pages[page_index] = books
+        self._pages.move_to_end(page_index)
+        while len(self._pages) > self.MAX_CACHED_PAGES:
+            self._pages.popitem(last=False)
+
+    def _load_next_page(self) -> list[BookListRow]:
+        """Lit la page suivant la dernière page connue et met à jour les curseurs."""
+        page_index = len(self._page_cursors)
+        after = self._page_cursors[-1] if self._page_cursors else None
+        try:
+            books = self._query_page(after)
+        except OperationalError as e:
+            if self._fts_match is None:
+                raise
+            # Index FTS5 indisponible : repli sur un filtre sous-chaîne SQL
+            logger.warning(f"[BookTableModel] Index plein texte indisponible : {e}")
+            self._fts_match, self._like = None, self._search_text
+            books = self._query_page(after)
+
+        if len(books) < self.PAGE_SIZE:
+            self._exhausted = True
+        if books:
+            self._page_cursors.append(self._cursor_of(books[-1]))
+            self._store_page(page_index, books)
+        return books
+
+    def _page(self, page_index: int) -> list[BookListRow]:
+        """Retourne une page, relue depuis son curseur si elle a été évincée."""
+        books = self._pages.get(page_index)
+        if books is not None:
+            self._pages.move_to_end(page_index)
+            return books
+        after = self._page_cursors[page_index - 1] if page_index > 0 else None
+        books = self._query_page(after)
+        expected = min(self.PAGE_SIZE, self._row_count - page_index * self.PAGE_SIZE)
+        boundary = self._cursor_of(books[-1]) if books else None
+        if len(books) != expected or boundary != self._page_cursors[page_index]:
+            # Catalogue modifié depuis la première lecture : lignes décalées
+            self._schedule_reload()
+        self._store_page(page_index, books)
+        return books
+
+    def _schedule_reload(self) -> None:
+        """Réinitialise le modèle au prochain tour de boucle (pas pendant `data()`)."""
+        if self._reload_pending:
+            return
+        logger.info("[BookTableModel] Page relue différente : réinitialisation de la fenêtre")
+        self._reload_pending = True
+        QTimer.singleShot(0, self.reload)
+
+    def reload(self) -> None:
+        """Réinitialise la fenêtre et lit la première page (tri/filtre courants)."""
         self.beginResetModel()
-        self._all_books = list(books)
-        self._filtered_books = list(books)
+        self._reload_pending = False
+        self._page_cursors = []
+        self._pages.clear()
+        self._row_count = 0
+        self._exhausted = False
+        self._row_count = len(self._load_next_page())
         self.endResetModel()
 
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid() or self._exhausted:
+            return
+        books = self._load_next_page()
+        if not books:
+            return
+        first = self._row_count
+        self.beginInsertRows(QModelIndex(), first, first + len(books) - 1)
+        self._row_count += len(books)
+        self.endInsertRows()
+
+    # --- Filtre et tri ---
+
     def apply_filter(self, search_text: str):
-        search_term = (search_text or "").strip().lower()
-        self.beginResetModel()
-        if not search_term:
-            self._filtered_books = list(self._all_books)
-        else:
-            self._filtered_books = [
-                book
-                for book in self._all_books
-                if search_term in (book.title or "").lower()
-                or search_term in (book.authors_text or "").lower()
-                or search_term in (book.isbn or "").lower()
-            ]
-        self.endResetModel()
+        """Filtre via l'index plein texte FTS5 (repli sous-chaîne SQL sans FTS5)."""
+        self._search_text = (search_text or "").strip()
+        self._fts_match = build_fts_query(self._search_text) if self._search_text else None
+        self._like = None
+        self.reload()
 
-    def get_book_by_row(self, row: int) -> Book | None:
-        if 0 <= row < len(self._filtered_books):
-            return self._filtered_books[row]
-        return None
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """Trie en SQL sur la colonne demandée (colonnes non triables ignorées).
+
+        Une colonne négative (indicateur de tri effacé) rétablit l'ordre par
+        défaut : pertinence si un filtre plein texte est actif, sinon titre.
+        """
+        if column >= len(self._visible_columns):
+            return
+        sort_key = self._visible_columns[column] if column >= 0 else None
+        if sort_key is not None and sort_key not in BOOK_SORT_COLUMNS:
+            return
+        descending = sort_key is not None and order == Qt.SortOrder.DescendingOrder
+        if (sort_key, descending) == (self._sort_key, self._descending):
+            return
+        self._sort_key, self._descending = sort_key, descending
+        self.reload()
+
+    # --- Accès aux livres ---
+
+    def get_book_by_row(self, row: int) -> BookListRow | None:
+        if not (0 <= row < self._row_count):
+            return None
+        page = self._page(row // self.PAGE_SIZE)
+        offset = row % self.PAGE_SIZE
+        return page[offset] if offset < len(page) else None
+
+    def iter_books(self):
+        """Parcourt tous les livres du filtre courant, dans l'ordre affiché.
+
+        Les livres sont lus par lots en pagination par clé, indépendamment de
+        la fenêtre chargée, avec le résumé complet (utilisé pour l'export).
+        """
+        after = None
+        while True:
+            books = self._query_page(after, limit=1000, summary_chars=None)
+            yield from books
+            if len(books) < 1000:
+                return
+            after = self._cursor_of(books[-1])
+
+    @staticmethod
+    def load_book(book_id: int) -> Book | None:
+        """Relit l'objet Book complet (éditeur, panneau de détails, enrichissement)."""
+        with get_session() as session:
+            # La fermeture de la session détache le livre (attributs déjà chargés)
+            return BookRepository(session).get(book_id)
+
+    def total_count(self) -> int:
+        """Nombre total de livres correspondant au filtre courant."""
+        with get_session() as session:
+            return BookRepository(session).count(fts_match=self._fts_match, like=self._like)
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
-        return 0 if parent.isValid() else len(self._filtered_books)
+        return 0 if parent.isValid() else self._row_count
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         return 0 if parent.isValid() else len(self._visible_columns)
@@ -105,11 +290,11 @@ class BookTableModel(QAbstractTableModel):
         """Données d'une cellule."""
         if not index.isValid():
             return None
-        if not (0 <= index.row() < len(self._filtered_books)):
-            return None
         if not (0 <= index.column() < len(self._visible_columns)):
             return None
-        book = self._filtered_books[index.row()]
+        book = self.get_book_by_row(index.row())
+        if book is None:
+            return None
         col_name = self._visible_columns[index.column()]
 
         if role == Qt.ItemDataRole.DisplayRole:
@@ -154,7 +339,7 @@ class BookTableModel(QAbstractTableModel):
             return None
 
         elif role == Qt.ItemDataRole.UserRole:
-            # Retourner l'objet book complet
+            # Retourner la ligne (projection) du livre
             return book
 
         return None
@@ -167,9 +352,9 @@ class BookTableModel(QAbstractTableModel):
                 return self._column_headers[section]  # ← Utiliser section !
         return None
 
-    def get_book_at(self, row: int) -> Book:
+    def get_book_at(self, row: int) -> BookListRow | None:
         """Retourne le livre à la ligne donnée."""
-        return self._filtered_books[row]
+        return self.get_book_by_row(row)
 
 
 class BookListView(QWidget):
@@ -181,6 +366,11 @@ class BookListView(QWidget):
     def __init__(self, parent: QWidget, prefs: Preferences):
         super().__init__(parent)
         self._prefs = prefs
+        # Recherche multi-sources en cours (voir _on_open_bnf)
+        self._meta_workers: list[MetaSearchWorker] = []
+        self._meta_worker: MetaSearchWorker | None = None  # Recherche du dialogue ouvert
+        self._meta_dialog = None
+        self._meta_fallback_isbn = ""
         self._setup_ui()
         self._connect_signals()
         self.load_view_state()
@@ -200,6 +390,10 @@ class BookListView(QWidget):
         self.proxy_model = NaturalSortProxyModel()
         self.proxy_model.setSourceModel(self.table_model)
         self.table_view.setModel(self.proxy_model)
+        # Aucun tri initial (ordre par défaut du modèle) ; un 3e clic efface le tri
+        header = self.table_view.horizontalHeader()
+        header.setSortIndicatorClearable(True)
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
         self.table_view.setSortingEnabled(True)
         self.table_view.horizontalHeader().setStretchLastSection(False)
         self.table_view.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
@@ -243,18 +437,7 @@ class BookListView(QWidget):
 
     @Slot()
     def refresh(self):
-        """Recharge les données depuis la BDD et applique le filtre."""
-        with get_session() as session:
-            result = session.scalars(select(Book).order_by(Book.title)).all()
-
-            # 🔧 FIX CRITIQUE : Détacher les objets AVANT la fermeture de la session
-            books = []
-            for book in result:
-                session.expunge(book)  # Détache l'objet de la session
-                books.append(book)
-
-        # Maintenant la session est fermée, mais les objets sont accessibles
-        self.table_model.set_books(books)
+        """Recharge les données depuis la BDD (première page) et applique le filtre."""
         if self._prefs.books_view_state and "header_state" in self._prefs.books_view_state:
             try:
                 header_state = QByteArray.fromBase64(
@@ -329,7 +512,10 @@ class BookListView(QWidget):
             return
 
         source_index = self.proxy_model.mapToSource(selection[0])
-        book = self.table_model._filtered_books[source_index.row()]
+        row = self.table_model.get_book_by_row(source_index.row())
+        book = self.table_model.load_book(row.id) if row else None
+        if not book:
+            return
 
         # Sauvegarder l'état avant modification
         old_title = book.title
@@ -354,7 +540,9 @@ class BookListView(QWidget):
             return
 
         source_index = self.proxy_model.mapToSource(selection[0])
-        book = self.table_model._filtered_books[source_index.row()]
+        book = self.table_model.get_book_by_row(source_index.row())
+        if not book:
+            return
 
         # Sauvegarder les infos avant suppression
         book_id = book.id
@@ -495,95 +683,98 @@ class BookListView(QWidget):
         source_index = self.proxy_model.mapToSource(proxy_index)
         book_index = source_index.row()
 
-        book = self.table_model.get_book_by_row(book_index)
+        row = self.table_model.get_book_by_row(book_index)
+        book = self.table_model.load_book(row.id) if row else None
         if not book:
             return
 
-        # Initialiser le service de recherche avec stratégie avancée
-        metaservice = MetaSearchService(strategy=BestResultStrategy())
+        from .bnf_select_dialog import BnfSelectDialog
 
-        # 🔥 PROGRESS BAR
-        progress = self.create_native_progress()
-        progress.show()
+        # Pas de résultat périmé d'une recherche précédente encore en cours
+        self._prune_meta_workers()
 
-        try:
-            searchresults = []
-
-            # ÉTAPE 1
-            if book.isbn and book.isbn.strip():
-                progress.setLabelText(translate("book_list.search_isbn"))
-                progress.setValue(20)
-                QApplication.processEvents()
-
-                searchresults.extend(metaservice.search_by_isbn(book.isbn.strip(), {}))
-                progress.progress.setValue(60)
-                QApplication.processEvents()
-
-            # ÉTAPE 2
-            if not searchresults and book.title:
-                progress.setLabelText(translate("book_list.search_title_author"))
-                progress.setValue(80)
-
-                author_text = book.authors_text or ""
-                searchresults.extend(
-                    metaservice.search_by_title_author(book.title, author_text, {})
-                )
-
-            progress.setLabelText(translate("book_list.search_completed"))
-            progress.setValue(100)
-            QApplication.processEvents()
-
-            # Petit délai pour voir le "TERMINÉ"
-            import time
+        # La recherche tourne dans le QThreadPool ; chaque source alimente le
+        # dialogue dès qu'elle répond, l'utilisateur peut choisir sans attendre les autres
+        dialog = BnfSelectDialog(self, searching=True)
+        worker = MetaSearchWorker(
+            MetaSearchService(strategy=BestResultStrategy()),
+            isbn=(book.isbn or "").strip(),
+            title=book.title or "",
+            author=book.authors_text or "",
+        )
+        worker.signals.results.connect(self._on_meta_results)
+        worker.signals.finished.connect(self._on_meta_finished)
+        worker.signals.failed.connect(self._on_meta_failed)
+        self._meta_workers.append(worker)
+        self._meta_worker = worker
+        self._meta_dialog = dialog
+        self._meta_fallback_isbn = book.isbn or ""
+        QThreadPool.globalInstance().start(worker)
 
-            time.sleep(0.5)
+        try:
+            accepted = dialog.exec() == QDialog.DialogCode.Accepted and dialog.selected_notice
+        finally:
+            worker.cancel()
+            self._meta_worker = None
+            self._meta_dialog = None
 
-            # 3. Affichage des résultats
-            if not searchresults:
-                QMessageBox.information(
+        if accepted:
+            try:
+                self._enrich_book_with_result(book, dialog.selected_notice["_unified_result"])
+            except Exception as e:
+                QMessageBox.critical(
                     self,
-                    "Recherche",
-                    "Aucun résultat trouvé pour ce livre sur les sources bibliographiques.",
+                    translate("book_list.error_title"),
+                    translate("book_list.search_error", error=str(e)),
                 )
-                return
 
-            # 4. Sélection via BnfSelectDialog
-            dialog_items = []
-            for result in searchresults[:10]:
-                dialog_item = {
-                    "title": result.display_title,
-                    "author": result.authors_display,
-                    "year": result.year_display,
-                    "publisher": result.publisher or "Éditeur inconnu",
-                    "isbn": result.isbn or book.isbn or "",
-                    "source": f"[{result.source.name}] Score: {result.score:.1f}/100",
-                    "_unified_result": result,
-                }
-                dialog_items.append(dialog_item)
+    def _prune_meta_workers(self) -> None:
+        """Oublie les workers de recherche terminés."""
+        self._meta_workers = [w for w in self._meta_workers if not w.is_done()]
+
+    def _result_to_notice(self, result) -> dict:
+        """Convertit un UnifiedBookResult en notice pour BnfSelectDialog."""
+        return {
+            "title": result.display_title,
+            "author": result.authors_display,
+            "year": result.year_display,
+            "publisher": result.publisher or "Éditeur inconnu",
+            "isbn": result.isbn or self._meta_fallback_isbn,
+            "source": f"[{result.source.name}] Score: {result.score:.1f}/100",
+            "score": result.score,
+            "_unified_result": result,
+        }
 
-            from .bnf_select_dialog import BnfSelectDialog
+    def _meta_signal_is_current(self) -> bool:
+        """True si le signal en cours vient du worker du dialogue ouvert.
 
-            dialog = BnfSelectDialog(self, items=dialog_items)
+        Les signaux d'un worker annulé peuvent encore être en file quand le
+        dialogue du livre suivant est ouvert : ils sont ignorés.
+        """
+        worker = self._meta_worker
+        return (
+            worker is not None and self._meta_dialog is not None and self.sender() is worker.signals
+        )
 
-            if dialog.exec() == QDialog.DialogCode.Accepted and dialog.selected_notice:
-                selected_result = dialog.selected_notice["_unified_result"]
-                self._enrich_book_with_result(book, selected_result)
+    @Slot(str, object)
+    def _on_meta_results(self, source_name: str, results: list) -> None:
+        """Résultats d'une source : classés dans le dialogue ouvert."""
+        if not self._meta_signal_is_current():
+            return
+        self._meta_dialog.add_notices([self._result_to_notice(r) for r in results])
+        self._meta_dialog.set_source_done(source_name, len(results))
 
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                translate("book_list.error_title"),
-                translate("book_list.search_error", error=str(e)),
-            )
+    @Slot(int)
+    def _on_meta_finished(self, _total: int) -> None:
+        self._prune_meta_workers()
+        if self._meta_signal_is_current():
+            self._meta_dialog.set_search_finished()
 
-        except Exception as e:
-            progress.close()
-            QMessageBox.critical(
-                self,
-                translate("book_list.error_title"),
-                translate("book_list.search_error", error=str(e)),
-            )
-            return
+    @Slot(str)
+    def _on_meta_failed(self, error: str) -> None:
+        self._prune_meta_workers()
+        if self._meta_signal_is_current():
+            self._meta_dialog.set_search_failed(error)
 
     def _enrich_book_with_result(self, book, result):
         """Enrichit un livre avec les données d'un UnifiedBookResult."""
@@ -715,19 +906,16 @@ class BookListView(QWidget):
             # 🎯 Récupérer le dernier livre créé (par ID max)
             with get_session() as session:
                 last_book = session.execute(
-                    select(Book).order_by(Book.id.desc()).limit(1)
-                ).scalar_one_or_none()
-
-                if last_book:
-                    book_id = last_book.id
-                    book_title = last_book.title or "(sans titre)"
-                    session.expunge(last_book)
+                    select(Book.id, Book.title).order_by(Book.id.desc()).limit(1)
+                ).first()
 
             self.refresh()
 
             # 🎯 AUDIT : Logger la création
             if last_book:
-                audit_book_created(book_id=book_id, title=book_title, user="system")
+                audit_book_created(
+                    book_id=last_book.id, title=last_book.title or "(sans titre)", user="system"
+                )
 
     def _on_export(self) -> None:
         """Exporte la liste des livres (filtrés) vers CSV ou XLSX.
@@ -783,9 +971,10 @@ class BookListView(QWidget):
             # 7. Préparer les headers (traduits)
             headers = [translate(f"book_list.column.{col_id}") for col_id in selected_columns]
 
-            # 8. Extraire les données des livres FILTRÉS
-            filtered_books = self.table_model._filtered_books
-            total_books = len(filtered_books)
+            # 8. Extraire les données des livres FILTRÉS (lus par lots, pas seulement
+            #    la fenêtre affichée)
+            filtered_books = self.table_model.iter_books()
+            total_books = self.table_model.total_count()
 
             # Créer la progress bar
             progress = QProgressDialog(
@@ -11,7 +11,7 @@ from __future__ import annotations
 from pathlib import Path
 
 import pandas as pd
-from PySide6.QtCore import Qt, Slot
+from PySide6.QtCore import Qt, QThreadPool, Slot
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -31,10 +31,10 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from ..services.import_service import parse_xlsx, upsert_rows, validate_rows
 from ..services.preferences import Preferences, save_preferences
 from ..services.translation_service import translate
-from ..services.types import ImportErrorItem
+from ..services.types import ImportErrorItem, ImportResult
+from .import_worker import ImportWorker
 
 BOOK_FIELDS = [
     "title",
@@ -68,6 +68,7 @@ class ImportDialog(QDialog):
         self.file_headers: list[str] = []
         self.mapping_combos: dict[str, QComboBox] = {}
         self.report_data: list[ImportErrorItem] = []
+        self._worker: ImportWorker | None = None
         self._setup_ui()
         self._connect_signals()
         self._load_prefs()
@@ -311,27 +312,51 @@ class ImportDialog(QDialog):
         }
         save_preferences(self._prefs)
 
-        # pipeline
+        # pipeline en flux (lecture -> validation -> upsert par lots) hors du thread UI
         self.progress.setVisible(True)
         self.progress_label.setVisible(True)
-        self.progress.setMaximum(0)  # indéterminé pendant parse
+        self.progress.setMaximum(0)  # indéterminé tant que le total n'est pas connu
         self.progress_label.setText(translate("import_dialog.progress.reading"))
-        batch = parse_xlsx(str(self.file_path), user_mapping)
-        self._handle_messages(batch.errors)
+        self.import_btn.setEnabled(False)
+        self.pick_file_btn.setEnabled(False)
 
-        self.progress.setMaximum(100)
-        self.progress.setValue(0)
-        self.progress_label.setText(translate("import_dialog.progress.validation"))
-        rows, warns = validate_rows(batch.rows)
-        self._handle_messages(warns)
+        self._worker = ImportWorker(
+            self.file_path,
+            user_mapping,
+            on_isbn_conflict=self.policy_combo.currentText(),
+            chunk_size=self._prefs.import_chunk_size,
+        )
+        self._worker.signals.progress.connect(self._on_import_progress)
+        self._worker.signals.finished.connect(self._on_import_finished)
+        self._worker.signals.failed.connect(self._on_import_failed)
+        QThreadPool.globalInstance().start(self._worker)
+
+    @Slot(int, int)
+    def _on_import_progress(self, done: int, total: int):
+        if self._worker is None or self._worker.is_cancelled():
+            return
+        if total:
+            self.progress.setMaximum(total)
+            self.progress.setValue(min(done, total))
+        self.progress_label.setText(
+            translate("import_dialog.progress.rows", done=done, total=total or "?")
+        )
 
-        self.progress_label.setText(translate("import_dialog.progress.saving"))
-        result = upsert_rows(rows, on_isbn_conflict=self.policy_combo.currentText())
+    @Slot(object)
+    def _on_import_finished(self, result: ImportResult):
+        self._worker = None
         self._handle_messages(result.errors)
-
         self.progress.setVisible(False)
         self.progress_label.setVisible(False)
         ok = result.inserted + result.updated
+        if result.cancelled:
+            QMessageBox.information(
+                self,
+                translate("import_dialog.import_cancelled_title"),
+                translate("import_dialog.import_cancelled_message", count=ok),
+            )
+            super().reject()
+            return
         QMessageBox.information(
             self,
             translate("import_dialog.import_done_title"),
@@ -339,6 +364,28 @@ class ImportDialog(QDialog):
         )
         self.accept()
 
+    @Slot(str)
+    def _on_import_failed(self, error: str):
+        self._worker = None
+        self.progress.setVisible(False)
+        self.progress_label.setVisible(False)
+        self.import_btn.setEnabled(True)
+        self.pick_file_btn.setEnabled(True)
+        QMessageBox.critical(
+            self,
+            translate("import_dialog.import_failed_title"),
+            translate("import_dialog.import_failed_message", error=error),
+        )
+
+    def reject(self):
+        """Annuler pendant un import demande l'arrêt du worker au lieu de fermer."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self.progress.setMaximum(0)
+            self.progress_label.setText(translate("import_dialog.progress.cancelling"))
+            return
+        super().reject()
+
     def _handle_messages(self, items: list[ImportErrorItem]):
         if not items:
             return
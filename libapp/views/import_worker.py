@@ -0,0 +1,107 @@
+"""
+Exécution de l'import de livres hors du thread de l'interface.
+
+Ce module définit :
+- ImportWorkerSignals: Les signaux Qt émis par le worker (progression,
+  fin, échec), délivrés dans le thread de l'interface.
+- ImportWorker: Un QRunnable (QThreadPool) qui enchaîne lecture, validation
+  et upsert par lots, avec une progression limitée à quelques signaux par
+  seconde et une annulation coopérative.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from pathlib import Path
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from ..services.import_service import (
+    DEFAULT_IMPORT_CHUNK_SIZE,
+    count_xlsx_rows,
+    iter_validated_rows,
+    iter_xlsx_rows,
+    upsert_rows,
+)
+from ..services.types import ImportErrorItem
+
+logger = logging.getLogger(__name__)
+
+
+class ImportWorkerSignals(QObject):
+    """Signaux de l'import (un QRunnable ne peut pas porter de signaux)."""
+
+    progress = Signal(int, int)  # lignes traitées, total (0 si inconnu)
+    finished = Signal(object)  # ImportResult (erreurs de lecture et avertissements inclus)
+    failed = Signal(str)
+
+
+class ImportWorker(QRunnable):
+    """Import XLSX complet exécuté dans le QThreadPool."""
+
+    # Intervalle minimal entre deux signaux de progression (secondes)
+    PROGRESS_INTERVAL_S = 0.25
+
+    def __init__(
+        self,
+        file_path: str | Path,
+        mapping_ui: dict[str, str],
+        on_isbn_conflict: str = "merge",
+        chunk_size: int = DEFAULT_IMPORT_CHUNK_SIZE,
+    ):
+        super().__init__()
+        # Le dialogue garde la référence : Qt ne doit pas détruire l'objet
+        self.setAutoDelete(False)
+        self.signals = ImportWorkerSignals()
+        self._file_path = str(file_path)
+        self._mapping_ui = mapping_ui
+        self._on_isbn_conflict = on_isbn_conflict
+        self._chunk_size = chunk_size
+        self._cancel_event = threading.Event()
+        self._last_emit = 0.0
+
+    def cancel(self) -> None:
+        """Demande l'arrêt : le lot en cours est abandonné, les lots commités restent."""
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def _report(self, done: int, total: int, _message: str = "") -> None:
+        """Callback `_progress` du service, limité à PROGRESS_INTERVAL_S."""
+        now = time.monotonic()
+        if now - self._last_emit < self.PROGRESS_INTERVAL_S:
+            return
+        self._last_emit = now
+        # Index de ligne (commence à 2) -> nombre de lignes traitées
+        self.signals.progress.emit(max(done - 1, 0), total)
+
+    def run(self) -> None:
+        read_errors: list[ImportErrorItem] = []
+        warnings: list[ImportErrorItem] = []
+        try:
+            total = count_xlsx_rows(self._file_path) or 0
+            self.signals.progress.emit(0, total)
+            rows = iter_validated_rows(
+                iter_xlsx_rows(self._file_path, self._mapping_ui, read_errors),
+                warnings,
+                _progress=self._report,
+                total=total,
+            )
+            result = upsert_rows(
+                rows,
+                on_isbn_conflict=self._on_isbn_conflict,
+                _progress=self._report,
+                chunk_size=self._chunk_size,
+                total=total,
+                cancel_event=self._cancel_event,
+            )
+        except Exception as e:
+            logger.error(f"❌ Import en arrière-plan échoué : {e}")
+            self.signals.failed.emit(str(e))
+            return
+
+        result.errors = read_errors + warnings + result.errors
+        self.signals.finished.emit(result)
@@ -24,6 +24,7 @@ from sqlalchemy import select
 
 from ..persistence.database import get_session
 from ..persistence.models_sa import Book, Member
+from ..persistence.projections import BookListRow, MemberListRow
 from ..services.loan_service import LoanError, create_loan
 from ..services.translation_service import translate
 
@@ -39,8 +40,8 @@ class LoanDialog(QDialog):
     def __init__(
         self,
         parent: QWidget,
-        book: Book | None = None,
-        member: Member | None = None,
+        book: Book | BookListRow | None = None,
+        member: Member | MemberListRow | None = None,
     ):
         """
         Initialise le dialogue de prêt.
@@ -157,11 +158,6 @@ class LoanDialog(QDialog):
                 loan_date=date.today(),
             )
 
-            # 🎯 Si livre pré-sélectionné, mettre à jour l'objet local
-            # (pour que la vue rafraîchisse sans recharger)
-            if self._preselected_book:
-                self._preselected_book.copies_available -= 1
-
             QMessageBox.information(
                 self,
                 translate("messages.success"),
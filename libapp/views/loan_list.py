@@ -2,7 +2,7 @@
 Vue principale pour l'affichage et la gestion de la liste des prêts.
 
 Ce module définit une architecture complète pour afficher les prêts :
-- LoanRow: Un dataclass simple pour représenter les données d'une ligne de tableau.
+- LoanListRow: Projection légère (persistence.projections) d'une ligne de tableau.
 - LoanTableModel: Le modèle de données Qt qui gère le tri, le filtrage et
   le style conditionnel (ex: couleur pour les retards).
 - LoanListView: Le widget principal qui assemble la barre de filtres et le
@@ -34,11 +34,11 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
-from sqlalchemy import select
-from sqlalchemy.orm import joinedload
 
 from ..persistence.database import get_session
-from ..persistence.models_sa import Loan, LoanStatus
+from ..persistence.models_sa import LoanStatus
+from ..persistence.projections import LoanListRow
+from ..persistence.repositories import LoanRepository
 from ..services.export_service import ExportMetadata, export_data
 from ..services.loan_service import is_overdue
 from ..services.preferences import Preferences
@@ -54,16 +54,16 @@ class LoanTableModel(QAbstractTableModel):
 
     def __init__(self):
         super().__init__()
-        self._all_loans: list[Loan] = []
-        self._filtered_loans: list[Loan] = []
+        self._all_loans: list[LoanListRow] = []
+        self._filtered_loans: list[LoanListRow] = []
 
-    def get_loan_by_row(self, row: int) -> Loan | None:
+    def get_loan_by_row(self, row: int) -> LoanListRow | None:
         """Retourne le prêt à la ligne donnée."""
         if 0 <= row < len(self._filtered_loans):
             return self._filtered_loans[row]
         return None
 
-    def set_loans(self, loans: list[Loan]):
+    def set_loans(self, loans: list[LoanListRow]):
         self.beginResetModel()
         self._all_loans = list(loans)
         self._filtered_loans = list(loans)
@@ -85,9 +85,8 @@ class LoanTableModel(QAbstractTableModel):
             filtered = [
                 loan
                 for loan in filtered
-                if search_term in (loan.book.title or "").lower()
-                or search_term
-                in f"{loan.member.first_name or ''} {loan.member.last_name or ''}".lower()
+                if search_term in (loan.book_title or "").lower()
+                or search_term in loan.member_name.lower()
             ]
         self._filtered_loans = filtered
         self.endResetModel()
@@ -107,10 +106,8 @@ class LoanTableModel(QAbstractTableModel):
         if role == Qt.ItemDataRole.DisplayRole:
             column_data = {
                 0: loan.id,
-                1: loan.book.title if loan.book else "N/A",
-                2: f"{loan.member.first_name or ''} {loan.member.last_name or ''}".strip()
-                if loan.member
-                else "N/A",
+                1: loan.book_title if loan.book_title is not None else "N/A",
+                2: loan.member_name,
                 3: loan.loan_date.isoformat() if loan.loan_date else "",
                 4: loan.due_date.isoformat() if loan.due_date else "",
                 5: loan.status.value if loan.status else "",
@@ -236,12 +233,8 @@ class LoanListView(QWidget):
     @Slot()
     def refresh(self):
         with get_session() as s:
-            loans = s.scalars(
-                select(Loan)
-                .options(joinedload(Loan.book), joinedload(Loan.member))
-                .order_by(Loan.loan_date.desc())
-            ).all()
-            self.table_model.set_loans(loans)
+            loans = LoanRepository(s).list_rows()
+        self.table_model.set_loans(loans)
         self._on_filters_changed()
 
     @Slot()
@@ -424,16 +417,14 @@ class LoanListView(QWidget):
                 translate("export.error_message", error=str(e)),
             )
 
-    def _get_loan_column_value(self, loan: Loan, col_id: str) -> str:
+    def _get_loan_column_value(self, loan: LoanListRow, col_id: str) -> str:
         """Extrait la valeur d'une colonne pour un prêt donné."""
         if col_id == "id":
             return str(loan.id)
         elif col_id == "book_title":
-            return loan.book.title if loan.book else "N/A"
+            return loan.book_title if loan.book_title is not None else "N/A"
         elif col_id == "member_name":
-            if loan.member:
-                return f"{loan.member.first_name or ''} {loan.member.last_name or ''}".strip()
-            return "N/A"
+            return loan.member_name
         elif col_id == "loan_date":
             return loan.loan_date.isoformat() if loan.loan_date else ""
         elif col_id == "due_date":
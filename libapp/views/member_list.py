@@ -21,7 +21,9 @@ from PySide6.QtWidgets import (
 from sqlalchemy import select
 
 from ..persistence.database import get_session
-from ..persistence.models_sa import Member
+from ..persistence.models_sa import Book, Loan, Member
+from ..persistence.projections import MemberListRow
+from ..persistence.repositories import MemberRepository
 from ..services.audit_service import (
     audit_member_created,
     audit_member_deleted,
@@ -37,7 +39,11 @@ logger = logging.getLogger(__name__)
 
 
 class MemberTableModel(QAbstractTableModel):
-    """Modèle de données Qt pour la table des membres."""
+    """Modèle de données Qt pour la table des membres.
+
+    Les lignes sont des projections `MemberListRow` ; l'objet `Member` complet
+    s'obtient avec `load_member()`.
+    """
 
     COLUMNS = [
         "ID",
@@ -52,10 +58,10 @@ class MemberTableModel(QAbstractTableModel):
 
     def __init__(self):
         super().__init__()
-        self._all_members: list[Member] = []
-        self._filtered_members: list[Member] = []
+        self._all_members: list[MemberListRow] = []
+        self._filtered_members: list[MemberListRow] = []
 
-    def set_members(self, members: list[Member]):
+    def set_members(self, members: list[MemberListRow]):
         self.beginResetModel()
         self._all_members = list(members)
         self._filtered_members = list(members)
@@ -76,7 +82,7 @@ class MemberTableModel(QAbstractTableModel):
             ]
         self.endResetModel()
 
-    def get_member_by_row(self, row: int) -> Member | None:
+    def get_member_by_row(self, row: int) -> MemberListRow | None:
         if 0 <= row < len(self._filtered_members):
             return self._filtered_members[row]
         return None
@@ -111,10 +117,17 @@ class MemberTableModel(QAbstractTableModel):
             return self.COLUMNS[section]
         return None
 
-    def get_member_at(self, row: int) -> Member:
+    def get_member_at(self, row: int) -> MemberListRow:
         """Retourne le membre à la ligne donnée."""
         return self._filtered_members[row]
 
+    @staticmethod
+    def load_member(member_id: int) -> Member | None:
+        """Relit l'objet Member complet (éditeur, panneau de détails)."""
+        with get_session() as session:
+            # La fermeture de la session détache le membre (attributs déjà chargés)
+            return MemberRepository(session).get(member_id)
+
 
 class MemberListView(QWidget):
     """Widget principal pour afficher et interagir avec la liste des membres."""
@@ -181,17 +194,8 @@ class MemberListView(QWidget):
     def refresh(self):
         """Recharge les données depuis la BDD et applique le filtre."""
         with get_session() as session:
-            result = session.scalars(
-                select(Member).order_by(Member.last_name, Member.first_name)
-            ).all()
-
-            # 🔧 FIX CRITIQUE : Détacher les objets AVANT la fermeture de la session
-            members = []
-            for member in result:
-                session.expunge(member)  # Détache l'objet de la session
-                members.append(member)
+            members = MemberRepository(session).list_rows()
 
-        # Maintenant la session est fermée, mais les objets sont accessibles
         self.table_model.set_members(members)
         self._on_filter_changed()
 
@@ -250,7 +254,10 @@ class MemberListView(QWidget):
             return
 
         source_index = self.proxy_model.mapToSource(selection[0])
-        member = self.table_model._filtered_members[source_index.row()]
+        row = self.table_model.get_member_by_row(source_index.row())
+        member = self.table_model.load_member(row.id) if row else None
+        if not member:
+            return
 
         # Sauvegarder l'état avant modification
         old_name = f"{member.last_name} {member.first_name}"
@@ -281,20 +288,23 @@ class MemberListView(QWidget):
         if not member:
             return
 
-        # Version simple pour l'instant
+        # Version simple pour l'instant (titre joint : une seule requête)
         with get_session() as session:
-            from ..persistence.models_sa import Loan
-
-            loans = session.scalars(select(Loan).where(Loan.member_id == member.id)).all()
+            loans = session.execute(
+                select(Book.title, Loan.status)
+                .outerjoin(Book, Loan.book_id == Book.id)
+                .where(Loan.member_id == member.id)
+                .order_by(Loan.id)
+            ).all()
 
-            message = f"Historique de {member.first_name} {member.last_name}:\n"
-            message += f"Nombre total de prêts : {len(loans)}\n\n"
+        message = f"Historique de {member.first_name} {member.last_name}:\n"
+        message += f"Nombre total de prêts : {len(loans)}\n\n"
 
-            for loan in loans[-5:]:  # 5 derniers
-                status = "En cours" if loan.status.value == "open" else "Terminé"
-                message += f"• {loan.book.title} - {status}\n"
+        for title, loan_status in loans[-5:]:  # 5 derniers
+            status = "En cours" if loan_status.value == "open" else "Terminé"
+            message += f"• {title} - {status}\n"
 
-            QMessageBox.information(self, translate("member_list.loan_history"), message)
+        QMessageBox.information(self, translate("member_list.loan_history"), message)
 
     def _on_delete(self):
         """Supprime le membre sélectionné."""
@@ -303,7 +313,9 @@ class MemberListView(QWidget):
             return
 
         source_index = self.proxy_model.mapToSource(selection[0])
-        member = self.table_model._filtered_members[source_index.row()]
+        member = self.table_model.get_member_by_row(source_index.row())
+        if not member:
+            return
 
         # Sauvegarder les infos avant suppression
         member_id = member.id
@@ -463,11 +475,11 @@ class MemberListView(QWidget):
                 translate("export.error_message", error=str(e)),
             )
 
-    def _get_member_column_value(self, member: Member, col_id: str) -> str:
+    def _get_member_column_value(self, member: MemberListRow, col_id: str) -> str:
         """Extrait la valeur d'une colonne pour un membre donné.
 
         Args:
-            member: L'objet Member.
+            member: La ligne du membre.
             col_id: L'identifiant de la colonne.
 
         Returns:
@@ -0,0 +1,76 @@
+"""
+Recherche bibliographique multi-sources hors du thread de l'interface.
+
+Ce module définit :
+- MetaSearchWorkerSignals: Les signaux Qt émis par le worker (résultats
+  d'une source, fin, échec), délivrés dans le thread de l'interface.
+- MetaSearchWorker: Un QRunnable (QThreadPool) qui relaie les résultats de
+  `MetaSearchService.iter_search_by_source` au fil de l'arrivée des sources.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from ..services.meta_search_service import MetaSearchService
+
+logger = logging.getLogger(__name__)
+
+
+class MetaSearchWorkerSignals(QObject):
+    """Signaux de la recherche (un QRunnable ne peut pas porter de signaux)."""
+
+    results = Signal(str, object)  # nom de la source, list[UnifiedBookResult]
+    finished = Signal(int)  # nombre total de résultats
+    failed = Signal(str)
+
+
+class MetaSearchWorker(QRunnable):
+    """Recherche ISBN puis titre/auteur exécutée dans le QThreadPool."""
+
+    def __init__(
+        self, service: MetaSearchService, isbn: str = "", title: str = "", author: str = ""
+    ):
+        super().__init__()
+        # La vue garde la référence jusqu'à la fin : Qt ne doit pas détruire l'objet
+        self.setAutoDelete(False)
+        self.signals = MetaSearchWorkerSignals()
+        self._service = service
+        self._isbn = isbn
+        self._title = title
+        self._author = author
+        self._cancel_event = threading.Event()
+        self._done = threading.Event()
+
+    def cancel(self) -> None:
+        """Demande l'arrêt : plus aucun résultat n'est émis après la source en cours."""
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def is_done(self) -> bool:
+        """True une fois `run()` terminé."""
+        return self._done.is_set()
+
+    def run(self) -> None:
+        total = 0
+        stream = self._service.iter_search_by_source(self._isbn, self._title, self._author)
+        try:
+            for source_name, results in stream:
+                if self.is_cancelled():
+                    break
+                total += len(results)
+                self.signals.results.emit(source_name, results)
+            else:
+                self.signals.finished.emit(total)
+        except Exception as e:
+            logger.error(f"❌ Recherche multi-sources en arrière-plan échouée : {e}")
+            self.signals.failed.emit(str(e))
+        finally:
+            # Annule les sources pas encore démarrées si on sort avant la fin
+            stream.close()
+            self._done.set()
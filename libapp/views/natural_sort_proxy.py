@@ -8,7 +8,9 @@ from __future__ import annotations
 
 import re
 
-from PySide6.QtCore import QModelIndex, QSortFilterProxyModel
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, QSortFilterProxyModel, Qt
+
+_DIGITS_RE = re.compile(r"(\d+)")
 
 
 class NaturalSortProxyModel(QSortFilterProxyModel):
@@ -17,10 +19,94 @@ class NaturalSortProxyModel(QSortFilterProxyModel):
     Permet de trier les strings contenant des nombres de façon intuitive :
     - Tri lexicographique : "1", "10", "100", "2" ❌
     - Tri naturel : "1", "2", "10", "100" ✅
+
+    Les clés de tri d'une colonne sont calculées une seule fois (un passage
+    sur le modèle source), puis triées en Python : chaque ligne reçoit son
+    rang et `lessThan` ne compare plus que deux entiers. Le cache est vidé
+    quand le modèle source est réinitialisé, change de structure ou que les
+    données de la colonne changent. Les valeurs vides sont classées en tête.
+
+    Si le modèle source déclare `handles_sorting = True` (modèle paginé qui
+    trie en SQL), le tri lui est délégué et le proxy conserve l'ordre source.
     """
 
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Rang de chaque ligne source (ordre croissant), par colonne
+        self._ranks: dict[int, list[int]] = {}
+
+    def setSourceModel(self, model: QAbstractItemModel) -> None:
+        """Branche l'invalidation du cache AVANT les connexions internes du proxy.
+
+        Les slots sont appelés dans l'ordre de connexion : le re-tri dynamique
+        déclenché par `dataChanged` voit ainsi des rangs déjà invalidés.
+        """
+        previous = self.sourceModel()
+        if previous is not None:
+            for signal in self._structure_signals(previous):
+                signal.disconnect(self._clear_sort_keys)
+            previous.dataChanged.disconnect(self._on_source_data_changed)
+        self._ranks.clear()
+        if model is not None:
+            for signal in self._structure_signals(model):
+                signal.connect(self._clear_sort_keys)
+            model.dataChanged.connect(self._on_source_data_changed)
+        super().setSourceModel(model)
+
+    @staticmethod
+    def _structure_signals(model: QAbstractItemModel):
+        return (
+            model.modelReset,
+            model.layoutChanged,
+            model.rowsInserted,
+            model.rowsRemoved,
+            model.rowsMoved,
+            model.columnsInserted,
+            model.columnsRemoved,
+            model.columnsMoved,
+        )
+
+    def _clear_sort_keys(self, *args) -> None:
+        self._ranks.clear()
+
+    def _on_source_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles=()):
+        if roles and self.sortRole() not in roles:
+            return
+        for column in range(top_left.column(), bottom_right.column() + 1):
+            self._ranks.pop(column, None)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """Trie via le modèle source s'il gère lui-même le tri, sinon localement."""
+        source = self.sourceModel()
+        if getattr(source, "handles_sorting", False):
+            source.sort(column, order)
+            return
+        super().sort(column, order)
+
+    def sorted_rows(self, column: int) -> list[int]:
+        """Lignes source dans l'ordre naturel croissant de `column` (un seul tri Python)."""
+        source = self.sourceModel()
+        if source is None:
+            return []
+        role = self.sortRole()
+        keys = []
+        for row in range(source.rowCount()):
+            value = source.data(source.index(row, column), role)
+            keys.append(() if value is None else self._natural_sort_key(str(value)))
+        return sorted(range(len(keys)), key=keys.__getitem__)
+
+    def _column_ranks(self, column: int) -> list[int]:
+        ranks = self._ranks.get(column)
+        if ranks is None:
+            order = self.sorted_rows(column)
+            ranks = [0] * len(order)
+            for rank, row in enumerate(order):
+                ranks[row] = rank
+            self._ranks[column] = ranks
+        return ranks
+
     def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
-        """Compare deux valeurs en utilisant le tri naturel.
+        """Compare deux lignes par leur rang naturel (calculé une fois par colonne).
 
         Args:
             left: Index du premier élément.
@@ -29,22 +115,11 @@ class NaturalSortProxyModel(QSortFilterProxyModel):
         Returns:
             True si left < right selon le tri naturel.
         """
-        left_data = self.sourceModel().data(left)
-        right_data = self.sourceModel().data(right)
-
-        # Si l'une des valeurs est None, utiliser le tri standard
-        if left_data is None or right_data is None:
-            return super().lessThan(left, right)
-
-        # Convertir en string
-        left_str = str(left_data)
-        right_str = str(right_data)
-
-        # Appliquer le tri naturel
-        return self._natural_sort_key(left_str) < self._natural_sort_key(right_str)
+        ranks = self._column_ranks(left.column())
+        return ranks[left.row()] < ranks[right.row()]
 
     @staticmethod
-    def _natural_sort_key(text: str) -> list[tuple[int, int | str]]:
+    def _natural_sort_key(text: str) -> tuple[tuple[int, int | str], ...]:
         """
         Génère une clé de tri naturel pour une string.
 
@@ -57,32 +132,24 @@ class NaturalSortProxyModel(QSortFilterProxyModel):
             text: La string à analyser.
 
         Returns:
-            Liste de tuples (type_indicator, valeur) où type_indicator est :
+            Tuple de paires (type_indicator, valeur) où type_indicator est :
             - 0 pour les strings (triées en premier)
             - 1 pour les nombres (triés en second)
 
         Examples:
             >>> _natural_sort_key("A001")
-            [(0, 'a'), (1, 1)]
+            ((0, 'a'), (1, 1))
             >>> _natural_sort_key("C 222")
-            [(0, 'c '), (1, 222)]
+            ((0, 'c '), (1, 222))
             >>> _natural_sort_key("1984")
-            [(1, 1984)]
+            ((1, 1984),)
             >>> _natural_sort_key("Harry Potter")
-            [(0, 'harry potter')]
+            ((0, 'harry potter'),)
         """
         # Séparer les parties numériques et non-numériques
-        # Regex : capture les groupes de chiffres
-        parts = re.split(r"(\d+)", text)
-
-        # Convertir en tuples (type, valeur) pour permettre la comparaison
-        result = []
-        for part in parts:
-            if not part:  # Ignorer les strings vides
-                continue
-            if part.isdigit():
-                result.append((1, int(part)))  # Nombres = type 1
-            else:
-                result.append((0, part.lower()))  # Texte = type 0
-
-        return result
+        # (nombres = type 1, texte = type 0 ; chaînes vides ignorées)
+        return tuple(
+            (1, int(part)) if part.isdigit() else (0, part.lower())
+            for part in _DIGITS_RE.split(text)
+            if part
+        )
@@ -26,6 +26,7 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from ..persistence.database import SQLITE_PROFILES
 from ..services.preferences import Preferences, save_preferences
 from ..services.translation_service import translate
 
@@ -197,6 +198,38 @@ class PreferencesDialog(QDialog):
 
         main_layout.addLayout(loan_form)
 
+        # Séparateur
+        separator5 = QFrame()
+        separator5.setFrameShape(QFrame.HLine)
+        separator5.setFrameShadow(QFrame.Sunken)
+        main_layout.addWidget(separator5)
+
+        # ========================================
+        # 🗄️ SECTION 6 : BASE DE DONNÉES
+        # ========================================
+        db_label = QLabel(translate("preferences.section_database"))
+        db_label.setStyleSheet("font-weight: bold; font-size: 12pt; margin-top: 10px;")
+        main_layout.addWidget(db_label)
+
+        db_form = QFormLayout()
+
+        # Profil de performance SQLite
+        self.db_profile_combo = QComboBox(self)
+        db_form.addRow(f"{translate('preferences.db_profile')}:", self.db_profile_combo)
+
+        # Cache de pages et mmap (Mo)
+        self.spin_db_cache_size = QSpinBox()
+        self.spin_db_cache_size.setRange(0, 4096)
+        self.spin_db_cache_size.setSuffix(" Mo")
+        db_form.addRow(f"{translate('preferences.db_cache_size')}:", self.spin_db_cache_size)
+
+        self.spin_db_mmap_size = QSpinBox()
+        self.spin_db_mmap_size.setRange(0, 16384)
+        self.spin_db_mmap_size.setSuffix(" Mo")
+        db_form.addRow(f"{translate('preferences.db_mmap_size')}:", self.spin_db_mmap_size)
+
+        main_layout.addLayout(db_form)
+
         # Espace avant les boutons
         main_layout.addSpacing(20)
 
@@ -243,6 +276,16 @@ class PreferencesDialog(QDialog):
         # Charger la durée de prêt par défaut
         self.spin_default_loan_days.setValue(prefs.default_loan_days)
 
+        # Profil SQLite
+        for profile_name in SQLITE_PROFILES:
+            self.db_profile_combo.addItem(
+                translate(f"preferences.db_profile_{profile_name}"), profile_name
+            )
+        index = self.db_profile_combo.findData(prefs.db_performance_profile)
+        self.db_profile_combo.setCurrentIndex(max(index, 0))
+        self.spin_db_cache_size.setValue(prefs.db_cache_size_mb)
+        self.spin_db_mmap_size.setValue(prefs.db_mmap_size_mb)
+
     @Slot()
     def _on_accept(self):
         """Sauvegarde les nouvelles préférences et ferme le dialogue."""
@@ -261,6 +304,7 @@ class PreferencesDialog(QDialog):
             main_window_geometry=getattr(self._initial_prefs, "main_window_geometry", None),
             import_last_directory=getattr(self._initial_prefs, "import_last_directory", None),
             import_last_mapping=getattr(self._initial_prefs, "import_last_mapping", {}),
+            import_chunk_size=getattr(self._initial_prefs, "import_chunk_size", 1000),
             books_view_state=getattr(self._initial_prefs, "books_view_state", {}),
             members_view_state=getattr(self._initial_prefs, "members_view_state", {}),
             loans_view_state=getattr(self._initial_prefs, "loans_view_state", {}),
@@ -286,6 +330,9 @@ class PreferencesDialog(QDialog):
             app_name_custom=getattr(self._initial_prefs, "app_name_custom", False),
             show_overdue_alert_on_startup=show_overdue,
             default_loan_days=self.spin_default_loan_days.value(),
+            db_performance_profile=self.db_profile_combo.currentData(),
+            db_cache_size_mb=self.spin_db_cache_size.value(),
+            db_mmap_size_mb=self.spin_db_mmap_size.value(),
         )
 
         # Message pour changement de langue
@@ -0,0 +1,79 @@
+"""Dialogue listant les blocages de l'interface détectés par le StallWatchdog."""
+
+from __future__ import annotations
+
+from PySide6.QtGui import QFontDatabase
+from PySide6.QtWidgets import (
+    QDialog,
+    QHBoxLayout,
+    QLabel,
+    QPlainTextEdit,
+    QPushButton,
+    QVBoxLayout,
+    QWidget,
+)
+
+from ..services.stall_watchdog import StallWatchdog, format_report, get_stall_watchdog
+from ..services.translation_service import translate
+
+
+class StallReportDialog(QDialog):
+    """Rapports de blocage (du plus récent au plus ancien) avec les piles capturées."""
+
+    def __init__(self, watchdog: StallWatchdog | None = None, parent: QWidget | None = None):
+        """
+        Initialise le dialogue.
+
+        Args:
+            watchdog: Surveillance dont afficher les rapports (partagée par défaut)
+            parent: Widget parent
+        """
+        super().__init__(parent)
+        self.watchdog = watchdog or get_stall_watchdog()
+
+        self.setWindowTitle(translate("stall_report.title"))
+        self.setMinimumSize(800, 500)
+
+        self._setup_ui()
+        self.refresh()
+
+    def _setup_ui(self):
+        """Configure l'interface du dialogue."""
+        layout = QVBoxLayout(self)
+
+        intro = QLabel(
+            translate("stall_report.intro").format(threshold=round(self.watchdog.threshold * 1000))
+        )
+        intro.setWordWrap(True)
+        layout.addWidget(intro)
+
+        self.text = QPlainTextEdit(self)
+        self.text.setReadOnly(True)
+        self.text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.text.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        layout.addWidget(self.text)
+
+        buttons = QHBoxLayout()
+        refresh_button = QPushButton(translate("stall_report.refresh"))
+        refresh_button.clicked.connect(self.refresh)
+        clear_button = QPushButton(translate("stall_report.clear"))
+        clear_button.clicked.connect(self._on_clear)
+        close_button = QPushButton(translate("stall_report.close"))
+        close_button.clicked.connect(self.accept)
+        buttons.addWidget(refresh_button)
+        buttons.addWidget(clear_button)
+        buttons.addStretch()
+        buttons.addWidget(close_button)
+        layout.addLayout(buttons)
+
+    def refresh(self):
+        """Recharge les rapports de la surveillance."""
+        reports = self.watchdog.reports()
+        if not reports:
+            self.text.setPlainText(translate("stall_report.empty"))
+            return
+        self.text.setPlainText("\n\n".join(format_report(report) for report in reports))
+
+    def _on_clear(self):
+        self.watchdog.clear()
+        self.refresh()
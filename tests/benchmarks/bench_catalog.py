@@ -0,0 +1,147 @@
+"""Benchmark de bout en bout sur des catalogues synthétiques (10k, 100k, 1M livres).
+
+Pour chaque taille, une base temporaire (`isolated_db`) est peuplée par
+`datagen.generate_catalog` (livres, auteurs, membres, prêts, audit), puis
+sont chronométrés :
+- `BookListView.refresh` et `BookTableModel.apply_filter` ;
+- le tri de `NaturalSortProxyModel` (cotes alphanumériques) ;
+- `DashboardView._compute_kpis` ;
+- `upsert_rows` (import de 2 000 lignes, moitié en doublon d'ISBN) ;
+- `export_data_to_xlsx` ;
+- `create_loan` / `return_loan` (moyenne par cycle).
+
+Le tri naturel (comparaisons Python) et l'export XLSX (classeur en mémoire)
+sont plafonnés à NATURAL_SORT_MAX_ROWS et EXPORT_MAX_ROWS lignes.
+
+Non collecté par `pytest` par défaut ; lancement explicite :
+    python -m pytest tests/benchmarks/bench_catalog.py -s --bench-sizes 10000,100000
+    python -m pytest tests/benchmarks/bench_catalog.py -s --bench-save-baseline
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+from datagen import CatalogSpec, generate_catalog
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+UPSERT_ROWS = 2000
+LOAN_CYCLES = 100
+NATURAL_SORT_MAX_ROWS = 50_000
+EXPORT_MAX_ROWS = 100_000
+FILTER_QUERIES = ("jardin", "Dupont", "978000000")
+
+
+def _best_of(fn, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_bench_catalog(isolated_db, tmp_path, bench_size, bench_record):
+    from PySide6.QtGui import QStandardItem, QStandardItemModel
+    from PySide6.QtWidgets import QApplication
+    from sqlalchemy import select
+
+    from libapp.persistence.database import ensure_tables, get_session
+    from libapp.persistence.models_sa import Book, Member
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    ensure_tables()
+
+    start = time.perf_counter()
+    spec = generate_catalog(CatalogSpec.for_books(bench_size))
+    t_generate = time.perf_counter() - start
+
+    from libapp.services.export_service import export_data_to_xlsx
+    from libapp.services.import_service import upsert_rows
+    from libapp.services.loan_service import create_loan, return_loan
+    from libapp.services.preferences import Preferences
+    from libapp.services.types import BookRow
+    from libapp.views.book_list import BookListView
+    from libapp.views.dashboard import DashboardView
+    from libapp.views.natural_sort_proxy import NaturalSortProxyModel
+
+    group = f"catalog_{bench_size}"
+    runs = 3 if bench_size <= 100_000 else 1
+    timings: dict[str, float] = {}
+
+    # --- Vues ---
+    view = BookListView(parent=None, prefs=Preferences())
+    timings["book_list_refresh"] = _best_of(view.refresh, runs)
+    for query in FILTER_QUERIES:
+        timings[f"apply_filter[{query}]"] = _best_of(
+            lambda q=query: view.table_model.apply_filter(q), runs
+        )
+    view.table_model.apply_filter("")
+
+    dashboard = DashboardView(parent=None)
+    timings["dashboard_kpis"] = _best_of(dashboard._compute_kpis, runs)
+
+    # --- Tri naturel des cotes ---
+    with get_session() as session:
+        codes = session.scalars(select(Book.code_interne).limit(NATURAL_SORT_MAX_ROWS)).all()
+    model = QStandardItemModel()
+    model.appendColumn([QStandardItem(code) for code in codes])
+    proxy = NaturalSortProxyModel()
+    proxy.setSourceModel(model)
+
+    def natural_sort():
+        proxy.sort(-1)  # Réinitialise l'ordre : chaque passe trie réellement
+        proxy.sort(0)
+
+    timings["natural_sort"] = _best_of(natural_sort, runs)
+
+    # --- Import ---
+    rows = [
+        BookRow(
+            titre=f"Import {i}",
+            auteurs=[f"Auteur import {i % 50}"],
+            # Une ligne sur deux reprend l'ISBN d'un livre existant (fusion)
+            isbn=f"978{1 + i:010d}" if i % 2 else f"979{i:010d}",
+        )
+        for i in range(UPSERT_ROWS)
+    ]
+    start = time.perf_counter()
+    upsert_rows(rows, on_isbn_conflict="merge")
+    timings["upsert_rows"] = time.perf_counter() - start
+
+    # --- Export ---
+    columns = (Book.title, Book.authors_text, Book.isbn, Book.publisher, Book.year)
+    with get_session() as session:
+        data = session.execute(select(*columns).limit(EXPORT_MAX_ROWS)).all()
+    start = time.perf_counter()
+    export_data_to_xlsx(tmp_path / "export.xlsx", [c.key for c in columns], data)
+    timings["export_xlsx"] = time.perf_counter() - start
+
+    # --- Prêts ---
+    with get_session() as session:
+        book_ids = session.scalars(
+            select(Book.id).where(Book.copies_available > 0).limit(LOAN_CYCLES)
+        ).all()
+        member_ids = session.scalars(select(Member.id).where(Member.is_active)).all()
+    start = time.perf_counter()
+    for i, book_id in enumerate(book_ids):
+        loan = create_loan(book_id=book_id, member_id=member_ids[i % len(member_ids)])
+        return_loan(loan.id)
+    timings["loan_cycle"] = (time.perf_counter() - start) / max(1, len(book_ids))
+
+    for operation, seconds in timings.items():
+        bench_record(group, operation, seconds)
+
+    print(
+        f"\n[{group}] génération={t_generate:.1f}s "
+        f"(livres={spec.books} membres={spec.members} prêts={spec.loans} audit={spec.audit})"
+    )
+    for operation, seconds in timings.items():
+        print(f"  {operation:<28} {seconds * 1000:10.1f} ms")
+
+    regressions = bench_record.regressions(group)
+    if regressions:
+        pytest.fail(f"Régressions ({group}) :\n  " + "\n  ".join(regressions))
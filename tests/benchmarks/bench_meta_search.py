@@ -0,0 +1,195 @@
+"""Benchmark des stratégies de recherche multi-sources, hors ligne.
+
+Les réponses des trois sources sont générées une fois (catalogue
+synthétique), enregistrées via RecordingTransport, puis rejouées par un
+ReplayServer local avec une latence réaliste par source. Chaque stratégie
+(séquentielle, parallèle, meilleur résultat) résout les mêmes ISBN dans
+plusieurs scénarios : nominal, OpenLibrary lente, BnF en panne, Google
+Books instable.
+
+Non collecté par `pytest` par défaut ; lancement explicite :
+    python -m pytest tests/benchmarks/bench_meta_search.py -s --bench-isbns 30
+
+Des réponses réelles enregistrées (`python -m libapp.services.http_replay
+record <dossier> <isbn>...`) peuvent remplacer le catalogue synthétique
+via la variable AURORA_BENCH_FIXTURES=<dossier>.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import statistics
+import time
+
+import pytest
+
+# Latences « réseau » de base, appliquées dans tous les scénarios
+BASE_FAULTS = {
+    "bnf": {"latency": 0.15, "jitter": 0.05},
+    "google": {"latency": 0.08, "jitter": 0.03},
+    "openlibrary": {"latency": 0.25, "jitter": 0.10},
+}
+
+SCENARIOS = {
+    "nominal": {},
+    "openlibrary_lente": {"openlibrary": {"latency": 2.0}},
+    "bnf_en_panne": {"bnf": {"error_rate": 1.0}},
+    "google_instable": {"google": {"latency": 0.3, "jitter": 0.2, "error_rate": 0.3}},
+}
+
+
+class _Response:
+    status_code = 200
+
+    def __init__(self, body: str, content_type: str):
+        self.content = body.encode("utf-8")
+        self.headers = {"Content-Type": content_type}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class _SyntheticCatalogue:
+    """Transport factice : une notice plausible pour tout ISBN demandé."""
+
+    def get(self, url, *, source, params=None, timeout=None, headers=None):
+        if source == "bnf":
+            isbn = re.search(r'"([0-9X]+)"', params["query"]).group(1)
+            record = (
+                f'<mxc:datafield tag="020"><mxc:subfield code="a">{isbn}</mxc:subfield>'
+                '</mxc:datafield><mxc:datafield tag="100"><mxc:subfield code="a">Zola'
+                '</mxc:subfield></mxc:datafield><mxc:datafield tag="245"><mxc:subfield code="a">'
+                f"Titre {isbn}</mxc:subfield></mxc:datafield>"
+                '<mxc:datafield tag="260"><mxc:subfield code="c">Gallimard</mxc:subfield>'
+                '<mxc:subfield code="d">1978</mxc:subfield></mxc:datafield>'
+            )
+            body = (
+                '<srw:searchRetrieveResponse xmlns:srw="http://www.loc.gov/zing/srw/" '
+                'xmlns:mxc="info:lc/xmlns/marcxchange-v2"><srw:records><srw:record>'
+                f"<srw:recordData><mxc:record>{record}</mxc:record></srw:recordData>"
+                "</srw:record></srw:records></srw:searchRetrieveResponse>"
+            )
+            return _Response(body, "text/xml")
+        if source == "google":
+            isbn = params["q"].removeprefix("isbn:")
+            volume = {
+                "title": f"Titre {isbn}",
+                "authors": ["Émile Zola"],
+                "publisher": "Folio",
+                "publishedDate": "1999",
+                "industryIdentifiers": [{"type": "ISBN_13", "identifier": isbn}],
+            }
+            body = {"totalItems": 1, "items": [{"volumeInfo": volume}]}
+            return _Response(json.dumps(body), "application/json")
+        keys = params["bibkeys"].split(",")
+        body = {
+            key: {
+                "title": f"Titre {key[5:]}",
+                "authors": [{"name": "Émile Zola"}],
+                "publishers": [{"name": "Le Livre de poche"}],
+                "publish_date": "2000",
+            }
+            for key in keys
+        }
+        return _Response(json.dumps(body), "application/json")
+
+
+@pytest.fixture(scope="module")
+def fixtures(tmp_path_factory, request):
+    """(FixtureStore, ISBN) : enregistrements existants, sinon catalogue synthétique."""
+    from libapp.services.bnf_service import BnfService
+    from libapp.services.googlebooks_service import GoogleBooksService
+    from libapp.services.http_replay import FixtureStore, RecordingTransport
+    from libapp.services.openlibrary_service import OpenLibraryService
+
+    recorded = os.environ.get("AURORA_BENCH_FIXTURES")
+    if recorded:
+        store = FixtureStore(recorded)
+        isbns = sorted(
+            {
+                m.group(1)
+                for f in store.directory.glob("bnf-*.json")
+                if (m := re.search(r"isbn_any\+all\+%22([0-9X]+)%22", f.read_text()))
+            }
+        )
+        return store, isbns
+
+    n_isbns = request.config.getoption("--bench-isbns")
+    isbns = [f"978207{n:07d}" for n in range(n_isbns)]
+    store = FixtureStore(tmp_path_factory.mktemp("replay"))
+    recorder = RecordingTransport(store, inner=_SyntheticCatalogue())
+    clients = [
+        BnfService(transport=recorder),
+        GoogleBooksService(transport=recorder),
+        OpenLibraryService(transport=recorder),
+    ]
+    for isbn in isbns:
+        for client in clients:
+            client.search_by_isbn(isbn)
+    return store, isbns
+
+
+def _strategy(name: str):
+    from libapp.services.meta_search_service import (
+        BestResultStrategy,
+        ParallelSearchStrategy,
+        SequentialSearchStrategy,
+    )
+    from libapp.services.source_health import LatencyTracker, SourceHealth
+
+    if name == "sequential":
+        return SequentialSearchStrategy()
+    # État de santé neuf : pas de latences ni de disjoncteurs hérités d'un autre scénario
+    parallel = ParallelSearchStrategy(timeout=5.0, health=SourceHealth(LatencyTracker()))
+    if name == "parallel":
+        return parallel
+    best = BestResultStrategy()
+    best.parallel_strategy = parallel
+    return best
+
+
+@pytest.mark.parametrize("scenario", list(SCENARIOS))
+@pytest.mark.parametrize("strategy_name", ["sequential", "parallel", "best"])
+def test_bench_meta_search(fixtures, strategy_name, scenario):
+    from libapp.services.http_replay import FaultProfile, ReplayServer, replay_services
+    from libapp.services.meta_search_service import (
+        MetaSearchService,
+        _global_cache,
+        _results_from_json,
+        _results_to_json,
+    )
+    from libapp.services.metadata_cache import MetadataCache
+
+    store, isbns = fixtures
+    faults = {
+        source: FaultProfile(**{**BASE_FAULTS[source], **SCENARIOS[scenario].get(source, {})})
+        for source in BASE_FAULTS
+    }
+    cache = MetadataCache(":memory:", encode=_results_to_json, decode=_results_from_json)
+    _global_cache.clear()  # Cache mémoire des stratégies, partagé entre scénarios
+
+    with ReplayServer(store, faults, seed=42) as server:
+        service = MetaSearchService(strategy=_strategy(strategy_name), cache=cache)
+        service.services = replay_services(server)
+
+        durations = []
+        found = 0
+        for isbn in isbns:
+            start = time.perf_counter()
+            results = service.search_by_isbn(isbn, use_cache=False)
+            durations.append(time.perf_counter() - start)
+            found += bool(results)
+
+    durations.sort()
+    p95 = durations[min(len(durations) - 1, round(0.95 * len(durations)) - 1)]
+    print(
+        f"\n[{strategy_name:<10} | {scenario:<17}] isbns={len(isbns)} trouvés={found} "
+        f"p50={statistics.median(durations) * 1000:.0f}ms p95={p95 * 1000:.0f}ms "
+        f"total={sum(durations):.2f}s requêtes={server.stats['requests']} "
+        f"erreurs={server.stats['errors']}"
+    )
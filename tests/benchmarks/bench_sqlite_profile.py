@@ -0,0 +1,116 @@
+"""Benchmark des profils de performance SQLite.
+
+Compare, pour chaque profil de `SQLITE_PROFILES`, sur une base de N livres :
+- `BookListView.refresh` (lecture complète du catalogue) ;
+- `upsert_rows` (import de 2 000 lignes) ;
+- `create_loan` / `return_loan` ;
+- `BookListView.refresh` pendant que des prêts sont écrits en parallèle
+  (cas du comptoir de prêt : écritures prêts/audit vs rafraîchissement).
+
+Non collecté par `pytest` par défaut ; lancement explicite :
+    python -m pytest tests/benchmarks/bench_sqlite_profile.py -s --bench-books 100000
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+UPSERT_ROWS = 2000
+LOAN_CYCLES = 200
+
+
+def _seed_catalog(n_books: int, n_members: int = 200) -> None:
+    """Insère N livres et quelques membres en executemany (rapide)."""
+    from libapp.persistence.database import engine
+    from libapp.persistence.models_sa import Book, Member
+
+    books = [
+        {
+            "title": f"Titre {i:07d}",
+            "authors_text": f"Auteur {i % 5000}",
+            "isbn": f"978{i:010d}",
+            "publisher": f"Éditeur {i % 300}",
+            "year": str(1900 + i % 120),
+            "code_interne": f"C{i:07d}",
+            "summary": "Résumé " * 20,
+            "copies_total": 1,
+            "copies_available": 1,
+        }
+        for i in range(n_books)
+    ]
+    members = [
+        {"member_no": f"M{i:05d}", "first_name": f"Prénom {i}", "last_name": f"Nom {i}"}
+        for i in range(n_members)
+    ]
+    with engine.begin() as conn:
+        conn.execute(Book.__table__.insert(), books)
+        conn.execute(Member.__table__.insert(), members)
+
+
+def _best_of(fn, runs: int = 3) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.parametrize("profile_name", ["standard", "performance"])
+def test_bench_sqlite_profile(isolated_db, bench_books, profile_name):
+    from PySide6.QtWidgets import QApplication
+
+    from libapp.persistence.database import configure_sqlite_profile, ensure_tables
+    from libapp.services.preferences import Preferences
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+
+    configure_sqlite_profile(profile_name)
+    ensure_tables()
+    _seed_catalog(bench_books)
+
+    from libapp.services.import_service import upsert_rows
+    from libapp.services.loan_service import create_loan, return_loan
+    from libapp.services.types import BookRow
+    from libapp.views.book_list import BookListView
+
+    view = BookListView(parent=None, prefs=Preferences())
+
+    t_refresh = _best_of(view.refresh)
+
+    rows = [
+        BookRow(titre=f"Import {i}", auteurs=[f"Auteur {i % 50}"], isbn=f"979{i:010d}")
+        for i in range(UPSERT_ROWS)
+    ]
+    start = time.perf_counter()
+    upsert_rows(rows, on_isbn_conflict="merge")
+    t_upsert = time.perf_counter() - start
+
+    def loan_cycles():
+        for i in range(LOAN_CYCLES):
+            loan = create_loan(book_id=1 + i, member_id=1 + i % 200)
+            return_loan(loan.id)
+
+    start = time.perf_counter()
+    loan_cycles()
+    t_loans = time.perf_counter() - start
+
+    # Rafraîchissement pendant des écritures concurrentes
+    writer = threading.Thread(target=loan_cycles)
+    writer.start()
+    t_refresh_contended = _best_of(view.refresh, runs=2)
+    writer.join()
+
+    print(
+        f"\n[{profile_name}] books={bench_books} "
+        f"refresh={t_refresh * 1000:.0f}ms "
+        f"upsert({UPSERT_ROWS})={t_upsert * 1000:.0f}ms "
+        f"loans({LOAN_CYCLES}x create+return)={t_loans * 1000:.0f}ms "
+        f"refresh_during_writes={t_refresh_contended * 1000:.0f}ms"
+    )
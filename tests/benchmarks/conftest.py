@@ -0,0 +1,137 @@
+"""Options communes aux benchmarks (non collectés par défaut).
+
+Lancement explicite, par exemple :
+    python -m pytest tests/benchmarks/bench_sqlite_profile.py -s --bench-books 100000
+    python -m pytest tests/benchmarks/bench_catalog.py -s --bench-sizes 10000,100000
+
+Les mesures passées à `bench_record` sont écrites en JSON en fin de session
+(`--bench-output`) et comparées à une référence (`--bench-baseline`) : une
+opération plus lente que sa référence au-delà de `--bench-tolerance` fait
+échouer le benchmark. `--bench-save-baseline` remplace la référence par les
+mesures de la session.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+BENCH_DIR = Path(__file__).parent
+# Écart absolu en dessous duquel un ralentissement est considéré comme du bruit
+NOISE_FLOOR_S = 0.002
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench-books",
+        action="store",
+        type=int,
+        default=int(os.environ.get("AURORA_BENCH_BOOKS", "100000")),
+        help="Nombre de livres générés pour les benchmarks (défaut : 100000)",
+    )
+    parser.addoption(
+        "--bench-isbns",
+        action="store",
+        type=int,
+        default=int(os.environ.get("AURORA_BENCH_ISBNS", "30")),
+        help="Nombre d'ISBN résolus par scénario de bench_meta_search (défaut : 30)",
+    )
+    parser.addoption(
+        "--bench-sizes",
+        action="store",
+        default=os.environ.get("AURORA_BENCH_SIZES", "10000,100000,1000000"),
+        help="Tailles de catalogue de bench_catalog, séparées par des virgules",
+    )
+    parser.addoption(
+        "--bench-output",
+        action="store",
+        default=os.environ.get("AURORA_BENCH_OUTPUT", "bench_results.json"),
+        help="Fichier JSON des mesures de la session (défaut : bench_results.json)",
+    )
+    parser.addoption(
+        "--bench-baseline",
+        action="store",
+        default=str(BENCH_DIR / "baseline.json"),
+        help="Mesures de référence (défaut : tests/benchmarks/baseline.json)",
+    )
+    parser.addoption(
+        "--bench-tolerance",
+        action="store",
+        type=float,
+        default=0.25,
+        help="Ralentissement toléré par rapport à la référence (défaut : 0.25 = +25 %%)",
+    )
+    parser.addoption(
+        "--bench-save-baseline",
+        action="store_true",
+        help="Enregistrer les mesures de la session comme nouvelle référence",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "bench_size" in metafunc.fixturenames:
+        sizes = [int(s) for s in metafunc.config.getoption("--bench-sizes").split(",") if s]
+        metafunc.parametrize("bench_size", sizes, ids=[f"{s}" for s in sizes])
+
+
+@pytest.fixture
+def bench_books(request) -> int:
+    return request.config.getoption("--bench-books")
+
+
+class BenchRecorder:
+    """Mesures de la session (`{groupe: {opération: secondes}}`) et comparaison à la référence."""
+
+    def __init__(self, baseline_path: Path, tolerance: float):
+        self.results: dict[str, dict[str, float]] = {}
+        self.tolerance = tolerance
+        self.baseline: dict[str, dict[str, float]] = {}
+        if baseline_path.exists():
+            self.baseline = json.loads(baseline_path.read_text(encoding="utf-8"))["results"]
+
+    def __call__(self, group: str, operation: str, seconds: float) -> None:
+        self.results.setdefault(group, {})[operation] = round(seconds, 6)
+
+    def regressions(self, group: str) -> list[str]:
+        """Opérations de `group` plus lentes que la référence au-delà de la tolérance."""
+        found = []
+        reference = self.baseline.get(group, {})
+        for operation, seconds in self.results.get(group, {}).items():
+            ref = reference.get(operation)
+            if ref and seconds - ref > max(ref * self.tolerance, NOISE_FLOOR_S):
+                found.append(
+                    f"{operation}: {seconds * 1000:.1f} ms (référence {ref * 1000:.1f} ms)"
+                )
+        return found
+
+    def payload(self) -> dict:
+        return {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "machine": platform.platform(),
+            "results": self.results,
+        }
+
+
+@pytest.fixture(scope="session")
+def bench_record(request):
+    config = request.config
+    baseline_path = Path(config.getoption("--bench-baseline"))
+    recorder = BenchRecorder(baseline_path, config.getoption("--bench-tolerance"))
+    yield recorder
+    if not recorder.results:
+        return
+    payload = json.dumps(recorder.payload(), indent=2, ensure_ascii=False)
+    Path(config.getoption("--bench-output")).write_text(payload, encoding="utf-8")
+    if config.getoption("--bench-save-baseline"):
+        # Les groupes non mesurés dans la session gardent leur référence
+        baseline = recorder.payload()
+        baseline["results"] = {**recorder.baseline, **recorder.results}
+        baseline_path.write_text(
+            json.dumps(baseline, indent=2, ensure_ascii=False), encoding="utf-8"
+        )
@@ -0,0 +1,166 @@
+"""Générateur déterministe de catalogues synthétiques pour les benchmarks.
+
+Une même graine produit toujours la même base : livres, auteurs (liés par
+`book_authors`), membres, prêts (rendus, ouverts, en retard) et journal
+d'audit. Les insertions passent par `executemany` sur le moteur courant
+(celui de la base temporaire de `isolated_db`), par lots de `chunk_size`.
+
+Proportions par défaut pour N livres : N/5 auteurs, N/50 membres (au moins
+50), N/2 prêts dont ~10 % ouverts, N entrées d'audit.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+PUBLISHERS = ("Gallimard", "Flammarion", "Seuil", "Actes Sud", "Folio", "Grasset", "Minuit")
+COLLECTIONS = ("Blanche", "Poche", "Jeunesse", "Essais", "Patrimoine", None)
+WORDS = (
+    "aurore nuit jardin mémoire rivière silence voyage lumière maison océan "
+    "hiver forêt ville étoile chemin promesse secret miroir royaume temps"
+).split()
+FIRST_NAMES = ("Alice", "Bob", "Chloé", "David", "Emma", "Farid", "Gaëlle", "Hugo", "Inès")
+LAST_NAMES = ("Dupont", "Martin", "Lambert", "Peeters", "Janssens", "Moreau", "Leroy")
+LOAN_DAYS = 21
+OPEN_LOAN_RATIO = 0.10
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogSpec:
+    """Volumes d'un catalogue synthétique."""
+
+    books: int
+    authors: int
+    members: int
+    loans: int
+    audit: int
+    seed: int = 0
+
+    @classmethod
+    def for_books(cls, books: int, seed: int = 0) -> CatalogSpec:
+        return cls(
+            books=books,
+            authors=max(1, books // 5),
+            members=max(50, books // 50),
+            loans=books // 2,
+            audit=books,
+            seed=seed,
+        )
+
+
+def _chunks(rows, chunk_size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= chunk_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _title(rng: random.Random, i: int) -> str:
+    return f"{' '.join(rng.choices(WORDS, k=rng.randint(1, 4))).capitalize()} {i}"
+
+
+def generate_catalog(spec: CatalogSpec, *, chunk_size: int = 20_000, today: date | None = None):
+    """Peuple la base courante selon `spec` (tables supposées vides et créées).
+
+    Returns:
+        CatalogSpec: Le `spec` effectivement appliqué.
+    """
+    from libapp.persistence.database import engine
+    from libapp.persistence.models_sa import AuditLog, Author, Book, Loan, Member, book_authors
+
+    rng = random.Random(spec.seed)
+    today = today or date.today()
+    author_names = [
+        f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {i}" for i in range(spec.authors)
+    ]
+
+    # Prêts ouverts : un seul par livre, sur des livres distincts
+    n_open = int(spec.loans * OPEN_LOAN_RATIO)
+    open_books = set(rng.sample(range(1, spec.books + 1), min(n_open, spec.books)))
+
+    def books():
+        for i in range(1, spec.books + 1):
+            copies = rng.randint(1, 3)
+            author = rng.randrange(spec.authors)
+            yield {
+                "id": i,
+                "title": _title(rng, i),
+                "authors_text": author_names[author],
+                "isbn": f"978{i:010d}",
+                "publisher": rng.choice(PUBLISHERS),
+                "year": str(rng.randint(1850, today.year)),
+                "collection": rng.choice(COLLECTIONS),
+                "code_interne": f"{rng.choice('ABC')}{rng.randint(1, 999)}-{i}",
+                "summary": " ".join(rng.choices(WORDS, k=30)),
+                "copies_total": copies,
+                "copies_available": copies - (1 if i in open_books else 0),
+                "_author_id": author + 1,
+            }
+
+    def members():
+        for i in range(1, spec.members + 1):
+            yield {
+                "id": i,
+                "member_no": f"M{i:06d}",
+                "first_name": rng.choice(FIRST_NAMES),
+                "last_name": f"{rng.choice(LAST_NAMES)} {i}",
+                "email": f"membre{i}@example.org",
+                "is_active": rng.random() > 0.1,
+                "date_joined": today - timedelta(days=rng.randint(0, 3650)),
+            }
+
+    def loans():
+        open_iter = iter(sorted(open_books))
+        for i in range(1, spec.loans + 1):
+            loan_date = today - timedelta(days=rng.randint(0, 730))
+            book_id = next(open_iter, None)
+            is_open = book_id is not None
+            if not is_open:
+                book_id = rng.randint(1, spec.books)
+            if is_open:
+                # Un tiers des prêts ouverts est en retard
+                loan_date = today - timedelta(days=rng.randint(0, LOAN_DAYS * 3))
+            yield {
+                "id": i,
+                "book_id": book_id,
+                "member_id": rng.randint(1, spec.members),
+                "loan_date": loan_date,
+                "due_date": loan_date + timedelta(days=LOAN_DAYS),
+                "return_date": None if is_open else loan_date + timedelta(days=rng.randint(1, 30)),
+                "status": "open" if is_open else "returned",
+            }
+
+    def audit():
+        start = datetime.combine(today, datetime.min.time()) - timedelta(days=730)
+        for i in range(1, spec.audit + 1):
+            action = rng.choice(("CREATE", "UPDATE", "LOAN", "RETURN", "EXPORT"))
+            yield {
+                "timestamp": start + timedelta(seconds=rng.randint(0, 730 * 86400)),
+                "action": action,
+                "entity_type": "loan" if action in ("LOAN", "RETURN") else "book",
+                "entity_id": rng.randint(1, spec.books),
+                "user": "system",
+                "details": json.dumps({"n": i}),
+                "level": "INFO",
+            }
+
+    with engine.begin() as conn:
+        conn.execute(Author.__table__.insert(), [{"name": n} for n in author_names])
+        for batch in _chunks(books(), chunk_size):
+            links = [{"book_id": b["id"], "author_id": b.pop("_author_id")} for b in batch]
+            conn.execute(Book.__table__.insert(), batch)
+            conn.execute(book_authors.insert(), links)
+        for batch in _chunks(members(), chunk_size):
+            conn.execute(Member.__table__.insert(), batch)
+        for batch in _chunks(loans(), chunk_size):
+            conn.execute(Loan.__table__.insert(), batch)
+        for batch in _chunks(audit(), chunk_size):
+            conn.execute(AuditLog.__table__.insert(), batch)
+    return spec
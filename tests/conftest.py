@@ -15,6 +15,7 @@ def isolated_db(tmp_path, monkeypatch):
     # Env
     monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
     monkeypatch.setenv("APPDATA", str(tmp_path))
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
     db_file = tmp_path / f"biblio_{uuid.uuid4().hex}.db"
     monkeypatch.setenv("DATABASE_URL", "sqlite:///" + str(db_file).replace("\\", "/"))
     # Reload
@@ -23,7 +24,16 @@ def isolated_db(tmp_path, monkeypatch):
         "libapp.persistence.base",
         "libapp.persistence.models_sa",
         "libapp.persistence.database",
+        "libapp.persistence.fts",
+        "libapp.persistence.projections",
+        "libapp.persistence.repositories",
+        "libapp.services.import_service",
         "libapp.services.loan_service",
+        "libapp.services.search_index",
     ]:
         sys.modules.pop(mod, None)
+        # `from . import models_sa` relit l'attribut du package parent : l'effacer aussi
+        parent, _, child = mod.rpartition(".")
+        if parent in sys.modules and hasattr(sys.modules[parent], child):
+            delattr(sys.modules[parent], child)
     yield
@@ -0,0 +1,90 @@
+"""Tests de l'écrivain d'audit asynchrone (file + insertion par lots)."""
+
+from __future__ import annotations
+
+import threading
+
+
+def test_entries_are_written_in_batches_and_flushed():
+    """Les entrées soumises sont regroupées par lots et toutes écrites au flush."""
+    from libapp.services.audit_service import AuditWriter
+
+    batches = []
+    writer = AuditWriter(
+        batch_size=10,
+        flush_interval_ms=1000,
+        write=lambda rows, _factory: batches.append(rows),
+        session_factory=lambda: None,
+    )
+    for i in range(25):
+        writer.submit({"action": "LOAN", "entity_id": i})
+
+    assert writer.flush(timeout=2.0)
+    assert sum(len(b) for b in batches) == 25
+    assert max(len(b) for b in batches) <= 10
+    assert [row["entity_id"] for b in batches for row in b] == list(range(25))
+    writer.close()
+
+
+def test_full_queue_falls_back_to_synchronous_write():
+    """File pleine : l'appelant écrit lui-même son entrée au lieu de la perdre."""
+    from libapp.services.audit_service import AuditWriter
+
+    gate = threading.Event()
+    written = []
+
+    def slow_write(batch, _factory):
+        if threading.current_thread().name == "audit-writer":
+            gate.wait(2.0)
+        written.extend(batch)
+
+    writer = AuditWriter(
+        batch_size=1,
+        max_queue=1,
+        put_timeout=0.01,
+        write=slow_write,
+        session_factory=lambda: None,
+    )
+    for i in range(4):
+        writer.submit({"entity_id": i})
+    gate.set()
+    writer.close(timeout=2.0)
+
+    assert sorted(row["entity_id"] for row in written) == [0, 1, 2, 3]
+    assert writer.stats()["sync_writes"] >= 1
+
+
+def test_entries_keep_the_session_factory_current_at_submission():
+    """Une entrée en file est écrite via la fabrique de sessions courante à sa soumission."""
+    from libapp.services.audit_service import AuditWriter
+
+    current = ["db1"]
+    written = []
+    writer = AuditWriter(
+        flush_interval_ms=1000,
+        write=lambda rows, factory: written.append((factory, [r["n"] for r in rows])),
+        session_factory=lambda: current[0],
+    )
+    writer.submit({"n": 1})
+    writer.submit({"n": 2})
+    current[0] = "db2"  # Persistance rechargée avant l'écriture du lot
+    writer.submit({"n": 3})
+    writer.close(timeout=2.0)
+
+    assert written == [("db1", [1, 2]), ("db2", [3])]
+
+
+def test_log_audit_persists_after_shutdown(isolated_db):
+    """log_audit ne bloque pas sur la base ; les entrées sont en base après la fermeture."""
+    from libapp.persistence.database import ensure_tables, get_session
+    from libapp.persistence.models_sa import AuditLog
+    from libapp.services import audit_service
+
+    ensure_tables()
+    audit_service.audit_loan_created(1, 2, 3, "Germinal", "Dupont")
+    audit_service.audit_loan_returned(1, 2, 3, "Germinal", "Dupont")
+    audit_service.shutdown_audit_writer()
+
+    with get_session() as session:
+        actions = [a.action for a in session.query(AuditLog).order_by(AuditLog.id)]
+    assert actions == ["LOAN", "RETURN"]
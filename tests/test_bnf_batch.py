@@ -0,0 +1,140 @@
+"""Tests des recherches BnF multi-ISBN (une requête CQL par paquet)."""
+
+from __future__ import annotations
+
+import time
+
+
+def _record(title, *isbns):
+    fields = "".join(
+        f'<mxc:datafield tag="020"><mxc:subfield code="a">{isbn}</mxc:subfield></mxc:datafield>'
+        for isbn in isbns
+    )
+    return (
+        "<srw:record><srw:recordData><mxc:record>"
+        f"{fields}"
+        f'<mxc:datafield tag="245"><mxc:subfield code="a">{title}</mxc:subfield></mxc:datafield>'
+        "</mxc:record></srw:recordData></srw:record>"
+    )
+
+
+def _page(records, next_position=None):
+    following = f"<srw:nextRecordPosition>{next_position}</srw:nextRecordPosition>"
+    return (
+        '<srw:searchRetrieveResponse xmlns:srw="http://www.loc.gov/zing/srw/" '
+        'xmlns:mxc="info:lc/xmlns/marcxchange-v2">'
+        f"<srw:records>{''.join(records)}</srw:records>"
+        f"{following if next_position else ''}"
+        "</srw:searchRetrieveResponse>"
+    ).encode()
+
+
+class _Response:
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class _Transport:
+    """Deux pages : Germinal (ISBN-13), puis Nana (ISBN-10 dans la notice)."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, *, source, params=None, timeout=None, headers=None):
+        self.calls.append(dict(params))
+        if params["startRecord"] == "1":
+            return _Response(_page([_record("Germinal", "978-2-07-036042-0 br.")], 2))
+        return _Response(_page([_record("Nana", "2-253-00423-5")]))
+
+
+def test_batch_query_pages_and_matches_records_to_isbns():
+    """Un paquet = une requête CQL paginée ; ISBN-10/13 rapprochés, absents à None."""
+    from libapp.services.bnf_service import BnfService
+
+    transport = _Transport()
+    service = BnfService(transport=transport)
+
+    found = service.search_many_isbns(["9782070360420", "9782253004233", "9780000000002"])
+
+    assert found["9782070360420"].titre == "Germinal"
+    assert found["9782253004233"].titre == "Nana"
+    assert found["9780000000002"] is None
+    assert [call["startRecord"] for call in transport.calls] == ["1", "2"]
+    assert transport.calls[0]["query"].count(" or ") == 2
+
+
+class _Strategy:
+    def __init__(self):
+        self.calls = []
+        self.services = []
+
+    def search_by_isbn(self, isbn, services):
+        self.calls.append(isbn)
+        self.services.append(sorted(services))
+        return []
+
+
+def test_batch_enrichment_only_searches_bnf_misses(tmp_path):
+    """search_many_isbns ne confie à la stratégie que les ISBN absents du lot BnF."""
+    from libapp.services.bnf_service import BnfService
+    from libapp.services.meta_search_service import (
+        MetaSearchService,
+        _results_from_json,
+        _results_to_json,
+    )
+    from libapp.services.metadata_cache import MetadataCache
+
+    cache = MetadataCache(
+        tmp_path / "cache.sqlite3", encode=_results_to_json, decode=_results_from_json
+    )
+    strategy = _Strategy()
+    service = MetaSearchService(strategy=strategy, cache=cache)
+    service.services = {"bnf": BnfService(transport=_Transport()), "google": object()}
+
+    started = time.perf_counter()
+    lookups = {
+        lookup.isbn: lookup
+        for lookup in service.search_many_isbns(
+            ["978-2-07-036042-0", "9782253004233", "9780000000002"]
+        )
+    }
+
+    assert time.perf_counter() - started < 1.0
+    assert lookups["9782070360420"].results[0].title == "Germinal"
+    assert lookups["9782253004233"].results[0].source.name == "BnF"
+    assert strategy.calls == ["9780000000002"]
+    # La BnF a déjà répondu pour cet ISBN : seule Google reste à interroger
+    assert strategy.services == [["google"]]
+
+
+class _DownTransport:
+    def get(self, url, *, source, params=None, timeout=None, headers=None):
+        raise ConnectionError("BnF injoignable")
+
+
+def test_failed_batch_counts_as_failure_and_keeps_source(tmp_path, monkeypatch):
+    """Un lot BnF en échec est un échec de la source ; ses ISBN lui restent confiés."""
+    from libapp.services import meta_search_service
+    from libapp.services.bnf_service import BnfService
+    from libapp.services.metadata_cache import MetadataCache
+    from libapp.services.source_health import CircuitState, LatencyTracker, SourceHealth
+
+    health = SourceHealth(LatencyTracker(), failure_threshold=1)
+    monkeypatch.setattr(meta_search_service, "get_source_health", lambda: health)
+    cache = MetadataCache(
+        tmp_path / "cache.sqlite3",
+        encode=meta_search_service._results_to_json,
+        decode=meta_search_service._results_from_json,
+    )
+    strategy = _Strategy()
+    service = meta_search_service.MetaSearchService(strategy=strategy, cache=cache)
+    service.services = {"bnf": BnfService(transport=_DownTransport()), "google": object()}
+
+    lookups = list(service.search_many_isbns(["9782070360420"]))
+
+    assert [lookup.isbn for lookup in lookups] == ["9782070360420"]
+    assert health.state("BnF") is CircuitState.OPEN
+    assert strategy.services == [["bnf", "google"]]
@@ -0,0 +1,88 @@
+"""Tests du parseur SRU/INTERMARC de la BnF."""
+
+from __future__ import annotations
+
+SRU_RESPONSE = """<?xml version="1.0" encoding="UTF-8"?>
+<srw:searchRetrieveResponse xmlns:srw="http://www.loc.gov/zing/srw/"
+    xmlns:mxc="info:lc/xmlns/marcxchange-v2">
+  <srw:numberOfRecords>2</srw:numberOfRecords>
+  <srw:records>
+    <srw:record>
+      <srw:recordData>
+        <mxc:record format="Intermarc" type="Bibliographic">
+          <mxc:leader>00000cam  2200000   45  </mxc:leader>
+          <mxc:controlfield tag="001">FRBNF001</mxc:controlfield>
+          <mxc:datafield tag="020" ind1=" " ind2=" ">
+            <mxc:subfield code="a">978-2-07-036042-0 br.</mxc:subfield>
+          </mxc:datafield>
+          <mxc:datafield tag="100" ind1=" " ind2=" ">
+            <mxc:subfield code="a">Zola</mxc:subfield>
+            <mxc:subfield code="m">Émile</mxc:subfield>
+          </mxc:datafield>
+          <mxc:datafield tag="245" ind1="1" ind2=" ">
+            <mxc:subfield code="a">Germinal</mxc:subfield>
+            <mxc:subfield code="e">roman</mxc:subfield>
+          </mxc:datafield>
+          <mxc:datafield tag="260" ind1=" " ind2=" ">
+            <mxc:subfield code="c">Gallimard</mxc:subfield>
+            <mxc:subfield code="d">impr. 1978</mxc:subfield>
+          </mxc:datafield>
+          <mxc:datafield tag="700" ind1=" " ind2=" ">
+            <mxc:subfield code="a">Zola</mxc:subfield>
+            <mxc:subfield code="a">Mitterand</mxc:subfield>
+          </mxc:datafield>
+        </mxc:record>
+      </srw:recordData>
+    </srw:record>
+    <srw:record>
+      <srw:recordData>
+        <mxc:record format="Intermarc" type="Bibliographic">
+          <mxc:datafield tag="245" ind1="1" ind2=" ">
+            <mxc:subfield code="a">Germinal</mxc:subfield>
+          </mxc:datafield>
+          <mxc:datafield tag="264" ind1=" " ind2=" ">
+            <mxc:subfield code="b">Le Livre de poche</mxc:subfield>
+            <mxc:subfield code="c">2000</mxc:subfield>
+          </mxc:datafield>
+        </mxc:record>
+      </srw:recordData>
+    </srw:record>
+  </srw:records>
+</srw:searchRetrieveResponse>
+"""
+
+
+def test_every_record_is_parsed_from_one_response():
+    """Toutes les notices sont retournées, champs extraits depuis l'index MARC."""
+    from libapp.services.bnf_service import parse_sru_response
+
+    books = parse_sru_response(SRU_RESPONSE.encode())
+
+    assert len(books) == 2
+    first, second = books
+    assert first.titre == "Germinal"
+    assert first.sous_titre == "roman"
+    assert first.isbn == "9782070360420"
+    assert first.editeur == "Gallimard"
+    assert first.date_publication == "1978"
+    assert first.auteurs[-1] == "Mitterand"
+    assert len(first.auteurs) == len(set(first.auteurs))
+    assert (second.editeur, second.date_publication, second.isbn) == (
+        "Le Livre de poche",
+        "2000",
+        None,
+    )
+
+
+def test_diagnostic_or_invalid_response_gives_no_record():
+    """Un diagnostic SRU ou un XML illisible ne lève pas d'erreur."""
+    from libapp.services.bnf_service import parse_sru_response
+
+    diagnostic = (
+        '<srw:searchRetrieveResponse xmlns:srw="http://www.loc.gov/zing/srw/">'
+        '<srw:diagnostics><diag:diagnostic xmlns:diag="http://www.loc.gov/zing/srw/diagnostic/">'
+        "<diag:message>Query syntax error</diag:message></diag:diagnostic></srw:diagnostics>"
+        "</srw:searchRetrieveResponse>"
+    )
+    assert parse_sru_response(diagnostic) == []
+    assert parse_sru_response(b"<html>503</html") == []
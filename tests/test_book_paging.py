@@ -0,0 +1,132 @@
+"""Tests de la pagination par clé (keyset) du catalogue."""
+
+from __future__ import annotations
+
+
+def _seed(n: int) -> None:
+    from libapp.persistence.database import engine
+    from libapp.persistence.models_sa import Book
+
+    rows = [
+        {
+            "title": f"Titre {i % 7}",
+            "authors_text": ("Dumas", "Hugo", "Zola")[i % 3],
+            "code_interne": None,
+        }
+        for i in range(n)
+    ]
+    with engine.begin() as conn:
+        conn.execute(Book.__table__.insert(), rows)
+
+
+def _all_pages(repo, **kwargs):
+    from libapp.persistence.repositories import BookRepository
+
+    pages, after = [], None
+    while True:
+        page = repo.page(after=after, limit=4, **kwargs)
+        pages.extend(page)
+        if len(page) < 4:
+            return pages
+        last = page[-1]
+        after = (BookRepository.sort_value(last, kwargs.get("sort_key", "title")), last.id)
+
+
+def test_keyset_pages_cover_catalog_in_order(isolated_db):
+    """Les pages successives couvrent tout le catalogue, sans doublon, dans l'ordre."""
+    from libapp.persistence.database import ensure_tables, get_session
+    from libapp.persistence.repositories import BookRepository
+
+    ensure_tables()
+    _seed(23)
+
+    with get_session() as s:
+        repo = BookRepository(s)
+        books = _all_pages(repo)
+        assert [b.id for b in books] == [b.id for b in sorted(books, key=lambda b: (b.title, b.id))]
+        assert len({b.id for b in books}) == 23 == repo.count()
+
+        # Tri décroissant sur une colonne NULL-able
+        desc = _all_pages(repo, sort_key="code", descending=True)
+        assert [b.id for b in desc] == sorted((b.id for b in desc), reverse=True)
+
+
+def test_keyset_pages_with_fulltext_filter(isolated_db):
+    """Le filtre FTS5 s'applique aux pages et au comptage."""
+    from libapp.persistence.database import ensure_tables, get_session
+    from libapp.persistence.repositories import BookRepository
+    from libapp.services.search_index import build_fts_query
+
+    ensure_tables()
+    _seed(23)
+
+    match = build_fts_query("hug")
+    with get_session() as s:
+        repo = BookRepository(s)
+        books = _all_pages(repo, fts_match=match)
+        assert {b.authors_text for b in books} == {"Hugo"}
+        assert len(books) == repo.count(fts_match=match) == 8
+
+
+def test_keyset_pages_by_relevance(isolated_db):
+    """Avec un filtre FTS5, le tri par pertinence suit le score bm25 pondéré."""
+    from libapp.persistence.database import engine, ensure_tables, get_session
+    from libapp.persistence.models_sa import Book
+    from libapp.persistence.repositories import RELEVANCE_SORT_KEY, BookRepository
+    from libapp.services.search_index import build_fts_query, search_book_ids
+
+    ensure_tables()
+    _seed(10)
+    with engine.begin() as conn:
+        # Le mot dans le titre pèse plus que dans le résumé
+        conn.execute(
+            Book.__table__.insert(),
+            [{"title": "Essai", "summary": f"Un récit sur la mer ({i})"} for i in range(6)]
+            + [{"title": "La mer", "summary": None}, {"title": "Carnets", "summary": "mer " * 5}],
+        )
+
+    match = build_fts_query("mer")
+    with get_session() as s:
+        books = _all_pages(BookRepository(s), fts_match=match, sort_key=RELEVANCE_SORT_KEY)
+        # Plusieurs pages : le curseur (score, id) enchaîne sans doublon ni trou
+        assert [b.id for b in books] == [b.id for b in sorted(books, key=lambda b: (b.score, b.id))]
+        assert {b.id for b in books} == set(search_book_ids("mer"))
+        assert len(books) == 8
+        assert books[0].title == "La mer"
+
+
+def test_table_model_resets_when_reread_page_shifted(isolated_db, monkeypatch):
+    """Une page évincée relue après une insertion déclenche la réinitialisation du modèle."""
+    from PySide6.QtWidgets import QApplication
+
+    from libapp.persistence.database import engine, ensure_tables
+    from libapp.persistence.models_sa import Book
+    from libapp.views.book_list import BookTableModel
+
+    app = QApplication.instance() or QApplication([])
+    ensure_tables()
+    _seed(12)
+    monkeypatch.setattr(BookTableModel, "PAGE_SIZE", 4)
+    monkeypatch.setattr(BookTableModel, "MAX_CACHED_PAGES", 1)
+
+    model = BookTableModel(visible_columns=["id", "title"])
+    model.reload()
+    while model.canFetchMore():
+        model.fetchMore()
+    assert model.rowCount() == 12
+    first_title = model.get_book_by_row(0).title
+
+    # Relecture sans modification : pas de réinitialisation
+    resets = []
+    model.modelReset.connect(lambda: resets.append(True))
+    model.get_book_by_row(5)
+    app.processEvents()
+    assert resets == []
+
+    with engine.begin() as conn:
+        conn.execute(Book.__table__.insert(), [{"title": "A tout début"}])
+    model.get_book_by_row(2)  # Page 0 évincée, relue décalée d'une ligne
+    app.processEvents()
+    assert resets == [True]
+    assert model.get_book_by_row(0).title == "A tout début"
+    assert model.get_book_by_row(1).title == first_title
@@ -0,0 +1,71 @@
+"""Tests de la politique de complétion des recherches ISBN parallèles."""
+
+from __future__ import annotations
+
+import time
+
+
+class _Bnf:
+    def __init__(self, delay):
+        self.delay = delay
+
+    def search_by_isbn(self, isbn):
+        from libapp.services.bnf_service import BnfBook
+
+        time.sleep(self.delay)
+        return BnfBook("Germinal", None, ["Zola"], isbn, "Gallimard", "1885", None)
+
+
+class _Google:
+    def __init__(self):
+        self.calls = 0
+
+    def search_by_isbn(self, isbn):
+        from libapp.services.types import BookDTO
+
+        self.calls += 1
+        return BookDTO(
+            id=None, isbn=isbn, title="Germinal", author="Zola", publisher="Folio", year=1885
+        )
+
+
+class _SlowOpenLibrary:
+    def search_by_isbn(self, isbn):
+        time.sleep(1.0)
+        return None
+
+
+def test_first_good_result_returns_without_waiting_or_hedging():
+    """Une réponse BnF satisfaisante rend la main avant le délai de couverture."""
+    from libapp.services.meta_search_service import ParallelSearchStrategy
+    from libapp.services.source_health import LatencyTracker
+
+    google = _Google()
+    strategy = ParallelSearchStrategy(timeout=2.0, latency=LatencyTracker())
+    services = {"bnf": _Bnf(0.01), "google": google, "openlibrary": _SlowOpenLibrary()}
+
+    started = time.perf_counter()
+    results = strategy.search_by_isbn("9782070360001", services)
+
+    assert time.perf_counter() - started < 0.5
+    assert [r.source.name for r in results] == ["BnF"]
+    assert google.calls == 0
+
+
+def test_slow_primary_is_hedged_after_its_p95():
+    """Une BnF plus lente que son p95 observé est couverte par Google Books."""
+    from libapp.services.meta_search_service import ParallelSearchStrategy
+    from libapp.services.source_health import LatencyTracker
+
+    latency = LatencyTracker()
+    for _ in range(20):
+        latency.record("BnF:search_by_isbn", 0.05)
+    strategy = ParallelSearchStrategy(timeout=2.0, latency=latency)
+    services = {"bnf": _Bnf(0.6), "google": _Google(), "openlibrary": _SlowOpenLibrary()}
+
+    started = time.perf_counter()
+    results = strategy.search_by_isbn("9782070360002", services)
+
+    assert time.perf_counter() - started < 0.4
+    assert [r.source.name for r in results] == ["Google Books"]
+    assert strategy.hedge_delay("BnF:search_by_isbn", strategy.policy) == 0.05
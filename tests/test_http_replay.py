@@ -0,0 +1,93 @@
+"""Tests de l'enregistrement et du rejeu des réponses des sources."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+import requests
+
+SRU_RECORD = (
+    '<srw:searchRetrieveResponse xmlns:srw="http://www.loc.gov/zing/srw/" '
+    'xmlns:mxc="info:lc/xmlns/marcxchange-v2"><srw:records><srw:record><srw:recordData>'
+    '<mxc:record><mxc:datafield tag="245"><mxc:subfield code="a">Germinal</mxc:subfield>'
+    "</mxc:datafield></mxc:record></srw:recordData></srw:record></srw:records>"
+    "</srw:searchRetrieveResponse>"
+)
+
+
+class _Response:
+    status_code = 200
+    headers = {"Content-Type": "text/xml"}
+    content = SRU_RECORD.encode()
+
+    def raise_for_status(self):
+        pass
+
+
+class _LiveTransport:
+    """Tient lieu du catalogue BnF en ligne pendant l'enregistrement."""
+
+    def get(self, url, *, source, params=None, timeout=None, headers=None):
+        return _Response()
+
+
+def test_recorded_responses_are_replayed_with_faults(tmp_path):
+    """Réponse enregistrée rejouée (latence simulée), puis erreur injectée."""
+    from libapp.services.bnf_service import BnfService
+    from libapp.services.http_replay import (
+        FaultProfile,
+        FixtureStore,
+        RecordingTransport,
+        ReplayServer,
+        replay_services,
+    )
+
+    store = FixtureStore(tmp_path / "fixtures")
+    recorder = RecordingTransport(store, inner=_LiveTransport())
+    assert BnfService(transport=recorder).search_by_isbn("9782070360420").titre == "Germinal"
+    assert len(store) == 1
+
+    faults = {"bnf": FaultProfile(latency=0.2)}
+    with ReplayServer(FixtureStore(tmp_path / "fixtures"), faults) as server:
+        bnf = replay_services(server)["bnf"]
+
+        started = time.perf_counter()
+        assert bnf.search_by_isbn("9782070360420").titre == "Germinal"
+        assert time.perf_counter() - started >= 0.2
+
+        # Requête jamais enregistrée (404) ou erreur injectée : échec levé, pas « introuvable »
+        with pytest.raises(requests.HTTPError):
+            bnf.search_by_isbn("9782253004233")
+
+        server.faults["bnf"] = FaultProfile(error_rate=1.0)
+        with pytest.raises(requests.HTTPError):
+            bnf.search_by_isbn("9782070360420")
+
+    assert server.stats == {"requests": 3, "errors": 1, "missing": 1}
+
+
+def test_replayed_503_opens_the_circuit(tmp_path):
+    """Des 503 rejoués comptent comme des échecs : le disjoncteur BnF s'ouvre."""
+    from libapp.services.http_replay import (
+        FaultProfile,
+        FixtureStore,
+        ReplayServer,
+        replay_services,
+    )
+    from libapp.services.meta_search_service import CompletionPolicy, ParallelSearchStrategy
+    from libapp.services.source_health import CircuitState, LatencyTracker, SourceHealth
+
+    health = SourceHealth(LatencyTracker())
+    strategy = ParallelSearchStrategy(
+        timeout=2.0, policy=CompletionPolicy.wait_all(), health=health
+    )
+    faults = {"bnf": FaultProfile(error_rate=1.0)}
+    with ReplayServer(FixtureStore(tmp_path / "fixtures"), faults) as server:
+        services = {"bnf": replay_services(server)["bnf"]}
+        for n in range(5):
+            assert strategy.search_by_isbn(f"978207036042{n}", services) == []
+
+    assert health.state("BnF") is CircuitState.OPEN
+    # Seuil de 3 échecs consécutifs : les recherches suivantes n'atteignent plus la BnF
+    assert server.stats["errors"] == health.failure_threshold == 3
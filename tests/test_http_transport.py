@@ -0,0 +1,96 @@
+"""Tests du transport HTTP poolé, contre un serveur HTTP local."""
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    # Réponses à servir dans l'ordre : (statut, corps JSON[, en-têtes])
+    script: list[tuple] = []
+    seen: list[tuple[str, int]] = []
+
+    def do_GET(self):
+        status, payload, *extra = self.script.pop(0) if self.script else (200, {})
+        body = json.dumps(payload).encode()
+        self.seen.append((self.path, self.client_address[1]))
+        self.send_response(status)
+        for name, value in (extra[0] if extra else {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    _StubHandler.script = []
+    _StubHandler.seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", _StubHandler
+    server.shutdown()
+    server.server_close()
+
+
+def test_retries_server_errors_and_reuses_connection(stub_server):
+    """Un 503 est retenté avec backoff, et les requêtes réutilisent la même connexion."""
+    from libapp.services.http_transport import HttpTransport, SourcePolicy
+
+    base, handler = stub_server
+    transport = HttpTransport({"stub": SourcePolicy(retries=2, backoff_factor=0.01)})
+    handler.script = [(503, {}), (200, {"ok": 1}), (200, {"ok": 2})]
+
+    first = transport.get(f"{base}/a", source="stub")
+    second = transport.get(f"{base}/b", source="stub", params={"q": "x"})
+
+    assert (first.status_code, first.json()) == (200, {"ok": 1})
+    assert second.json() == {"ok": 2}
+    assert [path for path, _ in handler.seen] == ["/a", "/a", "/b?q=x"]
+    assert len({port for _, port in handler.seen}) == 1
+    transport.close()
+
+
+def test_retry_after_wait_is_capped(stub_server):
+    """Un `Retry-After: 3600` n'immobilise pas le thread au-delà du plafond de la source."""
+    import time
+
+    from libapp.services.http_transport import HttpTransport, SourcePolicy
+
+    base, handler = stub_server
+    policy = SourcePolicy(retries=1, backoff_factor=0.01, max_retry_after=0.2)
+    transport = HttpTransport({"stub": policy})
+    handler.script = [(503, {}, {"Retry-After": "3600"}), (200, {"ok": 1})]
+
+    start = time.monotonic()
+    response = transport.get(f"{base}/a", source="stub")
+
+    assert (response.status_code, response.json()) == (200, {"ok": 1})
+    assert time.monotonic() - start < 2.0
+    transport.close()
+
+
+def test_google_books_client_uses_transport(stub_server):
+    """Le client Google Books passe par le transport (URL de base remplaçable)."""
+    from libapp.services.googlebooks_service import GoogleBooksService
+    from libapp.services.http_transport import HttpTransport
+
+    base, handler = stub_server
+    handler.script = [(200, {"items": [{"volumeInfo": {"title": "Germinal"}}], "totalItems": 1})]
+    service = GoogleBooksService(transport=HttpTransport())
+    service.API_URL = f"{base}/books/v1/volumes"
+
+    items = service.search_by_title_author("Germinal", "Zola")
+
+    assert [item["volumeInfo"]["title"] for item in items] == ["Germinal"]
+    assert handler.seen[0][0].startswith("/books/v1/volumes?q=intitle")
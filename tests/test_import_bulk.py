@@ -0,0 +1,134 @@
+"""Tests de l'upsert en masse des livres importés (politiques skip/merge/replace)."""
+
+from __future__ import annotations
+
+
+def _authors_of(session, title):
+    from sqlalchemy import select
+
+    from libapp.persistence.models_sa import Book
+
+    book = session.scalars(select(Book).where(Book.title == title)).one()
+    return sorted(a.name for a in book.authors)
+
+
+def test_upsert_rows_policies_and_in_file_duplicates(isolated_db):
+    """Les doublons ISBN (base ou fichier) suivent la politique et les compteurs."""
+    from libapp.persistence.database import ensure_tables, get_session
+    from libapp.services.import_service import upsert_rows
+    from libapp.services.types import BookRow
+
+    ensure_tables()
+    first = upsert_rows(
+        [
+            BookRow(titre="Germinal", auteurs=["Zola"], isbn="9782070360420"),
+            BookRow(titre="Nana", auteurs=["Zola", "Zola"], isbn="9782253002864"),
+            BookRow(titre="Sans ISBN"),
+            # Même ISBN plus bas dans le fichier : fusionné avec la ligne insérée
+            BookRow(titre="Germinal bis", isbn="9782070360420", editeur="Folio"),
+        ]
+    )
+    assert (first.inserted, first.updated, first.skipped, first.errors) == (3, 1, 0, [])
+
+    skip = upsert_rows([BookRow(titre="Autre", isbn="9782070360420")], on_isbn_conflict="skip")
+    assert (skip.inserted, skip.updated, skip.skipped) == (0, 0, 1)
+
+    replace = upsert_rows(
+        [BookRow(titre="Nana (poche)", auteurs=["Émile Zola"], isbn="9782253002864")],
+        on_isbn_conflict="replace",
+    )
+    assert (replace.inserted, replace.updated) == (0, 1)
+
+    with get_session() as s:
+        assert _authors_of(s, "Germinal") == ["Zola"]
+        assert _authors_of(s, "Nana (poche)") == ["Émile Zola"]
+        from libapp.persistence.models_sa import Book
+
+        germinal = s.get(Book, 1)
+        assert (germinal.title, germinal.publisher) == ("Germinal", "Folio")
+
+
+def test_upsert_rows_merge_fills_only_empty_fields(isolated_db):
+    """La politique merge complète les champs vides sans écraser les autres."""
+    from libapp.persistence.database import ensure_tables, get_session
+    from libapp.persistence.models_sa import Author, Book
+    from libapp.services.import_service import upsert_rows
+    from libapp.services.types import BookRow
+
+    ensure_tables()
+    with get_session() as s:
+        s.add(Author(name="Hugo"))
+        s.add(Book(title="Les Misérables", isbn="9782070409228", publisher="Gallimard"))
+        s.commit()
+
+    result = upsert_rows(
+        [
+            BookRow(
+                titre="Ignoré",
+                auteurs=["Hugo"],
+                isbn="9782070409228",
+                editeur="Folio",
+                date_publication=1862,
+                mots_cles=["roman", "XIXe"],
+            )
+        ]
+    )
+    assert (result.inserted, result.updated) == (0, 1)
+
+    with get_session() as s:
+        book = s.get(Book, 1)
+        assert (book.title, book.publisher, book.year) == ("Les Misérables", "Gallimard", "1862")
+        assert (book.authors_text, book.mots_cles) == ("Hugo", "roman;XIXe")
+        assert [a.name for a in book.authors] == ["Hugo"]
+        assert s.query(Author).count() == 1
+
+
+def test_upsert_rows_streams_chunks_and_rolls_back_failed_chunk_only(isolated_db):
+    """Un lot en échec est annulé seul ; les lots précédents et suivants sont commités."""
+    from libapp.persistence.database import ensure_tables, get_session
+    from libapp.persistence.models_sa import Book
+    from libapp.services.import_service import upsert_rows
+    from libapp.services.types import BookRow
+
+    ensure_tables()
+
+    def rows():
+        for n in range(25):
+            if n in (3, 15):
+                yield None  # Ligne illisible : erreur propre à la ligne
+                continue
+            # Titre NULL (contrainte NOT NULL) dans le deuxième lot
+            yield BookRow(titre=None if n == 13 else f"Livre {n}", isbn=f"978{n:010d}")
+
+    result = upsert_rows(rows(), chunk_size=10)
+
+    assert result.inserted == 14
+    # L'erreur de la ligne 17 (lot annulé) est remplacée par celle du lot
+    assert [e.row_index for e in result.errors] == [5, 12]
+    assert "lignes 12-21" in result.errors[1].message
+    with get_session() as s:
+        assert s.query(Book).count() == 14
+
+
+def test_upsert_rows_cancellation_keeps_committed_chunks(isolated_db):
+    """L'annulation abandonne le lot en cours et conserve les lots déjà commités."""
+    import threading
+
+    from libapp.persistence.database import ensure_tables, get_session
+    from libapp.persistence.models_sa import Book
+    from libapp.services.import_service import upsert_rows
+    from libapp.services.types import BookRow
+
+    ensure_tables()
+    cancel = threading.Event()
+
+    def on_progress(_done, _total, _message):
+        cancel.set()  # demande l'arrêt dès le premier lot commité
+
+    rows = [BookRow(titre=f"Livre {n}") for n in range(30)]
+    result = upsert_rows(rows, _progress=on_progress, chunk_size=10, cancel_event=cancel)
+
+    assert result.cancelled
+    assert result.inserted == 10
+    with get_session() as s:
+        assert s.query(Book).count() == 10
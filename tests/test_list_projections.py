@@ -0,0 +1,57 @@
+"""Tests des projections légères utilisées par les vues en liste."""
+
+from __future__ import annotations
+
+from datetime import date
+
+
+def test_book_rows_truncate_summary_unless_requested(isolated_db):
+    """Les lignes de livres ne lisent qu'un aperçu du résumé, sauf pour l'export."""
+    from libapp.persistence.database import ensure_tables, get_session
+    from libapp.persistence.models_sa import Book
+    from libapp.persistence.projections import SUMMARY_PREVIEW_CHARS, BookListRow
+    from libapp.persistence.repositories import BookRepository
+
+    ensure_tables()
+    with get_session() as s:
+        s.add(Book(title="Germinal", authors_text="Zola", collection="SEDC", summary="x" * 500))
+        s.commit()
+
+        (row,) = BookRepository(s).page()
+        assert isinstance(row, BookListRow)
+        assert (row.author, row.fund) == ("Zola", "SEDC")
+        assert len(row.summary) == SUMMARY_PREVIEW_CHARS
+
+        (full,) = BookRepository(s).page(summary_chars=None)
+        assert len(full.summary) == 500
+
+
+def test_member_and_loan_rows(isolated_db):
+    """Les lignes de prêts joignent le titre du livre et le nom du membre."""
+    from libapp.persistence.database import ensure_tables, get_session
+    from libapp.persistence.models_sa import Book, Loan, Member
+    from libapp.persistence.repositories import LoanRepository, MemberRepository
+
+    ensure_tables()
+    with get_session() as s:
+        book = Book(title="Nana")
+        member = Member(member_no="M1", first_name="Émile", last_name="Zola", email="")
+        s.add_all([book, member])
+        s.flush()
+        s.add(
+            Loan(
+                book_id=book.id,
+                member_id=member.id,
+                loan_date=date(2024, 1, 1),
+                due_date=date(2024, 1, 15),
+            )
+        )
+        s.commit()
+
+        (member_row,) = MemberRepository(s).list_rows()
+        assert (member_row.member_no, member_row.is_active) == ("M1", True)
+
+        (loan_row,) = LoanRepository(s).list_rows()
+        assert loan_row.book_title == "Nana"
+        assert loan_row.member_name == "Émile Zola"
+        assert len(LoanRepository(s).list_open_by_book(book.id)) == 1
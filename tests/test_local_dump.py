@@ -0,0 +1,138 @@
+"""Tests de l'ingestion de dumps et de la résolution d'ISBN hors ligne."""
+
+from __future__ import annotations
+
+import gzip
+import json
+
+MARCXML = """<?xml version="1.0" encoding="UTF-8"?>
+<mxc:collection xmlns:mxc="info:lc/xmlns/marcxchange-v2">
+  <mxc:record>
+    <mxc:datafield tag="020"><mxc:subfield code="a">2-253-00423-5 br.</mxc:subfield></mxc:datafield>
+    <mxc:datafield tag="100"><mxc:subfield code="a">Zola</mxc:subfield></mxc:datafield>
+    <mxc:datafield tag="245"><mxc:subfield code="a">Nana</mxc:subfield></mxc:datafield>
+    <mxc:datafield tag="260"><mxc:subfield code="d">impr. 1984</mxc:subfield></mxc:datafield>
+  </mxc:record>
+  <mxc:record>
+    <mxc:datafield tag="245"><mxc:subfield code="a">Sans ISBN</mxc:subfield></mxc:datafield>
+  </mxc:record>
+</mxc:collection>
+"""
+
+
+def _write_openlibrary_dump(path):
+    editions = [
+        {
+            "title": "Germinal",
+            "isbn_13": ["9782070360420"],
+            "by_statement": "Émile Zola",
+            "publishers": ["Gallimard"],
+            "publish_date": "1978",
+        },
+        {"title": "Sans ISBN"},
+    ]
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        for n, edition in enumerate(editions):
+            f.write(f"/type/edition\t/books/OL{n}M\t1\t2024-01-01\t{json.dumps(edition)}\n")
+        f.write("ligne illisible\n")
+
+
+def test_dumps_are_ingested_and_resolved_by_isbn(tmp_path):
+    """Dump OpenLibrary (TSV gzip) et MARCXML ingérés ; ISBN-10 et 13 retrouvés."""
+    from libapp.services.local_dump_service import LocalDumpService
+
+    ol_dump = tmp_path / "ol_dump_editions.txt.gz"
+    _write_openlibrary_dump(ol_dump)
+    marc_dump = tmp_path / "bnf_export.xml"
+    marc_dump.write_text(MARCXML, encoding="utf-8")
+
+    store = LocalDumpService(tmp_path / "local_dump.sqlite3")
+    progress = []
+    assert store.ingest(ol_dump, progress=progress.append) == 1
+    assert store.ingest(marc_dump, batch_size=1) == 1
+    assert progress == [1]
+    assert store.count() == 2
+
+    germinal = store.search_by_isbn("978-2-07-036042-0")
+    assert (germinal.titre, germinal.editeur, germinal.date_publication) == (
+        "Germinal",
+        "Gallimard",
+        "1978",
+    )
+    assert store.search_by_isbn("2253004235").titre == "Nana"
+    found = store.search_many_isbns(["9782253004233", "9780000000002"])
+    assert found["9782253004233"].date_publication == "1984"
+    assert found["9780000000002"] is None
+
+
+class _OfflineStrategy:
+    def search_by_isbn(self, isbn, services):
+        raise ConnectionError("réseau indisponible")
+
+
+def test_lookups_are_not_blocked_during_ingestion(tmp_path):
+    """Pendant une ingestion, les recherches répondent et voient les lots déjà commités."""
+    import threading
+
+    from libapp.services.local_dump_service import LocalDumpService
+
+    ol_dump = tmp_path / "ol_dump_editions.txt.gz"
+    _write_openlibrary_dump(ol_dump)
+    marc_dump = tmp_path / "bnf_export.xml"
+    marc_dump.write_text(MARCXML, encoding="utf-8")
+    store = LocalDumpService(tmp_path / "local_dump.sqlite3")
+    store.ingest(ol_dump)
+
+    committed, release = threading.Event(), threading.Event()
+
+    def hold(_count):
+        committed.set()
+        release.wait(5.0)  # Ingestion « longue » : bloquée après son premier lot
+
+    ingestion = threading.Thread(target=store.ingest, args=(marc_dump,), kwargs={"progress": hold})
+    ingestion.start()
+    try:
+        assert committed.wait(5.0)
+        lookups = {}
+        reader = threading.Thread(
+            target=lambda: lookups.update(
+                germinal=store.search_by_isbn("9782070360420"),
+                nana=store.search_many_isbns(["2253004235"])["2253004235"],
+            )
+        )
+        reader.start()
+        reader.join(2.0)
+        assert not reader.is_alive()
+        assert lookups["germinal"].titre == "Germinal"
+        assert lookups["nana"].titre == "Nana"
+    finally:
+        release.set()
+        ingestion.join(5.0)
+    assert store.count() == 2
+    store.close()
+
+
+def test_meta_search_resolves_from_local_dump_first(tmp_path):
+    """Avec un dump local, la recherche ISBN n'atteint pas la stratégie réseau."""
+    from libapp.services.local_dump_service import LocalDumpService
+    from libapp.services.meta_search_service import (
+        MetaSearchService,
+        _results_from_json,
+        _results_to_json,
+    )
+    from libapp.services.metadata_cache import MetadataCache
+
+    marc_dump = tmp_path / "bnf_export.xml"
+    marc_dump.write_text(MARCXML, encoding="utf-8")
+    store = LocalDumpService(tmp_path / "local_dump.sqlite3")
+    store.ingest(marc_dump)
+
+    cache = MetadataCache(
+        tmp_path / "cache.sqlite3", encode=_results_to_json, decode=_results_from_json
+    )
+    service = MetaSearchService(strategy=_OfflineStrategy(), cache=cache)
+    service.services["local"] = store
+
+    results = service.search_by_isbn("9782253004233")
+
+    assert [(r.title, r.source.name) for r in results] == [("Nana", "Local")]
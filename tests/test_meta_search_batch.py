@@ -0,0 +1,104 @@
+"""Tests de la résolution d'ISBN par lots et de la limitation de débit."""
+
+from __future__ import annotations
+
+import time
+
+
+class _FlakyStrategy:
+    """Stratégie factice : un résultat BnF par ISBN, erreur pour l'ISBN "666"."""
+
+    def __init__(self):
+        self.calls: list[str] = []
+
+    def search_by_isbn(self, isbn, services):
+        from libapp.services.meta_search_service import SearchSourceInfo, UnifiedBookResult
+
+        self.calls.append(isbn)
+        if isbn == "666":
+            raise RuntimeError("source indisponible")
+        source = SearchSourceInfo(name="BnF", confidence=0.95, response_time=0.1)
+        return [UnifiedBookResult(title=f"Livre {isbn}", source=source, isbn=isbn)]
+
+
+def test_search_many_isbns_streams_results_and_reports_failures(tmp_path):
+    """Chaque ISBN distinct donne un IsbnLookup ; une erreur n'interrompt pas le lot."""
+    from libapp.services.meta_search_service import (
+        MetaSearchService,
+        _results_from_json,
+        _results_to_json,
+    )
+    from libapp.services.metadata_cache import MetadataCache
+
+    cache = MetadataCache(
+        tmp_path / "cache.sqlite3", encode=_results_to_json, decode=_results_from_json
+    )
+    strategy = _FlakyStrategy()
+    service = MetaSearchService(strategy=strategy, cache=cache)
+    isbns = [f"978-{n:03d}" for n in range(20)] + ["978000", "", "666"]
+
+    lookups = {lookup.isbn: lookup for lookup in service.search_many_isbns(isbns, concurrency=3)}
+
+    assert len(lookups) == 21
+    assert lookups["666"].error == "source indisponible"
+    assert lookups["978007"].results[0].title == "Livre 978007"
+    assert sorted(strategy.calls) == sorted(lookups)
+
+    # Deuxième passage : tout vient du cache, sauf l'ISBN en échec
+    again = list(service.search_many_isbns(isbns))
+    assert sum(lookup.from_cache for lookup in again) == 20
+    assert strategy.calls.count("666") == 2
+
+
+class _DownBnf:
+    def __init__(self):
+        self.calls = 0
+
+    def search_by_isbn(self, isbn):
+        self.calls += 1
+        raise ConnectionError("503 Service Unavailable")
+
+
+class _EmptyGoogle:
+    def search_by_isbn(self, isbn):
+        return []
+
+
+def test_source_error_is_reported_and_not_negative_cached(tmp_path):
+    """Sans réponse de la BnF, « aucun résultat » n'est ni établi ni mis en cache."""
+    from libapp.services.meta_search_service import (
+        MetaSearchService,
+        SequentialSearchStrategy,
+        _results_from_json,
+        _results_to_json,
+    )
+    from libapp.services.metadata_cache import MetadataCache, isbn_key
+
+    cache = MetadataCache(
+        tmp_path / "cache.sqlite3", encode=_results_to_json, decode=_results_from_json
+    )
+    service = MetaSearchService(strategy=SequentialSearchStrategy(), cache=cache)
+    bnf = _DownBnf()
+    service.services = {"bnf": bnf, "google": _EmptyGoogle()}
+
+    (lookup,) = service.search_many_isbns(["9782070360420"])
+    assert lookup.results == [] and not lookup.ok
+    assert "BnF" in lookup.error and "503" in lookup.error
+    assert cache.get(isbn_key("9782070360420")) is None
+
+    # Recherche unitaire : même résultat vide, toujours pas de cache négatif
+    assert service.search_by_isbn("9782070360420") == []
+    assert bnf.calls == 2
+    assert cache.get(isbn_key("9782070360420")) is None
+
+
+def test_token_bucket_limits_rate():
+    """Au-delà de la réserve, le seau impose l'intervalle 1/rate entre deux jetons."""
+    from libapp.services.http_transport import TokenBucket
+
+    bucket = TokenBucket(rate=50.0, capacity=2)
+    started = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    # 2 jetons immédiats, puis 4 à 20 ms d'intervalle
+    assert time.monotonic() - started >= 0.07
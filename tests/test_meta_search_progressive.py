@@ -0,0 +1,143 @@
+"""Tests de la recherche multi-sources progressive (une livraison par source)."""
+
+from __future__ import annotations
+
+import time
+
+
+class _Bnf:
+    def search_by_isbn(self, isbn):
+        from libapp.services.bnf_service import BnfBook
+
+        return BnfBook("Germinal", None, ["Zola"], isbn, "Gallimard", "1885", None)
+
+
+class _SlowOpenLibrary:
+    def search_by_isbn(self, isbn):
+        time.sleep(0.3)
+        return None
+
+    def search_by_title(self, title):
+        return []
+
+
+class _Google:
+    def search_by_isbn(self, isbn):
+        raise RuntimeError("quota dépassé")
+
+
+def test_sources_are_streamed_as_they_answer(tmp_path):
+    """BnF arrive sans attendre la source lente ; une erreur de source donne une liste vide."""
+    from libapp.services.meta_search_service import (
+        MetaSearchService,
+        _results_from_json,
+        _results_to_json,
+    )
+    from libapp.services.metadata_cache import MetadataCache, isbn_key
+
+    cache = MetadataCache(
+        tmp_path / "cache.sqlite3", encode=_results_to_json, decode=_results_from_json
+    )
+    service = MetaSearchService(cache=cache)
+    service.services = {"bnf": _Bnf(), "google": _Google(), "openlibrary": _SlowOpenLibrary()}
+
+    started = time.perf_counter()
+    arrivals = []
+    for source_name, results in service.iter_search_by_source("9782070360420", "Germinal"):
+        arrivals.append((source_name, [r.title for r in results], time.perf_counter() - started))
+
+    assert {name: titles for name, titles, _ in arrivals} == {
+        "BnF": ["Germinal"],
+        "Google Books": [],
+        "OpenLibrary": [],
+    }
+    assert arrivals[-1][0] == "OpenLibrary"
+    assert arrivals[0][2] < 0.2  # BnF livré avant la fin de la source lente
+
+    # Google n'a pas répondu : rien en cache, la recherche suivante interroge les sources
+    assert cache.get(isbn_key("9782070360420")) is None
+    service.services["google"] = _SlowOpenLibrary()
+    sources = [name for name, _ in service.iter_search_by_source("9782070360420")]
+    assert sorted(sources) == ["BnF", "Google Books", "OpenLibrary"]
+
+    # Toutes les sources ont répondu : servie par le cache en une seule livraison
+    assert [name for name, _ in service.iter_search_by_source("9782070360420")] == ["cache"]
+
+
+class _StreamingStrategy:
+    """Stratégie factice livrant source par source ; note les tâches reçues."""
+
+    def __init__(self):
+        self.tasks = []
+
+    def iter_by_source(self, search_tasks):
+        self.tasks.extend((name, method) for name, _, method, _ in search_tasks)
+        for name, *_ in search_tasks:
+            yield name, [], None
+
+
+def test_progressive_search_streams_through_current_strategy(tmp_path):
+    """iter_search_by_source passe par la méthode publique de la stratégie courante."""
+    from libapp.services.meta_search_service import (
+        MetaSearchService,
+        _results_from_json,
+        _results_to_json,
+    )
+    from libapp.services.metadata_cache import MetadataCache
+
+    cache = MetadataCache(
+        tmp_path / "cache.sqlite3", encode=_results_to_json, decode=_results_from_json
+    )
+    strategy = _StreamingStrategy()
+    service = MetaSearchService(strategy=strategy, cache=cache)
+    service.services = {"bnf": _Bnf(), "openlibrary": _SlowOpenLibrary()}
+
+    sources = [name for name, _ in service.iter_search_by_source("9782070360420")]
+
+    assert sources == ["BnF", "OpenLibrary"]
+    assert strategy.tasks == [("BnF", "search_by_isbn"), ("OpenLibrary", "search_by_isbn")]
+
+
+class _Dialog:
+    def __init__(self):
+        self.sources = []
+        self.finished = False
+
+    def add_notices(self, notices):
+        pass
+
+    def set_source_done(self, source_name, count):
+        self.sources.append(source_name)
+
+    def set_search_finished(self):
+        self.finished = True
+
+
+def test_stale_worker_signals_do_not_reach_the_next_dialog(isolated_db):
+    """Les signaux d'une recherche annulée sont ignorés par le dialogue du livre suivant."""
+    from PySide6.QtWidgets import QApplication
+
+    from libapp.persistence.database import ensure_tables
+    from libapp.services.preferences import Preferences
+    from libapp.views.book_list import BookListView
+    from libapp.views.meta_search_worker import MetaSearchWorker
+
+    QApplication.instance() or QApplication([])
+    ensure_tables()
+    view = BookListView(None, Preferences())
+    stale = MetaSearchWorker(None, isbn="9782070360420")
+    current = MetaSearchWorker(None, isbn="9782253004233")
+    for worker in (stale, current):
+        worker.signals.results.connect(view._on_meta_results)
+        worker.signals.finished.connect(view._on_meta_finished)
+    stale.cancel()
+    view._meta_worker = current
+    view._meta_dialog = dialog = _Dialog()
+
+    stale.signals.results.emit("BnF", [])
+    stale.signals.finished.emit(0)
+    assert dialog.sources == [] and not dialog.finished
+
+    current.signals.results.emit("Google Books", [])
+    current.signals.finished.emit(0)
+    assert dialog.sources == ["Google Books"] and dialog.finished
@@ -0,0 +1,92 @@
+"""Tests du cache persistant des recherches bibliographiques."""
+
+from __future__ import annotations
+
+import time
+
+
+class _CountingStrategy:
+    """Stratégie factice qui compte les appels aux sources."""
+
+    def __init__(self, results_by_isbn):
+        self.results_by_isbn = results_by_isbn
+        self.calls = 0
+
+    def search_by_isbn(self, isbn, services):
+        from libapp.services.meta_search_service import SearchSourceInfo, UnifiedBookResult
+
+        self.calls += 1
+        return [
+            UnifiedBookResult(
+                title=title,
+                source=SearchSourceInfo(name="BnF", confidence=0.95, response_time=0.2),
+                authors=["Zola"],
+                isbn=isbn,
+                raw_data={"type": "BnfBook"},
+            )
+            for title in self.results_by_isbn.get(isbn, [])
+        ]
+
+
+def test_results_survive_restart_and_not_found_is_cached(tmp_path):
+    """Un ISBN déjà cherché (trouvé ou non) ne relance pas les sources après redémarrage."""
+    from libapp.services.meta_search_service import (
+        MetaSearchService,
+        _results_from_json,
+        _results_to_json,
+    )
+    from libapp.services.metadata_cache import MetadataCache
+
+    path = tmp_path / "cache.sqlite3"
+
+    def open_service(strategy):
+        cache = MetadataCache(path, encode=_results_to_json, decode=_results_from_json)
+        return MetaSearchService(strategy=strategy, cache=cache), cache
+
+    strategy = _CountingStrategy({"9782070360420": ["Germinal"]})
+    service, cache = open_service(strategy)
+    assert service.search_by_isbn("978-2-07-036042-0")[0].title == "Germinal"
+    assert service.search_by_isbn("0000000000") == []
+    cache.close()
+
+    # « Redémarrage » : nouvelle instance sur le même fichier
+    service, cache = open_service(strategy)
+    (result,) = service.search_by_isbn("9782070360420")
+    assert (result.title, result.source.name, result.score > 0) == ("Germinal", "BnF", True)
+    assert service.search_by_isbn("0000000000") == []
+    assert strategy.calls == 2
+
+    started = time.perf_counter()
+    service.search_by_isbn("9782070360420")
+    assert time.perf_counter() - started < 0.001
+
+    stats = service.get_cache_stats()
+    assert (stats["hits"], stats["negative_hits"], stats["memory_hits"]) == (3, 1, 1)
+    assert (stats["entries"], stats["negative_entries"]) == (2, 1)
+
+
+def test_ttl_per_source_and_lru_eviction(tmp_path):
+    """Les entrées expirent selon leur source et le plafond évince la moins récente."""
+    from libapp.services.metadata_cache import MetadataCache, title_author_key
+
+    cache = MetadataCache(
+        tmp_path / "cache.sqlite3",
+        source_ttls={"BnF": 60, "Google Books": -1},
+        negative_ttl=60,
+        max_entries=2,
+        memory_entries=0,
+    )
+    assert title_author_key(" Les  Misérables ", "HUGO") == "title:les miserables|hugo"
+
+    cache.set("a", [{"t": "A"}], sources=["BnF"])
+    cache.set("expired", [{"t": "B"}], sources=["BnF", "Google Books"])
+    assert cache.get("expired") is None
+
+    cache.set("b", [], sources=[])
+    cache.get("a")  # "a" devient la plus récemment utilisée
+    cache.set("c", [{"t": "C"}], sources=["BnF"])
+
+    assert cache.get("b") is None
+    assert cache.get("a") == [{"t": "A"}]
+    assert cache.get("c") == [{"t": "C"}]
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,56 @@
+"""Tests du stockage borné des métriques (histogrammes + journal JSONL)."""
+
+from __future__ import annotations
+
+import json
+
+
+def test_histogram_percentiles_are_close_to_exact_values():
+    """p50/p95/p99 de l'histogramme logarithmique restent à ~5 % des valeurs exactes."""
+    from libapp.services.metrics_service import LogHistogram
+
+    histogram = LogHistogram()
+    values = [float(v) for v in range(1, 1001)]  # 1..1000 ms
+    for value in values:
+        histogram.add(value)
+
+    for q, exact in ((0.50, 500.0), (0.95, 950.0), (0.99, 990.0)):
+        assert abs(histogram.percentile(q) - exact) / exact < 0.06
+    assert histogram.min == 1.0 and histogram.max == 1000.0
+
+
+def test_memory_stays_bounded_and_summary_reports_percentiles(monkeypatch, tmp_path):
+    """Les échantillons récents sont plafonnés ; le résumé couvre toutes les mesures."""
+    from libapp.services import metrics_service as ms
+
+    monkeypatch.setattr(ms, "_metrics_store", {})
+    monkeypatch.setattr(ms, "_metrics_log", ms.MetricsLog(tmp_path / "metrics.jsonl"))
+    for i in range(ms.RING_SIZE * 4):
+        ms.record_metric("checkout", duration=0.001 * (1 + i % 10))
+    ms.record_metric("checkout", duration=0.5, success=False, error="boom")
+
+    metrics = ms._metrics_store["checkout"]
+    assert len(metrics.recent) == ms.RING_SIZE
+    assert len(metrics.histogram._buckets) <= 40
+
+    summary = ms.get_metrics_summary()["checkout"]
+    assert summary["count"] == ms.RING_SIZE * 4 + 1
+    assert summary["success_count"] == ms.RING_SIZE * 4
+    assert summary["min_ms"] <= summary["p50_ms"] <= summary["p95_ms"] <= summary["p99_ms"]
+    assert summary["max_ms"] == 10.0
+
+
+def test_jsonl_log_is_append_only_and_rotates(tmp_path):
+    """Le journal ajoute une ligne par mesure et tourne au-delà de sa taille maximale."""
+    from libapp.services.metrics_service import MetricsLog
+
+    path = tmp_path / "metrics.jsonl"
+    log = MetricsLog(path, max_bytes=500, backups=2, flush_every=5)
+    for i in range(60):
+        log.append({"operation": "op", "duration_ms": float(i)})
+    log.flush()
+
+    files = sorted(p.name for p in tmp_path.iterdir())
+    assert files == ["metrics.jsonl", "metrics.jsonl.1", "metrics.jsonl.2"]
+    last = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert last[-1]["duration_ms"] == 59.0
@@ -0,0 +1,53 @@
+"""Tests du tri naturel à clés mises en cache (NaturalSortProxyModel)."""
+
+from __future__ import annotations
+
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def _proxy(values):
+    from PySide6.QtGui import QStandardItem, QStandardItemModel
+    from PySide6.QtWidgets import QApplication
+
+    from libapp.views.natural_sort_proxy import NaturalSortProxyModel
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    model = QStandardItemModel()
+    model.appendColumn([QStandardItem(v) if v is not None else QStandardItem() for v in values])
+    proxy = NaturalSortProxyModel()
+    proxy.setSourceModel(model)
+    return model, proxy
+
+
+def _column(proxy):
+    return [proxy.data(proxy.index(row, 0)) for row in range(proxy.rowCount())]
+
+
+def test_natural_order_and_sorted_rows():
+    """Nombres comparés numériquement, texte avant nombres, valeurs vides en tête."""
+    from PySide6.QtCore import Qt
+
+    model, proxy = _proxy(["A10", "a2", None, "A1", "B1", "10", "9"])
+
+    proxy.sort(0)
+    assert _column(proxy) == [None, "A1", "a2", "A10", "B1", "9", "10"]
+    assert proxy.sorted_rows(0) == [2, 3, 1, 0, 4, 6, 5]
+
+    proxy.sort(0, Qt.SortOrder.DescendingOrder)
+    assert _column(proxy) == ["10", "9", "B1", "A10", "a2", "A1", None]
+
+
+def test_cached_keys_are_invalidated_on_data_change():
+    """Une valeur modifiée est re-triée avec sa nouvelle clé (tri dynamique)."""
+    model, proxy = _proxy(["C3", "C1", "C2"])
+    proxy.sort(0)
+    assert _column(proxy) == ["C1", "C2", "C3"]
+
+    model.item(1, 0).setText("C9")  # "C1" devient "C9"
+    assert _column(proxy) == ["C2", "C3", "C9"]
+
+    model.appendRow([model.item(0, 0).clone()])
+    model.item(3, 0).setText("C0")
+    assert _column(proxy) == ["C0", "C2", "C3", "C9"]
@@ -0,0 +1,99 @@
+"""Tests des requêtes OpenLibrary groupées (bibkeys) et des éditions en parallèle."""
+
+from __future__ import annotations
+
+import time
+
+
+class _Response:
+    def __init__(self, data, status_code=200):
+        self._data = data
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        import requests
+
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Service Unavailable")
+
+    def json(self):
+        return self._data
+
+
+class _Transport:
+    """api/books : connaît un seul ISBN ; éditions : 0,2 s par work."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get(self, url, *, source, params=None, timeout=None, headers=None):
+        self.calls.append((url, dict(params or {})))
+        if url.endswith("/api/books"):
+            keys = params["bibkeys"].split(",")
+            known = {
+                "ISBN:9782070360420": {
+                    "title": "Germinal",
+                    "authors": [{"name": "Émile Zola"}],
+                    "publishers": [{"name": "Gallimard"}],
+                    "publish_date": "1978",
+                }
+            }
+            return _Response({key: known[key] for key in keys if key in known})
+        if url.endswith("/search.json"):
+            docs = [{"key": f"/works/OL{n}W", "title": f"Tome {n}"} for n in range(3)]
+            return _Response({"docs": docs})
+        time.sleep(0.2)
+        return _Response({"entries": [{"title": "Édition", "isbn_13": ["9782070360420"]}]})
+
+
+def test_isbns_are_resolved_with_bibkeys_batches():
+    """Un appel api/books par paquet ; les ISBN inconnus restent à None."""
+    from libapp.services.openlibrary_service import OpenLibraryService
+
+    transport = _Transport()
+    service = OpenLibraryService(transport=transport)
+
+    found = service.search_many_isbns(
+        ["9782070360420", "9782253004233", "9780000000002"], batch_size=2
+    )
+
+    assert found["9782070360420"].titre == "Germinal"
+    assert found["9782070360420"].editeur == "Gallimard"
+    assert found["9782253004233"] is None and found["9780000000002"] is None
+    assert len(transport.calls) == 2
+
+
+class _FailingTransport(_Transport):
+    """api/books répond 503 au deuxième paquet."""
+
+    def get(self, url, *, source, params=None, timeout=None, headers=None):
+        if url.endswith("/api/books") and self.calls:
+            self.calls.append((url, dict(params)))
+            return _Response({}, status_code=503)
+        return super().get(url, source=source, params=params)
+
+
+def test_failed_batch_is_not_reported_as_not_found():
+    """Un paquet en 503 lève une erreur au lieu de rendre ses ISBN « introuvables »."""
+    import pytest
+    import requests
+
+    from libapp.services.openlibrary_service import OpenLibraryService
+
+    service = OpenLibraryService(transport=_FailingTransport())
+
+    with pytest.raises(requests.HTTPError):
+        service.search_many_isbns(["9782070360420", "9782253004233", "9780000000002"], batch_size=2)
+
+
+def test_title_search_fetches_editions_concurrently():
+    """Les éditions des 3 works sont demandées en parallèle, ordre conservé."""
+    from libapp.services.openlibrary_service import OpenLibraryService
+
+    service = OpenLibraryService(transport=_Transport())
+
+    started = time.perf_counter()
+    books = service.search_by_title("Tome")
+
+    assert time.perf_counter() - started < 0.45
+    assert [book.isbn for book in books] == ["9782070360420"] * 3
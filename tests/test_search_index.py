@@ -0,0 +1,56 @@
+"""Tests de l'index plein texte FTS5 du catalogue."""
+
+from __future__ import annotations
+
+
+def test_fts_index_follows_inserts_updates_deletes(isolated_db):
+    """Les triggers maintiennent l'index synchronisé avec la table books."""
+    from libapp.persistence.database import ensure_tables, get_session
+    from libapp.persistence.models_sa import Book
+
+    ensure_tables()
+    from libapp.services.search_index import search_book_ids
+
+    with get_session() as s:
+        b1 = Book(title="Le Petit Prince", authors_text="Saint-Exupéry", isbn="9782070612758")
+        b2 = Book(title="Vol de nuit", authors_text="Saint-Exupéry", summary="Aéropostale")
+        b3 = Book(title="Candide", authors_text="Voltaire", mots_cles="conte;philosophie")
+        s.add_all([b1, b2, b3])
+        s.commit()
+        id1, id2, id3 = b1.id, b2.id, b3.id
+
+    # Préfixes, accents ignorés, plusieurs colonnes
+    assert set(search_book_ids("exupery")) == {id1, id2}
+    assert search_book_ids("aeropost") == [id2]
+    assert search_book_ids("philo") == [id3]
+    assert search_book_ids("978207") == [id1]
+    assert search_book_ids("petit exup") == [id1]
+    # Les opérateurs FTS5 saisis par l'utilisateur ne cassent pas la requête
+    assert search_book_ids('"prince" -(') == [id1]
+
+    with get_session() as s:
+        s.get(Book, id3).title = "Zadig"
+        s.delete(s.get(Book, id1))
+        s.commit()
+
+    assert search_book_ids("candide") == []
+    assert search_book_ids("zadig") == [id3]
+    assert search_book_ids("prince") == []
+
+
+def test_fts_ranking_prefers_title_matches(isolated_db):
+    """Un mot présent dans le titre passe avant un mot présent dans le résumé."""
+    from libapp.persistence.database import ensure_tables, get_session
+    from libapp.persistence.models_sa import Book
+
+    ensure_tables()
+    from libapp.services.search_index import search_book_ids
+
+    with get_session() as s:
+        in_summary = Book(title="Histoire", summary="Un voyage vers la lune")
+        in_title = Book(title="De la Terre à la Lune")
+        s.add_all([in_summary, in_title])
+        s.commit()
+        ids = (in_title.id, in_summary.id)
+
+    assert tuple(search_book_ids("lune")) == ids
@@ -0,0 +1,84 @@
+"""Tests du regroupement des recherches identiques simultanées."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class _SlowStrategy:
+    """Stratégie factice lente : compte les recherches réellement lancées."""
+
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def search_by_isbn(self, isbn, services):
+        from libapp.services.meta_search_service import SearchSourceInfo, UnifiedBookResult
+
+        with self._lock:
+            self.calls += 1
+        time.sleep(0.2)
+        source = SearchSourceInfo(name="BnF", confidence=0.95, response_time=0.2)
+        return [UnifiedBookResult(title="Germinal", source=source, isbn=isbn)]
+
+
+def test_concurrent_identical_lookups_share_one_search(tmp_path):
+    """4 appels simultanés du même ISBN (graphies différentes) : une seule recherche."""
+    from libapp.services.meta_search_service import (
+        MetaSearchService,
+        _results_from_json,
+        _results_to_json,
+    )
+    from libapp.services.metadata_cache import MetadataCache
+
+    cache = MetadataCache(
+        tmp_path / "cache.sqlite3", encode=_results_to_json, decode=_results_from_json
+    )
+    strategy = _SlowStrategy()
+    services = [MetaSearchService(strategy=strategy, cache=cache) for _ in range(2)]
+    queries = ["978-2-07-036042-0", "9782070360420", "978 2070360420", "9782070360420"]
+
+    with ThreadPoolExecutor(4) as pool:
+        results = list(
+            pool.map(lambda i: services[i % 2].search_by_isbn(queries[i]), range(len(queries)))
+        )
+
+    assert strategy.calls == 1
+    assert [r[0].title for r in results] == ["Germinal"] * 4
+    # Chaque appelant reçoit sa propre liste
+    assert len({id(r) for r in results}) == 4
+    assert services[0].get_cache_stats()["coalesced"] >= 1
+
+    # Ensuite, le cache sert l'ISBN sans nouvelle recherche
+    services[1].search_by_isbn("9782070360420")
+    assert strategy.calls == 1
+
+
+def test_failure_is_shared_and_key_released():
+    """Une exception est transmise aux appelants regroupés ; la clé est ensuite libérée."""
+    from libapp.services.metadata_cache import SingleFlight
+
+    flights = SingleFlight()
+    started = threading.Event()
+
+    def failing():
+        started.set()
+        time.sleep(0.1)
+        raise RuntimeError("BnF indisponible")
+
+    def call(fn):
+        try:
+            return flights.do("isbn:1", fn)
+        except RuntimeError as e:
+            return str(e)
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(call, failing)
+        started.wait()
+        follower = pool.submit(call, lambda: ["jamais appelé"])
+        assert leader.result() == follower.result() == "BnF indisponible"
+
+    assert flights.in_flight("isbn:1") is None
+    assert flights.do("isbn:1", lambda: ["ok"]) == (["ok"], False)
@@ -0,0 +1,86 @@
+"""Tests des disjoncteurs par source et des timeouts adaptatifs."""
+
+from __future__ import annotations
+
+import time
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_circuit_opens_then_half_opens_and_closes():
+    """3 échecs ouvrent le disjoncteur ; après refroidissement, un seul test passe."""
+    from libapp.services.source_health import CircuitState, LatencyTracker, SourceHealth
+
+    clock = _Clock()
+    health = SourceHealth(LatencyTracker(), cooldown_s=30.0, clock=clock)
+    for _ in range(3):
+        assert health.allow("OpenLibrary")
+        health.record_failure("OpenLibrary")
+
+    assert health.state("OpenLibrary") is CircuitState.OPEN
+    assert not health.allow("OpenLibrary")
+
+    clock.now = 31.0
+    assert health.allow("OpenLibrary")  # requête de test
+    assert not health.allow("OpenLibrary")  # une seule à la fois
+    assert health.state("OpenLibrary") is CircuitState.HALF_OPEN
+
+    health.record_success("OpenLibrary", "OpenLibrary:search_by_isbn", 0.2)
+    assert health.state("OpenLibrary") is CircuitState.CLOSED
+    assert health.allow("OpenLibrary")
+
+
+def test_timeout_follows_observed_latency():
+    """Sans historique : timeout par défaut ; ensuite p99 × marge, borné."""
+    from libapp.services.source_health import LatencyTracker, SourceHealth
+
+    health = SourceHealth(LatencyTracker(), timeout_factor=1.5, max_timeout=10.0)
+    assert health.timeout_for("BnF:search_by_isbn", 3.0) == 3.0
+
+    for _ in range(20):
+        health.record_success("BnF", "BnF:search_by_isbn", 0.4)
+    assert abs(health.timeout_for("BnF:search_by_isbn", 3.0) - 0.6) < 1e-9
+
+
+class _Bnf:
+    def search_by_isbn(self, isbn):
+        from libapp.services.bnf_service import BnfBook
+
+        return BnfBook("Germinal", None, ["Zola"], isbn, "Gallimard", "1885", None)
+
+
+class _FailingOpenLibrary:
+    def __init__(self):
+        self.calls = 0
+
+    def search_by_isbn(self, isbn):
+        self.calls += 1
+        raise ConnectionError("OpenLibrary indisponible")
+
+
+def test_open_circuit_source_is_skipped_by_strategy():
+    """Après des échecs répétés, OpenLibrary n'est plus interrogée."""
+    from libapp.services.meta_search_service import CompletionPolicy, ParallelSearchStrategy
+    from libapp.services.source_health import LatencyTracker, SourceHealth
+
+    health = SourceHealth(LatencyTracker())
+    strategy = ParallelSearchStrategy(
+        timeout=2.0, policy=CompletionPolicy.wait_all(), health=health
+    )
+    openlibrary = _FailingOpenLibrary()
+    services = {"bnf": _Bnf(), "openlibrary": openlibrary}
+
+    for i in range(5):
+        started = time.perf_counter()
+        results = strategy.search_by_isbn(f"978207036010{i}", services)
+        assert [r.source.name for r in results] == ["BnF"]
+        assert time.perf_counter() - started < 1.0
+
+    assert openlibrary.calls == 3
+    assert health.snapshot()["OpenLibrary"]["state"] == "open"
@@ -0,0 +1,99 @@
+"""Tests de l'instrumentation SQL (agrégats, sites d'appel, requêtes lentes)."""
+
+from __future__ import annotations
+
+import json
+
+from sqlalchemy import create_engine, text
+
+
+def _run_queries(engine, n):
+    with engine.connect() as conn:
+        conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)"))
+        for i in range(n):
+            conn.execute(text("SELECT name FROM t WHERE id = :id"), {"id": i})
+        conn.execute(text("SELECT name FROM t WHERE id IN (1, 2, 3) AND name = 'x'"))
+
+
+def test_normalize_sql_strips_literals_and_in_lists():
+    """Littéraux, nombres et listes IN sont remplacés ; les blancs compactés."""
+    from libapp.persistence.sql_profiler import normalize_sql
+
+    sql = normalize_sql("SELECT *\n  FROM t WHERE id IN (?, ?, ?) AND name = 'O''Hara' LIMIT 50")
+    assert sql == "SELECT * FROM t WHERE id IN (?...) AND name = ? LIMIT ?"
+
+
+def test_repeated_select_from_one_call_site_is_flagged(tmp_path):
+    """Une même requête répétée depuis une même ligne ressort comme suspicion N+1."""
+    from libapp.persistence.sql_profiler import SqlProfiler
+
+    engine = create_engine("sqlite://")
+    profiler = SqlProfiler(slow_ms=1e9, slow_log_path=tmp_path / "slow.jsonl")
+    profiler.install(engine)
+
+    _run_queries(engine, 60)
+
+    top = profiler.top_statements(1, by="count")[0]
+    assert top["sql"] == "SELECT name FROM t WHERE id = ?" and top["count"] == 60
+    suspects = profiler.suspected_n_plus_one(min_count=50)
+    assert len(suspects) == 1
+    assert "._run_queries:" in suspects[0]["call_site"]
+    assert not (tmp_path / "slow.jsonl").exists()
+
+
+def test_slow_queries_are_logged_with_query_plan(tmp_path):
+    """Au-delà du seuil, la requête est journalisée avec son EXPLAIN QUERY PLAN."""
+    from libapp.persistence.sql_profiler import SqlProfiler
+
+    engine = create_engine("sqlite://")
+    profiler = SqlProfiler(slow_ms=0.0, slow_log_path=tmp_path / "slow.jsonl", feed_metrics=False)
+    profiler.install(engine)
+
+    _run_queries(engine, 1)
+
+    entries = [json.loads(line) for line in (tmp_path / "slow.jsonl").read_text().splitlines()]
+    selects = [e for e in entries if e["sql"].startswith("SELECT name FROM t WHERE id = ?")]
+    assert selects and any("PRIMARY KEY" in step for step in selects[0]["plan"])
+    assert profiler.snapshot()["slow"] == len(entries)
+
+
+def test_slow_log_omits_parameters_and_rotates(tmp_path, monkeypatch):
+    """Le journal des requêtes lentes ne contient pas les valeurs liées et tourne par taille."""
+    from libapp.persistence import sql_profiler
+
+    monkeypatch.setattr(sql_profiler, "SLOW_LOG_MAX_BYTES", 512)
+    path = tmp_path / "slow.jsonl"
+    engine = create_engine("sqlite://")
+    profiler = sql_profiler.SqlProfiler(slow_ms=0.0, slow_log_path=path, feed_metrics=False)
+    profiler.install(engine)
+
+    with engine.connect() as conn:
+        conn.execute(text("CREATE TABLE m (id INTEGER PRIMARY KEY, email TEXT)"))
+        for i in range(20):
+            conn.execute(text("SELECT id FROM m WHERE email = :e"), {"e": f"membre{i}@example.org"})
+
+    logs = [path, *sorted(tmp_path.glob("slow.jsonl.*"))]
+    assert len(logs) == 1 + sql_profiler.SLOW_LOG_BACKUPS
+    content = "".join(log.read_text() for log in logs)
+    assert "example.org" not in content
+    assert all("parameters" not in json.loads(line) for line in content.splitlines())
+
+
+def test_failed_statement_does_not_leak_start_time(tmp_path):
+    """Une instruction en erreur ne laisse pas son heure de départ sur la connexion."""
+    import pytest
+    from sqlalchemy.exc import OperationalError
+
+    from libapp.persistence.sql_profiler import SqlProfiler
+
+    engine = create_engine("sqlite://")
+    profiler = SqlProfiler(slow_ms=1e9, slow_log_path=tmp_path / "slow.jsonl", feed_metrics=False)
+    profiler.install(engine)
+
+    with engine.connect() as conn:
+        for _ in range(3):
+            with pytest.raises(OperationalError):
+                conn.execute(text("SELECT * FROM table_absente"))
+        conn.execute(text("SELECT 1"))
+        assert conn.info.get("sql_profiler_start") == []
+    assert profiler.top_statements(1)[0]["sql"] == "SELECT ?"
@@ -0,0 +1,45 @@
+"""Tests du profil de performance SQLite appliqué par le moteur."""
+
+from __future__ import annotations
+
+
+def _pragma(session, name):
+    from sqlalchemy import text
+
+    return session.execute(text(f"PRAGMA {name}")).scalar_one()
+
+
+def test_performance_profile_applied_on_connect(isolated_db):
+    """Le profil par défaut active WAL, synchronous=NORMAL et le cache configuré."""
+    from libapp.persistence.database import configure_sqlite_profile, get_session
+
+    configure_sqlite_profile("performance", cache_size_mb=32, mmap_size_mb=16)
+
+    with get_session() as s:
+        assert _pragma(s, "journal_mode") == "wal"
+        assert _pragma(s, "synchronous") == 1  # NORMAL
+        assert _pragma(s, "temp_store") == 2  # MEMORY
+        assert _pragma(s, "cache_size") == -32 * 1024
+        assert _pragma(s, "busy_timeout") == 5000
+
+
+def test_switch_to_standard_profile(isolated_db):
+    """Changer de profil recycle le pool : les nouvelles connexions suivent le profil."""
+    from libapp.persistence.database import (
+        configure_sqlite_profile,
+        current_sqlite_profile,
+        get_session,
+    )
+
+    configure_sqlite_profile("performance")
+    with get_session() as s:
+        assert _pragma(s, "journal_mode") == "wal"
+
+    configure_sqlite_profile("standard")
+    assert current_sqlite_profile().name == "standard"
+    with get_session() as s:
+        assert _pragma(s, "journal_mode") == "delete"
+        assert _pragma(s, "synchronous") == 2  # FULL
+
+    # Nom inconnu : retour au profil par défaut
+    assert configure_sqlite_profile("inconnu").name == "performance"
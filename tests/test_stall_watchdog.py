@@ -0,0 +1,51 @@
+"""Tests de la détection des blocages de la boucle d'événements."""
+
+from __future__ import annotations
+
+import time
+
+
+def _blocking_call(seconds):
+    time.sleep(seconds)
+
+
+def test_stall_captures_main_thread_stack():
+    """Un thread principal bloqué est détecté et sa pile capturée pendant le blocage."""
+    from libapp.services.stall_watchdog import StallWatchdog, format_report
+
+    watchdog = StallWatchdog(threshold_ms=100, heartbeat_ms=20, record=False)
+    watchdog.beat()
+    watchdog.start()
+    try:
+        _blocking_call(0.4)
+        watchdog.beat()
+    finally:
+        watchdog.stop()
+
+    [report] = watchdog.reports()
+    assert not report.ongoing
+    assert 0.3 <= report.duration_s < 1.0
+    assert 1 <= len(report.stacks) <= 5
+    assert any("_blocking_call" in line for line in report.stacks[0])
+    assert "_blocking_call" in format_report(report)
+
+
+def test_short_stall_is_recorded_in_metrics(monkeypatch, tmp_path):
+    """Un retard du battement au-delà du seuil est mesuré même sans pile capturée."""
+    from libapp.services import metrics_service as ms
+    from libapp.services.stall_watchdog import StallWatchdog
+
+    monkeypatch.setattr(ms, "_metrics_store", {})
+    monkeypatch.setattr(ms, "_metrics_log", ms.MetricsLog(tmp_path / "metrics.jsonl"))
+    now = [0.0]
+    watchdog = StallWatchdog(threshold_ms=200, heartbeat_ms=50, clock=lambda: now[0])
+
+    for t in (0.0, 0.05, 0.10):  # Battements réguliers : rien à signaler
+        now[0] = t
+        watchdog.beat()
+    now[0] = 0.45  # 300 ms de retard
+    watchdog.beat()
+
+    [report] = watchdog.reports()
+    assert abs(report.duration_s - 0.30) < 1e-9 and report.stacks == []
+    assert ms.get_metrics_summary()["ui_stall"]["count"] == 1